@@ -1,9 +1,20 @@
-from flask import Flask, request, jsonify
+import json
+from flask import Flask, Response, request, jsonify
 from scroll_wrapped_codex.scribe_codex import ScribeCodex
+from scroll_wrapped_codex.lashon_compiler import compile_lashon_iter
 
 app = Flask(__name__)
 scribe = ScribeCodex()
 
+def _concurrency(data):
+    """Return the requested concurrency, or None for the scribe default."""
+    concurrency = data.get("concurrency")
+    if concurrency is None:
+        return None
+    if not isinstance(concurrency, int) or concurrency < 1:
+        raise ValueError("concurrency must be a positive integer")
+    return concurrency
+
 @app.route("/execute", methods=["POST"])
 def execute():
     data = request.json
@@ -11,5 +22,54 @@ def execute():
     result = scribe.execute(command)
     return jsonify({"result": result})
 
+@app.route("/execute_batch", methods=["POST"])
+def execute_batch():
+    """Execute many scroll commands concurrently; results keep the input order."""
+    data = request.get_json(silent=True) or {}
+    commands = data.get("scrolls")
+    if not isinstance(commands, list) or not all(isinstance(c, str) for c in commands):
+        return jsonify({"error": "🔥ERROR: 'scrolls' must be a list of strings"}), 400
+    try:
+        concurrency = _concurrency(data)
+    except ValueError as e:
+        return jsonify({"error": f"🔥ERROR: {e}"}), 400
+
+    results = scribe.execute_many(commands, concurrency)
+    return jsonify({"results": results})
+
+@app.route("/execute_stream", methods=["POST"])
+def execute_stream():
+    """
+    Compile a whole scroll and stream one NDJSON object per line as it finishes.
+
+    Each line is {"index", "prompt", "result"}; lines arrive in completion
+    order, and a final {"done": true, "count": n} closes the stream.
+    """
+    data = request.get_json(silent=True) or {}
+    scroll = data.get("scroll")
+    if not isinstance(scroll, str):
+        return jsonify({"error": "🔥ERROR: 'scroll' must be a string"}), 400
+    try:
+        concurrency = _concurrency(data)
+    except ValueError as e:
+        return jsonify({"error": f"🔥ERROR: {e}"}), 400
+
+    def generate():
+        prompts = []
+
+        def compiled():
+            for prompt in compile_lashon_iter(scroll):
+                prompts.append(prompt)
+                yield prompt
+
+        count = 0
+        for index, result in scribe.execute_iter(compiled(), concurrency):
+            count += 1
+            yield json.dumps({"index": index, "prompt": prompts[index], "result": result},
+                             ensure_ascii=False) + "\n"
+        yield json.dumps({"done": True, "count": count}) + "\n"
+
+    return Response(generate(), mimetype="application/x-ndjson")
+
 if __name__ == "__main__":
-    app.run() 
\ No newline at end of file
+    app.run()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+Measures entry-point startup overhead for cli.py and run_scroll_file.py
+and fails when it regresses past a budget.
+
+Overhead is the median wall time of each entry point minus the median
+wall time of a bare `python -c pass`, so the budget tracks our imports
+and setup rather than the interpreter itself.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--runs 15] [--budget-ms 40]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Budgets in milliseconds of overhead above a bare interpreter start
+DEFAULT_BUDGETS_MS = {
+    "scrollcodex": 40.0,
+    "scrollfile": 80.0,
+}
+
+def time_command(cmd: list, runs: int, cwd: str, env: dict) -> float:
+    """Return the median wall time of a command in milliseconds."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=cwd, env=env, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+def run_benchmark(runs: int, budgets: dict) -> dict:
+    """
+    Time each entry point and compare its overhead with the budget.
+
+    Returns:
+        dict: Per-entry-point timings, budget and pass/fail status
+    """
+    with tempfile.TemporaryDirectory() as workdir:
+        # Run from an empty directory with a private cache so nothing lands in the repo
+        env = dict(os.environ)
+        env["PYTHONPATH"] = str(REPO_ROOT) + os.pathsep + env.get("PYTHONPATH", "")
+        env["SCROLL_CACHE_DIR"] = os.path.join(workdir, "cache")
+        env.pop("SCROLL_CODEX_URL", None)
+
+        scroll_file = os.path.join(workdir, "bench.scroll")
+        with open(scroll_file, "w", encoding="utf-8") as f:
+            f.write("Anoint: StartupBench\nBuild: Engine\nSeal: With ScrollSeal 3\n")
+
+        commands = {
+            "scrollcodex": [sys.executable, str(REPO_ROOT / "cli.py"), "Anoint: StartupBench"],
+            "scrollfile": [sys.executable, str(REPO_ROOT / "run_scroll_file.py"), scroll_file],
+        }
+
+        # Warm the OS file cache and the compiled-scroll cache before timing
+        for cmd in commands.values():
+            subprocess.run(cmd, cwd=workdir, env=env, stdout=subprocess.DEVNULL,
+                           stderr=subprocess.DEVNULL, check=True)
+
+        baseline = time_command([sys.executable, "-c", "pass"], runs, workdir, env)
+
+        results = {"baseline_ms": round(baseline, 2), "entry_points": {}}
+        for name, cmd in commands.items():
+            total = time_command(cmd, runs, workdir, env)
+            overhead = total - baseline
+            results["entry_points"][name] = {
+                "total_ms": round(total, 2),
+                "overhead_ms": round(overhead, 2),
+                "budget_ms": budgets[name],
+                "passed": overhead <= budgets[name],
+            }
+
+    results["passed"] = all(entry["passed"] for entry in results["entry_points"].values())
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Entry-point startup benchmark")
+    parser.add_argument("--runs", type=int, default=15, help="timed runs per command")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="override every entry point's overhead budget")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    budgets = dict(DEFAULT_BUDGETS_MS)
+    if args.budget_ms is not None:
+        budgets = {name: args.budget_ms for name in budgets}
+
+    results = run_benchmark(args.runs, budgets)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"🔥 Interpreter baseline: {results['baseline_ms']:.1f} ms")
+        for name, entry in results["entry_points"].items():
+            status = "✅" if entry["passed"] else "❌"
+            print(f"  {status} {name}: {entry['total_ms']:.1f} ms total, "
+                  f"{entry['overhead_ms']:.1f} ms overhead (budget {entry['budget_ms']:.0f} ms)")
+
+    sys.exit(0 if results["passed"] else 1)
+
+if __name__ == "__main__":
+    main()
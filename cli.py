@@ -1,15 +1,50 @@
 import sys
-from scroll_wrapped_codex.scribe_codex import ScribeCodex
 
 def main():
     if len(sys.argv) < 2:
         print("Usage: python cli.py \"Anoint: Your command here\"")
+        print("       python cli.py --client \"Anoint: Your command here\"")
+        print("       python cli.py --serve | --cache-stats | --clear-cache")
         sys.exit(1)
 
     command = sys.argv[1]
+
+    if command == "--serve":
+        from scroll_wrapped_codex.scroll_daemon import serve
+        serve()
+        return
+
+    if command == "--client":
+        if len(sys.argv) < 3:
+            print("Usage: python cli.py --client \"Anoint: Your command here\"")
+            sys.exit(1)
+        command = sys.argv[2]
+
+        # Thin client: hand the command to a warm daemon, falling back to in-process execution
+        from scroll_wrapped_codex.scroll_daemon import send_request
+        response = send_request({"op": "execute", "command": command})
+        if response is not None:
+            if not response.get("ok"):
+                print(response.get("error", "Scroll daemon error"))
+                sys.exit(1)
+            print("\n".join(response["output"]))
+            return
+
+    if command in ("--cache-stats", "--clear-cache"):
+        import json
+        from scroll_wrapped_codex.scroll_cache import get_default_cache
+        cache = get_default_cache()
+        if command == "--clear-cache":
+            print(f"Removed {cache.clear()} cached scroll(s)")
+        else:
+            # Hit/miss counters only live for one process, so a fresh CLI reports usage only
+            print(json.dumps(cache.usage(), indent=2))
+        return
+
+    from scroll_wrapped_codex.scribe_codex import ScribeCodex
     scribe = ScribeCodex()
     result = scribe.execute(command)
     print(result)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -6,9 +6,17 @@ Parser and dispatcher for Hebrew-letter scroll commands
 
 import json
 import os
+import hashlib
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
+from scroll_wrapped_codex.scroll_cache import get_default_cache
+from scroll_wrapped_codex.scroll_index import LineIndex
+from scroll_wrapped_codex.scroll_checkpoint import ExecutionCheckpoint
+
+# Bump whenever parse_hebrew_command output changes
+ALPHA_PARSER_VERSION = "1"
+
 class ScrollAlphaEngine:
     """Sacred engine for parsing and executing Hebrew-letter scroll commands"""
     
@@ -71,10 +79,40 @@ class ScrollAlphaEngine:
         required_level = self.commands[hebrew_letter].get('flame_level', 1)
         return self.flame_level >= required_level
     
+    def parser_version(self) -> str:
+        """Parser version including a fingerprint of the loaded command table"""
+        table = json.dumps(self.commands, sort_keys=True, ensure_ascii=False)
+        fingerprint = hashlib.sha256(table.encode('utf-8')).hexdigest()[:16]
+        return f"{ALPHA_PARSER_VERSION}-{fingerprint}"
+    
+    def parse_scroll_content(self, content: str) -> List[List]:
+        """
+        Parse every command line of a scroll
+        
+        Returns:
+            List of [hebrew_letter, scroll_verb, arguments] for each
+            non-empty, non-comment line
+        """
+        parsed = []
+        for line in content.splitlines():
+            line = line.strip()
+            if line and not line.startswith('#'):
+                parsed.append(list(self.parse_hebrew_command(line)))
+        return parsed
+    
+    def parse_scroll_content_cached(self, content: str, cache=None) -> List[List]:
+        """Parse a scroll, reusing cached output when content and command table are unchanged"""
+        cache = cache or get_default_cache()
+        return cache.get_or_compute(content, "lashon_alpha", self.parser_version(), self.parse_scroll_content)
+    
     def execute_hebrew_command(self, line: str) -> str:
         """Execute a Hebrew-letter scroll command"""
         hebrew_letter, scroll_verb, arguments = self.parse_hebrew_command(line)
-        
+        return self.execute_parsed_command(hebrew_letter, scroll_verb, arguments)
+    
+    def execute_parsed_command(self, hebrew_letter: Optional[str], scroll_verb: Optional[str],
+                               arguments: List[str]) -> str:
+        """Execute a command already split by parse_hebrew_command"""
         if not hebrew_letter:
             return f"🔥 ERROR: Invalid Hebrew scroll command format"
         
@@ -157,25 +195,67 @@ class ScrollAlphaEngine:
 class HebrewScrollParser:
     """Parser for Hebrew-letter scroll files"""
     
-    def __init__(self, engine: ScrollAlphaEngine):
+    def __init__(self, engine: ScrollAlphaEngine, cache=None, use_cache: bool = True):
         self.engine = engine
+        self.cache = cache
+        self.use_cache = use_cache
     
-    def parse_scroll_file(self, file_path: str) -> List[str]:
-        """Parse a scroll file and return execution results"""
+    def parse_scroll_file(self, file_path: str, checkpoint: str = None, resume: bool = False) -> List[str]:
+        """
+        Parse a scroll file and return execution results
+        
+        With a checkpoint path (or resume=True, which defaults it to
+        "<file_path>.checkpoint") results are recorded after every command,
+        and resume=True continues after the last command an interrupted run
+        completed, seeking there through a memory-mapped line index.
+        """
+        if checkpoint or resume:
+            return self._parse_scroll_file_checkpointed(file_path, checkpoint or f"{file_path}.checkpoint", resume)
+        
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+                content = f.read()
+            
+            if self.use_cache:
+                parsed = self.engine.parse_scroll_content_cached(content, self.cache)
+            else:
+                parsed = self.engine.parse_scroll_content(content)
             
             results = []
-            for line in lines:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    result = self.engine.execute_hebrew_command(line)
+            for hebrew_letter, scroll_verb, arguments in parsed:
+                result = self.engine.execute_parsed_command(hebrew_letter, scroll_verb, arguments)
+                results.append(result)
+            
+            return results
+        except Exception as e:
+            return [f"🔥 ERROR parsing scroll file: {str(e)}"]
+    
+    def _parse_scroll_file_checkpointed(self, file_path: str, checkpoint: str, resume: bool) -> List[str]:
+        """Execute a scroll file line by line, checkpointing each completed command"""
+        tracker = None
+        try:
+            with LineIndex(file_path) as index:
+                tracker = ExecutionCheckpoint(checkpoint, index.sha256())
+                done = tracker.completed() if resume else []
+                tracker.start(done)
+                
+                results = [record["result"] for record in done]
+                start_line = done[-1]["line"] + 1 if done else 1
+                for line_num, line in index.iter_lines(start_line):
+                    line = line.strip()
+                    if not line or line.startswith('#'):
+                        continue
+                    result = self.engine.execute_parsed_command(*self.engine.parse_hebrew_command(line))
+                    tracker.record(line_num, result, not result.startswith("🔥 ERROR"))
                     results.append(result)
             
+            tracker.finish()
             return results
         except Exception as e:
             return [f"🔥 ERROR parsing scroll file: {str(e)}"]
+        finally:
+            if tracker:
+                tracker.close()
     
     def validate_scroll_file(self, file_path: str) -> List[str]:
         """Validate a scroll file for errors"""
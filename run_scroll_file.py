@@ -1,27 +1,220 @@
 import sys
-from scroll_wrapped_codex.scribe_codex import ScribeCodex
-from scroll_wrapped_codex.lashon_compiler import compile_lashon
+import os
+import time
+import argparse
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python run_scroll_file.py <filename.scroll>")
+    parser = argparse.ArgumentParser(
+        prog="scrollfile",
+        usage="python run_scroll_file.py [--stream] [--no-cache] [--client] <filename.scroll>\n"
+              "       python run_scroll_file.py [--jobs N] <file-or-glob> [<file-or-glob> ...]\n"
+              "       python run_scroll_file.py --serve",
+    )
+    parser.add_argument("filenames", nargs="*")
+    parser.add_argument("--stream", action="store_true",
+                        help="compile and execute line by line without loading the whole file")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="always recompile instead of reusing the compiled-scroll cache")
+    parser.add_argument("--serve", action="store_true",
+                        help="run the persistent scroll daemon on a Unix socket")
+    parser.add_argument("--client", action="store_true",
+                        help="run the file through a warm scroll daemon when one is available")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="number of worker processes when running several files")
+    args = parser.parse_args()
+
+    if args.serve:
+        from scroll_wrapped_codex.scroll_daemon import serve
+        serve()
+        return
+
+    filenames = expand_filenames(args.filenames)
+    if not filenames:
+        parser.print_usage()
         sys.exit(1)
 
-    filename = sys.argv[1]
+    if len(filenames) > 1 or args.jobs > 1:
+        if args.client:
+            print("--client accepts a single file")
+            sys.exit(1)
+        summary = run_many_files(filenames, args.jobs, args.no_cache, args.stream)
+        print_summary(summary)
+        if summary["failed"]:
+            sys.exit(1)
+        return
+
+    filename = filenames[0]
+
+    if args.client and run_client(filename, args.no_cache):
+        return
+
+    if args.stream:
+        run_streaming(filename)
+        return
+
+    from scroll_wrapped_codex.scribe_codex import ScribeCodex
+    from scroll_wrapped_codex.lashon_compiler import compile_lashon
+    from scroll_wrapped_codex.scroll_cache import compile_lashon_cached
 
     try:
         with open(filename, "r") as f:
-            lines = [line.strip() for line in f if line.strip()]
+            scroll_text = f.read()
     except FileNotFoundError:
         print(f"File not found: {filename}")
         sys.exit(1)
 
-    compiled = compile_lashon(lines)
+    if args.no_cache:
+        compiled = compile_lashon(scroll_text)
+    else:
+        compiled = compile_lashon_cached(scroll_text)
     scribe = ScribeCodex()
 
-    for line in compiled:
-        result = scribe.execute(line)
+    for result in scribe.execute_many(compiled):
         print(result)
 
+def expand_filenames(patterns):
+    """Expand glob patterns (including **), keeping literal names that match nothing."""
+    filenames = []
+    for pattern in patterns:
+        if any(char in pattern for char in "*?["):
+            import glob
+            matches = sorted(glob.glob(pattern, recursive=True))
+            filenames.extend(matches or [pattern])
+        else:
+            filenames.append(pattern)
+    return filenames
+
+_worker_scribe = None
+
+def execute_file(filename, no_cache=False, stream=False):
+    """
+    Compile and execute one scroll file, collecting its output.
+
+    Runs in pool workers, which keep one ScribeCodex per process.
+
+    Returns:
+        dict: filename, output lines, exit_code and elapsed seconds
+    """
+    global _worker_scribe
+    from scroll_wrapped_codex.scribe_codex import ScribeCodex
+    from scroll_wrapped_codex.lashon_compiler import compile_lashon, compile_lashon_iter
+    from scroll_wrapped_codex.scroll_cache import compile_lashon_cached
+
+    if _worker_scribe is None:
+        _worker_scribe = ScribeCodex()
+
+    start = time.perf_counter()
+    try:
+        with open(filename, "r") as f:
+            if stream:
+                output = [_worker_scribe.execute(line) for line in compile_lashon_iter(f)]
+            else:
+                scroll_text = f.read()
+                compiled = compile_lashon(scroll_text) if no_cache else compile_lashon_cached(scroll_text)
+                output = _worker_scribe.execute_many(compiled)
+        exit_code = 0
+    except FileNotFoundError:
+        output = [f"File not found: {filename}"]
+        exit_code = 1
+    except (OSError, UnicodeDecodeError) as e:
+        # Directories matched by globs, unreadable or non-UTF-8 files fail only this file
+        output = [f"Could not read {filename}: {e}"]
+        exit_code = 1
+    except Exception as e:
+        output = [f"Error executing {filename}: {e}"]
+        exit_code = 1
+
+    return {
+        "filename": filename,
+        "output": output,
+        "exit_code": exit_code,
+        "elapsed": time.perf_counter() - start,
+    }
+
+def run_many_files(filenames, jobs=1, no_cache=False, stream=False):
+    """
+    Execute several scroll files, printing each file's output as one contiguous block.
+
+    Blocks are printed in input order as soon as every earlier file has
+    finished, while up to `jobs` files execute in parallel processes.
+
+    Returns:
+        dict: Summary with per-file timing, totals and failure count
+    """
+    start = time.perf_counter()
+    files = []
+
+    def emit(result):
+        print(f"📜 {result['filename']}")
+        for line in result["output"]:
+            print(line)
+        sys.stdout.flush()
+        files.append({
+            "filename": result["filename"],
+            "exit_code": result["exit_code"],
+            "elapsed": result["elapsed"],
+        })
+
+    if jobs <= 1:
+        for filename in filenames:
+            emit(execute_file(filename, no_cache, stream))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        from functools import partial
+
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            # map() yields in submission order, so output stays ordered
+            worker = partial(execute_file, no_cache=no_cache, stream=stream)
+            for result in pool.map(worker, filenames, chunksize=max(1, len(filenames) // (jobs * 8))):
+                emit(result)
+
+    return {
+        "files": files,
+        "total": len(files),
+        "failed": sum(1 for entry in files if entry["exit_code"]),
+        "elapsed": time.perf_counter() - start,
+    }
+
+def print_summary(summary):
+    """Write the per-file timing summary to stderr, keeping stdout for scroll output."""
+    err = sys.stderr
+    print(f"🔥 Executed {summary['total']} scroll file(s) in {summary['elapsed']:.2f}s "
+          f"({summary['failed']} failed)", file=err)
+    for entry in summary["files"]:
+        status = "✅" if entry["exit_code"] == 0 else "❌"
+        print(f"  {status} {entry['filename']}: {entry['elapsed'] * 1000:.1f} ms", file=err)
+
+def run_client(filename, no_cache=False):
+    """Run the file on a warm daemon; returns False when no daemon is reachable."""
+    from scroll_wrapped_codex.scroll_daemon import send_request
+
+    response = send_request({"op": "run_file", "path": os.path.abspath(filename), "no_cache": no_cache})
+    if response is None:
+        return False
+
+    if not response.get("ok"):
+        print(response.get("error", "Scroll daemon error"))
+        sys.exit(1)
+    for line in response["output"]:
+        print(line)
+    if response.get("exit_code"):
+        sys.exit(response["exit_code"])
+    return True
+
+def run_streaming(filename):
+    """Pipe compiled prompts straight into execution as the file is read."""
+    from scroll_wrapped_codex.scribe_codex import ScribeCodex
+    from scroll_wrapped_codex.lashon_compiler import compile_lashon_iter
+
+    scribe = ScribeCodex()
+
+    try:
+        with open(filename, "r") as f:
+            for line in compile_lashon_iter(f):
+                print(scribe.execute(line))
+    except FileNotFoundError:
+        print(f"File not found: {filename}")
+        sys.exit(1)
+
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
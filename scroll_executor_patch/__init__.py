@@ -3,10 +3,7 @@ Scroll Executor Patch
 Sacred patch for activating full scroll-to-code execution and export engine
 """
 
-from .gather_installer import GatherInstaller
-from .scroll_file_writer import ScrollFileWriter
-from .scroll_folder_generator import ScrollFolderGenerator
-from .deploy_handler import DeployHandler
+import importlib
 
 __version__ = "1.0.0"
 __description__ = "Scroll Executor Patch - Full scroll-to-code execution engine"
@@ -16,4 +13,23 @@ __all__ = [
     "ScrollFileWriter", 
     "ScrollFolderGenerator",
     "DeployHandler"
-] 
\ No newline at end of file
+]
+
+# Submodules are imported on first attribute access to keep package import cheap
+_LAZY_ATTRS = {
+    "GatherInstaller": ".gather_installer",
+    "ScrollFileWriter": ".scroll_file_writer",
+    "ScrollFolderGenerator": ".scroll_folder_generator",
+    "DeployHandler": ".deploy_handler",
+}
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRS))
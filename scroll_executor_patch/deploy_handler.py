@@ -27,7 +27,8 @@ class DeployHandler:
             level=logging.INFO,
             format='%(asctime)s - %(levelname)s - %(message)s',
             handlers=[
-                logging.FileHandler(self.log_file),
+                # delay=True defers opening the log until the first record
+                logging.FileHandler(self.log_file, delay=True),
                 logging.StreamHandler(sys.stdout)
             ]
         )
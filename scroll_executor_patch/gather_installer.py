@@ -11,12 +11,36 @@ import logging
 from typing import List, Dict, Optional
 from pathlib import Path
 
+from scroll_wrapped_codex.scroll_ir import parse_scroll, parse_scroll_file
+from scroll_wrapped_codex.package_installer import dedupe_requirements, install_requirements, normalize_requirement
+from scroll_wrapped_codex.installed_index import get_installed_index
+from scroll_wrapped_codex.wheelhouse import Wheelhouse, gather_mode_from_env
+from scroll_wrapped_codex.venv_pool import VenvPool, env_python, lock_hash
+
 class GatherInstaller:
     """Sacred installer for gathering Python packages from scroll commands"""
     
-    def __init__(self, log_file: str = "flame_trace.log"):
+    def __init__(self, log_file: str = "flame_trace.log", gather_mode: str = None, wheelhouse: str = None,
+                 venv_pool=None):
+        """
+        Args:
+            log_file: Installation trace log
+            gather_mode: "online", "wheelhouse" or "offline" (defaults to SCROLL_GATHER_MODE)
+            wheelhouse: Local wheel cache directory (defaults to SCROLL_WHEELHOUSE)
+            venv_pool: VenvPool (or True for the default pool) to install each
+                project into its own pooled virtualenv instead of the host interpreter
+        """
         self.log_file = Path(log_file)
+        self.gather_mode = gather_mode
+        self.wheelhouse = wheelhouse
         self.setup_logging()
+        if venv_pool is True:
+            venv_pool = VenvPool(logger=self.logger, mode=gather_mode, wheelhouse=wheelhouse)
+        self.venv_pool = venv_pool
+        # Pooled environment holding every package gathered so far, and its install results
+        self.environment = None
+        self.environment_packages = []
+        self.environment_results = {}
         
     def setup_logging(self):
         """Setup logging for installation traces"""
@@ -24,7 +48,8 @@ class GatherInstaller:
             level=logging.INFO,
             format='%(asctime)s - %(levelname)s - %(message)s',
             handlers=[
-                logging.FileHandler(self.log_file),
+                # delay=True defers opening the log until the first record
+                logging.FileHandler(self.log_file, delay=True),
                 logging.StreamHandler(sys.stdout)
             ]
         )
@@ -64,7 +89,10 @@ class GatherInstaller:
     
     def install_packages(self, packages: List[str], upgrade: bool = False) -> Dict[str, bool]:
         """
-        Install Python packages using pip
+        Install Python packages using a single pip resolver run
+        
+        Packages are normalized and deduplicated first; if pip rejects some of
+        them, the rest are still installed and each package gets its own status.
         
         Args:
             packages: List of package names to install
@@ -73,41 +101,91 @@ class GatherInstaller:
         Returns:
             Dictionary mapping package names to installation success status
         """
-        results = {}
+        if not packages:
+            return {}
         
-        for package in packages:
-            try:
-                self.logger.info(f"🔥 Installing package: {package}")
-                
-                # Build pip command
-                cmd = [sys.executable, "-m", "pip", "install"]
-                if upgrade:
-                    cmd.append("--upgrade")
-                cmd.append(package)
-                
-                # Execute installation
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=300  # 5 minute timeout
-                )
-                
-                if result.returncode == 0:
-                    self.logger.info(f"✅ Successfully installed: {package}")
-                    results[package] = True
-                else:
-                    self.logger.error(f"❌ Failed to install {package}: {result.stderr}")
-                    results[package] = False
-                    
-            except subprocess.TimeoutExpired:
-                self.logger.error(f"⏰ Timeout installing: {package}")
-                results[package] = False
-            except Exception as e:
-                self.logger.error(f"🔥 Error installing {package}: {str(e)}")
-                results[package] = False
-        
-        return results
+        if self.venv_pool is not None and not upgrade:
+            return self.install_into_environment(packages)
+        
+        installed = install_requirements(packages, upgrade=upgrade, logger=self.logger,
+                                         mode=self.gather_mode, wheelhouse=self.wheelhouse)
+        return {package: installed.get(normalize_requirement(package), False) for package in packages}
+    
+    def prepare_environment(self, packages: List[str]) -> Dict[str, bool]:
+        """
+        Acquire one pooled environment for a scroll's complete requirement set
+        
+        Called once per scroll before its Gather lines run, so every later
+        install_packages() call for those packages reuses this environment
+        instead of building a template for each growing subset. Without a
+        pool the packages are installed into the host interpreter.
+        
+        Args:
+            packages: Every package the scroll needs
+            
+        Returns:
+            Dictionary mapping package names to installation success status
+        """
+        if self.venv_pool is None:
+            return self.install_packages(packages)
+        if not packages:
+            return {}
+        if self._environment_covers(packages):
+            return self._environment_status(packages)
+        return self._acquire_environment(dedupe_requirements(packages), packages)
+    
+    def install_into_environment(self, packages: List[str]) -> Dict[str, bool]:
+        """
+        Hand out a pooled virtualenv that has every package gathered so far
+        
+        Packages already in the current environment are answered from its
+        install results without touching the pool. Only a package outside it
+        grows the set, which is resolved to a lock hash; a ready environment
+        for that hash is cloned from the pool's template (built once per
+        hash), so repeated project shapes skip pip entirely.
+        
+        Args:
+            packages: List of package names to add to the project environment
+            
+        Returns:
+            Dictionary mapping package names to installation success status
+        """
+        if self._environment_covers(packages):
+            return self._environment_status(packages)
+        return self._acquire_environment(dedupe_requirements(self.environment_packages + list(packages)), packages)
+    
+    def _environment_covers(self, packages: List[str]) -> bool:
+        """Whether the current environment already holds every package"""
+        return bool(self.environment) and all(package in self.environment_results
+                                              for package in dedupe_requirements(packages))
+    
+    def _environment_status(self, packages: List[str]) -> Dict[str, bool]:
+        """Install status of packages in the current environment"""
+        return {package: self.environment_results.get(normalize_requirement(package), False) for package in packages}
+    
+    def _acquire_environment(self, requirements: List[str], packages: List[str]) -> Dict[str, bool]:
+        """Switch to a pooled environment for exactly these requirements"""
+        self.logger.info(f"🔥 Preparing environment for {lock_hash(requirements)[:12]}: {' '.join(requirements)}")
+        
+        environment, installed = self.venv_pool.acquire(requirements)
+        if environment is None:
+            # Nothing was cached for this set, so the next Gather retries the build
+            failed = [package for package in requirements if not installed.get(package)]
+            self.logger.error(f"❌ Environment not ready, failed to install: {' '.join(failed)}")
+            return {package: installed.get(normalize_requirement(package), False) for package in packages}
+        if self.environment and self.environment != environment:
+            self.venv_pool.release(self.environment)
+        self.environment = environment
+        self.environment_packages = requirements
+        self.environment_results = installed
+        self.logger.info(f"✅ Environment ready: {environment}")
+        
+        return self._environment_status(packages)
+    
+    @property
+    def python(self) -> str:
+        """Interpreter of the pooled project environment, or the host interpreter"""
+        return env_python(self.environment) if self.environment else sys.executable
     
     def install_from_requirements(self, requirements_file: str) -> Dict[str, bool]:
         """
@@ -128,6 +206,13 @@ class GatherInstaller:
             self.logger.info(f"🔥 Installing from requirements: {requirements_file}")
             
             cmd = [sys.executable, "-m", "pip", "install", "-r", str(req_file)]
+            
+            mode = self.gather_mode or gather_mode_from_env()
+            if mode != "online":
+                wheelhouse = Wheelhouse(self.wheelhouse)
+                if mode == "wheelhouse":
+                    wheelhouse.prefetch([], requirements_file=str(req_file), logger=self.logger)
+                cmd += wheelhouse.pip_install_args()
             result = subprocess.run(
                 cmd,
                 capture_output=True,
@@ -161,19 +246,34 @@ class GatherInstaller:
             self.logger.error(f"❌ Scroll file not found: {scroll_file}")
             return []
         
-        all_packages = []
-        
         try:
-            with open(scroll_path, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    packages = self.parse_gather_command(line)
-                    if packages:
-                        self.logger.info(f"📜 Found Gather command at line {line_num}: {packages}")
-                        all_packages.extend(packages)
+            return self.packages_from_commands(parse_scroll_file(str(scroll_path)))
         
         except Exception as e:
             self.logger.error(f"🔥 Error parsing scroll file: {str(e)}")
         
+        return []
+    
+    def packages_from_commands(self, commands) -> List[str]:
+        """
+        Extract all Gather packages from an already-parsed scroll
+        
+        Args:
+            commands: Scroll text or parsed scroll IR (list of ScrollCommand)
+            
+        Returns:
+            List of all packages found in Gather commands
+        """
+        all_packages = []
+        
+        for command in parse_scroll(commands):
+            if command.verb != "Gather":
+                continue
+            packages = [package.strip() for package in command.args.split(',') if package.strip()]
+            if packages:
+                self.logger.info(f"📜 Found Gather command at line {command.line}: {packages}")
+                all_packages.extend(packages)
+        
         return all_packages
     
     def install_from_scroll(self, scroll_file: str, upgrade: bool = False) -> Dict[str, bool]:
@@ -193,13 +293,14 @@ class GatherInstaller:
             self.logger.warning(f"⚠️ No Gather commands found in: {scroll_file}")
             return {}
         
-        # Remove duplicates while preserving order
+        # Remove duplicates (after normalization) while preserving order
         unique_packages = []
         seen = set()
         for package in packages:
-            if package not in seen:
+            key = normalize_requirement(package)
+            if key not in seen:
                 unique_packages.append(package)
-                seen.add(package)
+                seen.add(key)
         
         self.logger.info(f"🔥 Installing {len(unique_packages)} packages from scroll file")
         return self.install_packages(unique_packages, upgrade)
@@ -232,15 +333,13 @@ class GatherInstaller:
         Check if a package is already installed
         
         Args:
-            package: Package name to check
+            package: Package name or requirement (e.g. "flask>=2") to check
             
         Returns:
             True if package is installed
         """
         try:
-            cmd = [sys.executable, "-m", "pip", "show", package]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            return result.returncode == 0
+            return get_installed_index().is_satisfied(package)
         except Exception:
             return False
     
@@ -252,20 +351,7 @@ class GatherInstaller:
             List of installed package names
         """
         try:
-            cmd = [sys.executable, "-m", "pip", "list", "--format=freeze"]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                packages = []
-                for line in result.stdout.split('\n'):
-                    if line.strip():
-                        package_name = line.split('==')[0]
-                        packages.append(package_name)
-                return packages
-            else:
-                self.logger.error(f"❌ Failed to get installed packages: {result.stderr}")
-                return []
-                
+            return sorted((name for name, _version in get_installed_index().packages().values()), key=str.lower)
         except Exception as e:
             self.logger.error(f"🔥 Error getting installed packages: {str(e)}")
             return []
@@ -6,7 +6,7 @@ Integrates all executor patch components into ScribeCodex.execute()
 
 import os
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 
 from .gather_installer import GatherInstaller
@@ -14,6 +14,8 @@ from .scroll_file_writer import ScrollFileWriter
 from .scroll_folder_generator import ScrollFolderGenerator
 from .deploy_handler import DeployHandler
 
+from scroll_wrapped_codex.scroll_ir import parse_scroll
+
 class ScrollExecutorHook:
     """Sacred hook for integrating executor patch components into ScribeCodex"""
     
@@ -29,6 +31,10 @@ class ScrollExecutorHook:
         self.gather_pattern = re.compile(r'^Gather:\s*(.+)$')
         self.deploy_pattern = re.compile(r'^Deploy:\s*(.+)$')
         
+        # Last parsed scroll, reused when the same content is executed again
+        self._parsed_source = None
+        self._parsed_commands = []
+        
     def set_scribe_codex(self, scribe_codex):
         """Set the ScribeCodex instance"""
         self.scribe = scribe_codex
@@ -49,32 +55,8 @@ class ScrollExecutorHook:
             # First run the original Codex execution
             original_result = original_execute_method(scroll_content)
             
-            # Parse scroll content for patch commands
-            lines = scroll_content.split('\n')
-            patch_results = []
-            
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                
-                # Check for Gather commands
-                if self.gather_pattern.match(line):
-                    result = self._handle_gather_command(line)
-                    if result:
-                        patch_results.append(result)
-                
-                # Check for Build commands
-                elif self.build_pattern.match(line):
-                    result = self._handle_build_command(line)
-                    if result:
-                        patch_results.append(result)
-                
-                # Check for Deploy commands
-                elif self.deploy_pattern.match(line):
-                    result = self._handle_deploy_command(line)
-                    if result:
-                        patch_results.append(result)
+            # Run patch commands from the shared scroll IR
+            patch_results = [result for _, result in self._run_patch_commands(self._parse(scroll_content))]
             
             # Combine original result with patch results
             if patch_results:
@@ -88,13 +70,81 @@ class ScrollExecutorHook:
         
         return wrapped_execute
     
-    def _handle_gather_command(self, line: str) -> Optional[str]:
-        """Handle Gather: command execution"""
+    def _parse(self, scroll_content: str) -> list:
+        """Parse scroll content into IR, reusing the last parse for identical content"""
+        if scroll_content != self._parsed_source:
+            self._parsed_commands = parse_scroll(scroll_content)
+            self._parsed_source = scroll_content
+        return self._parsed_commands
+    
+    def _run_patch_commands(self, commands):
+        """
+        Run Gather/Build/Deploy commands from a parsed scroll
+        
+        The scroll is split after every Deploy. Within each segment all Gather
+        lines are resolved in one pip run (or one pooled environment) and all
+        Build modules are written together on the writer's thread pool; since
+        installs and file writes do not affect each other, only their timing
+        changes. A Deploy always runs after every earlier command's side
+        effects and before any later one's, as the scroll orders them.
+        
+        Args:
+            commands: Parsed scroll IR (list of ScrollCommand)
+            
+        Yields:
+            Tuples of (category, result message) in scroll order
+        """
+        self.file_writer.manifest.reset_counts()
+        
+        # The first Gather batch picks the scroll's pooled environment; later ones extend it
+        install = self.gather_installer.prepare_environment
+        
+        for segment in self._deploy_segments(commands):
+            packages = self.gather_installer.packages_from_commands(segment)
+            gathered = {}
+            if packages:
+                gathered = install(packages)
+                install = self.gather_installer.install_packages
+            
+            builds = [self.file_writer.parse_build_command(command.text) for command in segment if command.verb == "Build"]
+            built = self.file_writer.write_many(build for build in builds if build)
+            
+            for command in segment:
+                verb = command.verb
+                
+                if verb == "Gather":
+                    category, result = "gather", self._handle_gather_command(command.text, gathered)
+                elif verb == "Build":
+                    category, result = "build", self._handle_build_command(command.text, built)
+                elif verb == "Deploy":
+                    category, result = "deploy", self._handle_deploy_command(command.text)
+                else:
+                    continue
+                
+                if result:
+                    yield category, result
+        
+        self.file_writer.save_manifest()
+    
+    def _deploy_segments(self, commands) -> List[list]:
+        """Split parsed commands into runs that each end with a Deploy (the last may not)"""
+        segments = [[]]
+        for command in commands:
+            segments[-1].append(command)
+            if command.verb == "Deploy":
+                segments.append([])
+        return [segment for segment in segments if segment]
+    
+    def _handle_gather_command(self, line: str, gathered: Optional[Dict[str, bool]] = None) -> Optional[str]:
+        """Handle Gather: command execution, reusing batch results when given"""
         try:
             packages = self.gather_installer.parse_gather_command(line)
             if packages:
-                print(f"📦 Installing packages: {packages}")
-                results = self.gather_installer.install_packages(packages)
+                if gathered is not None:
+                    results = {package: gathered.get(package, False) for package in packages}
+                else:
+                    print(f"📦 Installing packages: {packages}")
+                    results = self.gather_installer.install_packages(packages)
                 
                 success_count = sum(1 for success in results.values() if success)
                 total_count = len(results)
@@ -106,15 +156,18 @@ class ScrollExecutorHook:
         
         return None
     
-    def _handle_build_command(self, line: str) -> Optional[str]:
-        """Handle Build: command execution"""
+    def _handle_build_command(self, line: str, built: Optional[Dict[str, bool]] = None) -> Optional[str]:
+        """Handle Build: command execution, using write_many results when the module was already built"""
         try:
             result = self.file_writer.parse_build_command(line)
             if result:
                 module_name, arguments = result
                 print(f"🔨 Building module: {module_name}")
                 
-                success = self.file_writer.write_file(module_name, arguments)
+                if built is not None and module_name in built:
+                    success = built[module_name]
+                else:
+                    success = self.file_writer.write_file(module_name, arguments)
                 
                 if success:
                     return f"🔨 BUILD: Created {module_name} successfully"
@@ -146,20 +199,25 @@ class ScrollExecutorHook:
         
         return None
     
-    def create_project_from_scroll(self, scroll_file: str, project_name: Optional[str] = None) -> bool:
+    def create_project_from_scroll(self, scroll_file: str, project_name: Optional[str] = None,
+                                   commands: Optional[list] = None) -> bool:
         """
         Create complete project from scroll file
         
         Args:
             scroll_file: Path to the scroll file
             project_name: Optional project name
+            commands: Optional already-parsed scroll IR, to avoid re-reading the file
             
         Returns:
             True if project created successfully
         """
         try:
             # Parse scroll file for requirements
-            requirements = self.folder_generator.parse_scroll_file(scroll_file)
+            if commands is not None:
+                requirements = self.folder_generator.extract_requirements(commands)
+            else:
+                requirements = self.folder_generator.parse_scroll_file(scroll_file)
             
             if not requirements:
                 print(f"❌ No requirements found in scroll file: {scroll_file}")
@@ -189,6 +247,39 @@ class ScrollExecutorHook:
             print(f"❌ Error creating project: {str(e)}")
             return False
     
+    def export_scroll_archive(self, scroll_content: str, fmt: str = "zip",
+                              project_name: Optional[str] = None) -> Tuple[str, Iterator[bytes]]:
+        """
+        Stream the project a scroll would generate as a zip/tar archive
+        
+        Nothing is written to disk and no packages are installed: the folder
+        structure and every Build module are rendered straight into the archive.
+        
+        Args:
+            scroll_content: Scroll text
+            fmt: "zip", "tar" or "tar.gz"
+            project_name: Top-level folder in the archive (defaults to the
+                scroll's first Anoint, or "scroll_project")
+            
+        Returns:
+            Tuple of (project name, iterator of archive byte chunks)
+        """
+        commands = self._parse(scroll_content)
+        if not project_name:
+            anointed = [command.args for command in commands if command.verb == "Anoint" and command.args]
+            project_name = anointed[0] if anointed else "scroll_project"
+        project_name = Path(project_name).name or "scroll_project"
+        
+        requirements = self.folder_generator.extract_requirements(commands)
+        builds = [self.file_writer.parse_build_command(command.text) for command in commands if command.verb == "Build"]
+        builds = [build for build in builds if build]
+        # Output paths come from the module mappings, so no module is rendered before it is streamed
+        paths = {self.file_writer.module_path(module_name) for module_name, _ in builds}
+        chunks = self.folder_generator.export_archive(project_name, requirements, fmt,
+                                                      extra_files=self.file_writer.iter_files(builds),
+                                                      extra_paths=paths)
+        return project_name, chunks
+    
     def execute_scroll_with_patches(self, scroll_file: str) -> Dict[str, any]:
         """
         Execute scroll file with all patch functionality
@@ -200,54 +291,42 @@ class ScrollExecutorHook:
             Dictionary with execution results
         """
         try:
-            # Read scroll file
+            # Read and parse scroll file once
             with open(scroll_file, 'r', encoding='utf-8') as f:
                 scroll_content = f.read()
+            commands = self._parse(scroll_content)
+            
+            # One pooled environment for the project dependencies and every Gather line
+            if self.gather_installer.venv_pool is not None:
+                dependencies = self.folder_generator.extract_requirements(commands).get("dependencies", [])
+                self.gather_installer.prepare_environment(
+                    list(dependencies) + self.gather_installer.packages_from_commands(commands))
             
             # Create project structure
-            project_created = self.create_project_from_scroll(scroll_file)
+            project_created = self.create_project_from_scroll(scroll_file, commands=commands)
             
             # Execute with ScribeCodex if available
             scribe_result = None
             if self.scribe:
                 scribe_result = self.scribe.execute(scroll_content)
             
-            # Parse for patch commands
-            lines = scroll_content.split('\n')
+            # Run patch commands
             patch_results = {
                 "gather": [],
                 "build": [],
                 "deploy": []
             }
             
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                
-                # Gather commands
-                if self.gather_pattern.match(line):
-                    result = self._handle_gather_command(line)
-                    if result:
-                        patch_results["gather"].append(result)
-                
-                # Build commands
-                elif self.build_pattern.match(line):
-                    result = self._handle_build_command(line)
-                    if result:
-                        patch_results["build"].append(result)
-                
-                # Deploy commands
-                elif self.deploy_pattern.match(line):
-                    result = self._handle_deploy_command(line)
-                    if result:
-                        patch_results["deploy"].append(result)
+            for category, result in self._run_patch_commands(commands):
+                patch_results[category].append(result)
             
             return {
                 "success": True,
                 "project_created": project_created,
                 "scribe_result": scribe_result,
                 "patch_results": patch_results,
+                "files_written": self.file_writer.manifest.written,
+                "files_skipped": self.file_writer.manifest.skipped,
                 "scroll_file": scroll_file
             }
             
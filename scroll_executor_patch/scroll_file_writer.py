@@ -6,18 +6,51 @@ Creates actual code files during Build phase from scroll commands
 
 import os
 import re
-from typing import Dict, List, Optional, Tuple
+import string
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 import json
 
+from scroll_wrapped_codex.build_manifest import BuildManifest
+
+class CompiledTemplate:
+    """A str.format template split once into literal text and field names"""
+    
+    def __init__(self, template: str):
+        self.template = template
+        self.parts = []
+        for literal, field, spec, conversion in string.Formatter().parse(template):
+            if spec or conversion or (field is not None and not field.isidentifier()):
+                # Format specs, conversions and indexing are left to str.format
+                self.parts = None
+                break
+            if literal:
+                self.parts.append((literal, None))
+            if field is not None:
+                self.parts.append(("", field))
+    
+    def render(self, **values) -> str:
+        """Fill in the template's fields"""
+        if self.parts is None:
+            return self.template.format(**values)
+        return "".join(literal if field is None else str(values[field]) for literal, field in self.parts)
+
+_PLAIN_TEMPLATE = CompiledTemplate("{code}")
+
 class ScrollFileWriter:
     """Sacred file writer for creating code files from scroll commands"""
     
     def __init__(self, output_dir: str = "scroll_build"):
+        # Created on first write, so constructing a writer never touches disk
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
-        self.templates = self._load_templates()
+        # Content hashes of written files; unchanged files are skipped
+        self.manifest = BuildManifest(self.output_dir)
+        self.templates = {}
+        self.compiled_templates = {}
+        for file_type, template in self._load_templates().items():
+            self.register_template(file_type, template)
         self.file_mappings = self._load_file_mappings()
+        self.generators = self._load_generators()
         
     def _load_templates(self) -> Dict[str, str]:
         """Load code templates for different file types"""
@@ -144,6 +177,53 @@ Generated from scroll command: `{command}`
             }
         }
     
+    def _load_generators(self) -> Dict[str, Callable[[], str]]:
+        """Load the content generator of each known module"""
+        return {
+            "StreamPlayerModule": self._generate_stream_player,
+            "UploadEpisodeEndpoint": self._generate_upload_endpoint,
+            "FlaskAPI": self._generate_flask_api,
+            "StreamlitApp": self._generate_streamlit_app,
+            "DatabaseSchema": self._generate_database_schema,
+            "ConfigFile": self._generate_config_file,
+            "README": self._generate_readme,
+            "Requirements": self._generate_requirements,
+            "CSSStyles": self._generate_css_styles,
+            "JavaScriptModule": self._generate_javascript_module,
+            "JSONConfig": self._generate_json_config
+        }
+    
+    def register_template(self, file_type: str, template: str):
+        """
+        Add or replace the template for a file type
+        
+        Args:
+            file_type: File type named in file mappings (e.g. "python")
+            template: str.format template; fields are description, command,
+                code, title, css, html, javascript, data and content
+        """
+        self.templates[file_type] = template
+        self.compiled_templates[file_type] = CompiledTemplate(template)
+    
+    def register_module(self, module_name: str, generator: Callable[[], str], file_type: str = "python",
+                        path: Optional[str] = None, description: Optional[str] = None):
+        """
+        Add or replace a Build module
+        
+        Args:
+            module_name: Name used in "Build: <module_name>"
+            generator: Callable returning the module's code
+            file_type: Template to wrap the code in
+            path: Output path relative to output_dir
+            description: Description placed in the file header
+        """
+        self.file_mappings[module_name] = {
+            "type": file_type,
+            "path": path or f"{module_name.lower()}.py",
+            "description": description or f"Generated {module_name}"
+        }
+        self.generators[module_name] = generator
+    
     def parse_build_command(self, line: str) -> Optional[Tuple[str, str]]:
         """
         Parse a Build: command line
@@ -184,29 +264,10 @@ Generated from scroll command: `{command}`
         file_type = mapping.get("type", "python")
         description = mapping.get("description", f"Generated {module_name}")
         
-        # Generate content based on module type
-        if module_name == "StreamPlayerModule":
-            content = self._generate_stream_player()
-        elif module_name == "UploadEpisodeEndpoint":
-            content = self._generate_upload_endpoint()
-        elif module_name == "FlaskAPI":
-            content = self._generate_flask_api()
-        elif module_name == "StreamlitApp":
-            content = self._generate_streamlit_app()
-        elif module_name == "DatabaseSchema":
-            content = self._generate_database_schema()
-        elif module_name == "ConfigFile":
-            content = self._generate_config_file()
-        elif module_name == "README":
-            content = self._generate_readme()
-        elif module_name == "Requirements":
-            content = self._generate_requirements()
-        elif module_name == "CSSStyles":
-            content = self._generate_css_styles()
-        elif module_name == "JavaScriptModule":
-            content = self._generate_javascript_module()
-        elif module_name == "JSONConfig":
-            content = self._generate_json_config()
+        # Generate content with the module's registered generator
+        generator = self.generators.get(module_name)
+        if generator is not None:
+            content = generator()
         else:
             content = self._generate_default_content(module_name, file_type)
         
@@ -217,54 +278,169 @@ Generated from scroll command: `{command}`
             "command": f"Build: {module_name} {arguments}".strip()
         }
     
+    def module_path(self, module_name: str) -> str:
+        """Output path of a module, relative to output_dir"""
+        return self.file_mappings.get(module_name, {}).get("path", f"{module_name.lower()}.py")
+    
+    def render_file(self, module_name: str, arguments: str = "") -> Tuple[str, str]:
+        """
+        Render the file a Build command produces, without writing it
+        
+        Args:
+            module_name: Name of the module to build
+            arguments: Additional arguments for the build
+            
+        Returns:
+            Tuple of (path relative to output_dir, file content)
+        """
+        file_data = self.generate_file_content(module_name, arguments)
+        template = self.compiled_templates.get(file_data["type"], _PLAIN_TEMPLATE)
+        content = template.render(
+            description=file_data["description"],
+            command=file_data["command"],
+            code=file_data["content"],
+            title=module_name,
+            css="",
+            html="",
+            javascript="",
+            data="{}",
+            content=file_data["content"]
+        )
+        return self.module_path(module_name), content
+    
     def write_file(self, module_name: str, arguments: str = "") -> bool:
         """
         Write a file based on Build command
         
+        The file is left untouched if it already has exactly this content;
+        call save_manifest() after a batch of writes to remember the hashes.
+        
         Args:
             module_name: Name of the module to build
             arguments: Additional arguments for the build
             
         Returns:
-            True if file written successfully
+            True if file written successfully (or already up to date)
         """
         try:
-            # Get file mapping
-            mapping = self.file_mappings.get(module_name, {})
-            file_path = mapping.get("path", f"{module_name.lower()}.py")
-            
-            # Generate content
-            file_data = self.generate_file_content(module_name, arguments)
+            file_path, formatted_content = self.render_file(module_name, arguments)
             
             # Create directory structure
             full_path = self.output_dir / file_path
             full_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Apply template
-            template = self.templates.get(file_data["type"], "{code}")
-            formatted_content = template.format(
-                description=file_data["description"],
-                command=file_data["command"],
-                code=file_data["content"],
-                title=module_name,
-                css="",
-                html="",
-                javascript="",
-                data="{}",
-                content=file_data["content"]
-            )
-            
-            # Write file
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(formatted_content)
-            
-            print(f"🔥 Created file: {full_path}")
+            # Write file unless its content is unchanged
+            if self.manifest.write(full_path, formatted_content, atomic=True):
+                print(f"🔥 Created file: {full_path}")
+            else:
+                print(f"⏩ Unchanged: {full_path}")
             return True
             
         except Exception as e:
             print(f"❌ Error writing file for {module_name}: {str(e)}")
             return False
     
+    def _module_jobs(self, modules) -> Tuple[Dict[str, str], Dict[str, Tuple[str, str]]]:
+        """Map module names to output paths, and each path to the last (module_name, arguments) writing it"""
+        requested = {}
+        jobs = {}
+        for module in modules:
+            module_name, arguments = (module, "") if isinstance(module, str) else module
+            requested[module_name] = self.module_path(module_name)
+            jobs[requested[module_name]] = (module_name, arguments or "")
+        return requested, jobs
+    
+    def write_many(self, modules, max_workers: Optional[int] = None) -> Dict[str, bool]:
+        """
+        Render and write many Build modules on a thread pool
+        
+        Every file is written to a temp file and renamed into place, and the
+        manifest is saved once at the end. When two modules map to the same
+        path the later one wins, as with one write_file call after another.
+        
+        Args:
+            modules: Module names or (module_name, arguments) tuples
+            max_workers: Thread pool size (defaults to ThreadPoolExecutor's)
+            
+        Returns:
+            Dictionary mapping module names to success status
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        requested, jobs = self._module_jobs(modules)
+        if not jobs:
+            return {}
+        
+        # Create each directory once up front instead of from every worker
+        for directory in {(self.output_dir / path).parent for path in jobs}:
+            directory.mkdir(parents=True, exist_ok=True)
+        
+        def build(job) -> Optional[bool]:
+            module_name, arguments = job
+            try:
+                file_path, content = self.render_file(module_name, arguments)
+                return self.manifest.write(self.output_dir / file_path, content, atomic=True)
+            except Exception as e:
+                print(f"❌ Error writing file for {module_name}: {str(e)}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scroll-write") as pool:
+            outcomes = dict(zip(jobs, pool.map(build, jobs.values())))
+        self.save_manifest()
+        
+        written = sum(1 for outcome in outcomes.values() if outcome)
+        unchanged = sum(1 for outcome in outcomes.values() if outcome is False)
+        print(f"🔥 Wrote {written} files ({unchanged} unchanged) in: {self.output_dir}")
+        return {module_name: outcomes[path] is not None for module_name, path in requested.items()}
+    
+    def iter_files(self, modules) -> Iterator[Tuple[str, str]]:
+        """
+        Render Build modules lazily, without writing them
+        
+        Args:
+            modules: Module names or (module_name, arguments) tuples
+            
+        Yields:
+            Tuples of (path relative to output_dir, file content); when two
+            modules map to the same path only the later one is yielded
+        """
+        _, jobs = self._module_jobs(modules)
+        for module_name, arguments in jobs.values():
+            yield self.render_file(module_name, arguments)
+    
+    def export_archive(self, modules, fmt: str = "zip", prefix: str = "") -> Iterator[bytes]:
+        """
+        Stream Build modules as a zip/tar archive instead of writing them to disk
+        
+        Each file is rendered, compressed and handed out before the next one
+        is generated, so the archive can be piped to an HTTP response.
+        
+        Args:
+            modules: Module names or (module_name, arguments) tuples
+            fmt: "zip", "tar" or "tar.gz"
+            prefix: Folder to put the files under inside the archive
+            
+        Returns:
+            Iterator of archive byte chunks
+        """
+        from scroll_wrapped_codex.scroll_archive import stream_archive
+        
+        prefix = f"{prefix.strip('/')}/" if prefix else ""
+        return stream_archive(((prefix + path, content) for path, content in self.iter_files(modules)), fmt)
+    
+    def save_manifest(self) -> bool:
+        """
+        Persist the content hashes of the files written so far
+        
+        Returns:
+            True if the manifest changed and was saved
+        """
+        try:
+            return self.manifest.save()
+        except OSError as e:
+            print(f"❌ Error saving build manifest: {str(e)}")
+            return False
+    
     def _generate_stream_player(self) -> str:
         """Generate HTML stream player"""
         return """<div class="stream-player">
@@ -610,7 +786,7 @@ if __name__ == "__main__":
             # Create directories
             dirs = ["frontend", "backend", "database", "config", "docs"]
             for dir_name in dirs:
-                (self.output_dir / dir_name).mkdir(exist_ok=True)
+                (self.output_dir / dir_name).mkdir(parents=True, exist_ok=True)
             
             print(f"🔥 Created project structure in: {self.output_dir}")
             return True
@@ -653,4 +829,6 @@ if __name__ == "__main__":
             print(f"❌ Not a build command: {command}")
     
     # Create project structure
-    writer.create_project_structure() 
\ No newline at end of file
+    writer.create_project_structure()
+    writer.save_manifest()
+    print(f"📊 Files: {writer.manifest.counts()}")
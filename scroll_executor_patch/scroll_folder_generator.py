@@ -6,16 +6,18 @@ Creates project structure based on .scroll files
 
 import os
 import re
-from typing import Dict, List, Set, Optional
+from typing import Dict, Iterator, List, Set, Optional, Tuple
 from pathlib import Path
 import json
 
+from scroll_wrapped_codex.scroll_ir import parse_scroll, parse_scroll_file
+
 class ScrollFolderGenerator:
     """Sacred folder generator for creating project structures from scroll files"""
     
     def __init__(self, base_dir: str = "scroll_projects"):
+        # Created on first project, so constructing a generator never touches disk
         self.base_dir = Path(base_dir)
-        self.base_dir.mkdir(exist_ok=True)
         self.project_templates = self._load_project_templates()
         
     def _load_project_templates(self) -> Dict[str, Dict]:
@@ -147,42 +149,58 @@ class ScrollFolderGenerator:
             print(f"❌ Scroll file not found: {scroll_file}")
             return {}
         
-        requirements = {
+        try:
+            return self.extract_requirements(parse_scroll_file(str(scroll_path)))
+        
+        except Exception as e:
+            print(f"❌ Error parsing scroll file: {str(e)}")
+        
+        return {
             "modules": [],
             "dependencies": [],
             "deploy_targets": [],
             "config_files": []
         }
+    
+    def extract_requirements(self, commands) -> Dict[str, List[str]]:
+        """
+        Extract project requirements from an already-parsed scroll
         
-        try:
-            with open(scroll_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    # Parse different command types
-                    if line.startswith('Build:'):
-                        module = self._extract_module_name(line)
-                        if module:
-                            requirements["modules"].append(module)
-                    
-                    elif line.startswith('Gather:'):
-                        deps = self._extract_dependencies(line)
-                        requirements["dependencies"].extend(deps)
-                    
-                    elif line.startswith('Deploy:'):
-                        target = self._extract_deploy_target(line)
-                        if target:
-                            requirements["deploy_targets"].append(target)
-                    
-                    elif line.startswith('Config:'):
-                        config = self._extract_config_file(line)
-                        if config:
-                            requirements["config_files"].append(config)
+        Args:
+            commands: Scroll text or parsed scroll IR (list of ScrollCommand)
+            
+        Returns:
+            Dictionary with parsed requirements
+        """
+        requirements = {
+            "modules": [],
+            "dependencies": [],
+            "deploy_targets": [],
+            "config_files": []
+        }
         
-        except Exception as e:
-            print(f"❌ Error parsing scroll file: {str(e)}")
+        for command in parse_scroll(commands):
+            verb = command.verb
+            
+            # Parse different command types
+            if verb == 'Build':
+                module = self._extract_module_name(command.text)
+                if module:
+                    requirements["modules"].append(module)
+            
+            elif verb == 'Gather':
+                deps = self._extract_dependencies(command.text)
+                requirements["dependencies"].extend(deps)
+            
+            elif verb == 'Deploy':
+                target = self._extract_deploy_target(command.text)
+                if target:
+                    requirements["deploy_targets"].append(target)
+            
+            elif verb == 'Config':
+                config = self._extract_config_file(command.text)
+                if config:
+                    requirements["config_files"].append(config)
         
         return requirements
     
@@ -264,7 +282,7 @@ class ScrollFolderGenerator:
             
             # Create project directory
             project_dir = self.base_dir / project_name
-            project_dir.mkdir(exist_ok=True)
+            project_dir.mkdir(parents=True, exist_ok=True)
             
             print(f"🔥 Creating {project_type} project: {project_name}")
             
@@ -288,89 +306,174 @@ class ScrollFolderGenerator:
     
     def _create_structure_recursive(self, base_path: Path, structure: Dict):
         """Recursively create directory structure"""
-        for name, content in structure.items():
+        self._write_files(base_path, self._structure_files(structure))
+    
+    def _write_files(self, base_path: Path, files):
+        """Write (relative path, content) pairs under base_path; None content is a directory"""
+        for name, content in files:
             path = base_path / name
-            
-            if isinstance(content, dict):
-                # Directory
-                path.mkdir(exist_ok=True)
-                self._create_structure_recursive(path, content)
+            if content is None:
+                path.mkdir(parents=True, exist_ok=True)
             else:
-                # File
                 path.parent.mkdir(parents=True, exist_ok=True)
                 with open(path, 'w', encoding='utf-8') as f:
                     f.write(content)
     
+    def _structure_files(self, structure: Dict, prefix: str = "") -> Iterator[Tuple[str, Optional[str]]]:
+        """Flatten a template structure into (relative path, content) pairs, directories first"""
+        for name, content in structure.items():
+            path = f"{prefix}{name}"
+            if isinstance(content, dict):
+                yield path, None
+                yield from self._structure_files(content, f"{path}/")
+            else:
+                yield path, content
+    
+    def _requirements_files(self, requirements: Dict[str, List[str]]) -> List[Tuple[str, str]]:
+        """requirements.txt based on dependencies"""
+        deps = requirements.get("dependencies", [])
+        if not deps:
+            return []
+        return [("requirements.txt", "".join(f"{dep}\n" for dep in deps))]
+    
+    def _config_files(self, requirements: Dict[str, List[str]]) -> List[Tuple[str, str]]:
+        """Configuration files"""
+        return [(f"config/{config}.yaml", f"# {config} Configuration\n# Generated from scroll file\n")
+                for config in requirements.get("config_files", [])]
+    
+    def _deployment_files(self, requirements: Dict[str, List[str]]) -> List[Tuple[str, Optional[str]]]:
+        """Deployment configuration files"""
+        deploy_targets = requirements.get("deploy_targets", [])
+        if not deploy_targets:
+            return []
+        
+        files = [("deploy", None)]
+        for target in deploy_targets:
+            deployment_file = self._deployment_file(target)
+            if deployment_file:
+                files.append(deployment_file)
+        return files
+    
+    def _deployment_file(self, target: str) -> Optional[Tuple[str, str]]:
+        """Deployment file for one deploy target, if it needs one"""
+        if "docker" in target.lower():
+            return "deploy/Dockerfile", f"""# Dockerfile for {target}
+FROM python:3.9-slim
+WORKDIR /app
+COPY requirements.txt .
+RUN pip install -r requirements.txt
+COPY . .
+CMD ["python", "app.py"]
+"""
+        elif "heroku" in target.lower():
+            return "Procfile", "web: python app.py\n"
+        return None
+    
+    def _build_log(self, requirements: Dict[str, List[str]]) -> str:
+        """Scroll build log content"""
+        lines = ["ScrollWrappedCodex™ Build Log", "=" * 40, "", "Modules Built:"]
+        lines += [f"  - {module}" for module in requirements.get("modules", [])]
+        lines += ["", "Dependencies Gathered:"]
+        lines += [f"  - {dep}" for dep in requirements.get("dependencies", [])]
+        lines += ["", "Deploy Targets:"]
+        lines += [f"  - {target}" for target in requirements.get("deploy_targets", [])]
+        lines += ["", "Build Status: COMPLETE", "Flame Verification: PASSED"]
+        return "\n".join(lines) + "\n"
+    
     def _create_requirements_file(self, project_dir: Path, requirements: Dict[str, List[str]]):
         """Create requirements.txt based on dependencies"""
-        deps = requirements.get("dependencies", [])
-        if deps:
-            req_file = project_dir / "requirements.txt"
-            with open(req_file, 'w') as f:
-                for dep in deps:
-                    f.write(f"{dep}\n")
-            print(f"📦 Created requirements.txt with {len(deps)} dependencies")
+        files = self._requirements_files(requirements)
+        self._write_files(project_dir, files)
+        if files:
+            print(f"📦 Created requirements.txt with {len(requirements['dependencies'])} dependencies")
     
     def _create_config_files(self, project_dir: Path, requirements: Dict[str, List[str]]):
         """Create configuration files"""
-        config_files = requirements.get("config_files", [])
-        for config in config_files:
-            config_path = project_dir / "config" / f"{config}.yaml"
-            config_path.parent.mkdir(exist_ok=True)
-            with open(config_path, 'w') as f:
-                f.write(f"# {config} Configuration\n# Generated from scroll file\n")
-            print(f"⚙️ Created config file: {config_path}")
+        for name, content in self._config_files(requirements):
+            self._write_files(project_dir, [(name, content)])
+            print(f"⚙️ Created config file: {project_dir / name}")
     
     def _create_deployment_files(self, project_dir: Path, requirements: Dict[str, List[str]]):
         """Create deployment configuration files"""
         deploy_targets = requirements.get("deploy_targets", [])
         if deploy_targets:
-            deploy_dir = project_dir / "deploy"
-            deploy_dir.mkdir(exist_ok=True)
+            (project_dir / "deploy").mkdir(exist_ok=True)
             
             for target in deploy_targets:
-                if "docker" in target.lower():
-                    dockerfile = deploy_dir / "Dockerfile"
-                    with open(dockerfile, 'w') as f:
-                        f.write(f"""# Dockerfile for {target}
-FROM python:3.9-slim
-WORKDIR /app
-COPY requirements.txt .
-RUN pip install -r requirements.txt
-COPY . .
-CMD ["python", "app.py"]
-""")
-                    print(f"🐳 Created Dockerfile for {target}")
-                
-                elif "heroku" in target.lower():
-                    procfile = project_dir / "Procfile"
-                    with open(procfile, 'w') as f:
-                        f.write("web: python app.py\n")
-                    print(f"☁️ Created Procfile for {target}")
+                deployment_file = self._deployment_file(target)
+                if deployment_file:
+                    self._write_files(project_dir, [deployment_file])
+                    if deployment_file[0] == "Procfile":
+                        print(f"☁️ Created Procfile for {target}")
+                    else:
+                        print(f"🐳 Created Dockerfile for {target}")
     
     def _create_build_log(self, project_dir: Path, requirements: Dict[str, List[str]]):
         """Create scroll build log"""
         log_file = project_dir / "scroll_build_log.txt"
-        with open(log_file, 'w') as f:
-            f.write("ScrollWrappedCodex™ Build Log\n")
-            f.write("=" * 40 + "\n\n")
-            
-            f.write("Modules Built:\n")
-            for module in requirements.get("modules", []):
-                f.write(f"  - {module}\n")
-            
-            f.write("\nDependencies Gathered:\n")
-            for dep in requirements.get("dependencies", []):
-                f.write(f"  - {dep}\n")
+        self._write_files(project_dir, [(log_file.name, self._build_log(requirements))])
+        print(f"📝 Created build log: {log_file}")
+    
+    def project_files(self, requirements: Dict[str, List[str]]) -> Dict[str, Optional[str]]:
+        """
+        Render every file of a project without touching disk
+        
+        Args:
+            requirements: Parsed requirements from scroll file
             
-            f.write("\nDeploy Targets:\n")
-            for target in requirements.get("deploy_targets", []):
-                f.write(f"  - {target}\n")
+        Returns:
+            Dictionary mapping paths relative to the project folder to file
+            content (None for an empty directory), in creation order
+        """
+        project_type = self.determine_project_type(requirements)
+        template = self.project_templates.get(project_type, self.project_templates["web_app"])
+        
+        files = {}
+        for name, content in self._structure_files(template["structure"]):
+            files[name] = content
+        for name, content in (self._requirements_files(requirements) + self._config_files(requirements)
+                              + self._deployment_files(requirements)):
+            files[name] = content
+        files["scroll_build_log.txt"] = self._build_log(requirements)
+        return files
+    
+    def export_archive(self, project_name: str, requirements: Dict[str, List[str]], fmt: str = "zip",
+                       extra_files=None, extra_paths=None) -> Iterator[bytes]:
+        """
+        Stream the project as a zip/tar archive instead of writing it to disk
+        
+        Nothing is rendered until the first chunk is requested. Extra files
+        are consumed one at a time after the generated structure, so pass
+        extra_paths to stream them lazily; without it they are collected
+        first to find out which generated files they replace.
+        
+        Args:
+            project_name: Name of the project (the archive's top-level folder)
+            requirements: Parsed requirements from scroll file
+            fmt: "zip", "tar" or "tar.gz"
+            extra_files: Optional (relative path, content) pairs added to the
+                project, replacing generated files with the same path
+            extra_paths: Paths extra_files will produce, known up front
             
-            f.write("\nBuild Status: COMPLETE\n")
-            f.write("Flame Verification: PASSED\n")
+        Yields:
+            Archive byte chunks, e.g. for a streaming HTTP response
+        """
+        from scroll_wrapped_codex.scroll_archive import stream_archive
         
-        print(f"📝 Created build log: {log_file}")
+        extra_files = extra_files or ()
+        if extra_paths is None:
+            extra_files = list(extra_files)
+            extra_paths = [name for name, _ in extra_files]
+        replaced = set(extra_paths)
+        
+        def members():
+            for name, content in self.project_files(requirements).items():
+                if name not in replaced:
+                    yield f"{project_name}/{name}", content
+            for name, content in extra_files:
+                yield f"{project_name}/{name}", content
+        
+        yield from stream_archive(members(), fmt)
     
     def create_from_scroll_file(self, scroll_file: str, project_name: Optional[str] = None) -> bool:
         """
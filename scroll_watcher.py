@@ -1,19 +1,367 @@
-import time, os
+import os
+import sys
+import json
+import time
+import queue
+import hashlib
+import argparse
+import threading
 from scroll_wrapped_codex.scribe_codex import ScribeCodex
-from scroll_wrapped_codex.lashon_compiler import compile_lashon
+from scroll_wrapped_codex.scroll_cache import compile_lashon_cached
+from scroll_wrapped_codex.file_events import list_names, open_event_source
 
 WATCH_FOLDER = "scrolls/"
-scribe = ScribeCodex()
-seen = set()
-
-while True:
-    files = [f for f in os.listdir(WATCH_FOLDER) if f.endswith(".scroll")]
-    for fname in files:
-        path = os.path.join(WATCH_FOLDER, fname)
-        if path not in seen:
-            with open(path) as f:
-                compiled = compile_lashon(f.readlines())
-                for line in compiled:
-                    print(scribe.execute(line))
-            seen.add(path)
-    time.sleep(5) 
\ No newline at end of file
+CHECKPOINT_NAME = ".scroll_watcher_checkpoint.json"
+CHECKPOINT_VERSION = 1
+LEASE_DIR_NAME = ".scroll_leases"
+
+class ScrollWatcher:
+    """
+    Executes .scroll files in a folder when they are created or edited.
+
+    Change notifications come from inotify (or polling when it is not
+    available) and are debounced per file. A file is only re-executed when
+    its mtime/size changed *and* its content hash differs from the last run,
+    so touches and identical rewrites are ignored.
+
+    Changed files are handed to a pool of worker threads through a bounded
+    queue; when the queue is full, files stay pending and are retried, so a
+    slow scroll never blocks event handling. The (mtime, size, sha256) of
+    every executed file is checkpointed to disk, so a restarted watcher
+    only runs what changed while it was down.
+
+    With shared=True several watchers (on one or many hosts) can serve the
+    same folder: each content version is claimed through a LeaseManager
+    lease before it runs, so it executes exactly once, and leases left by
+    crashed watchers are taken over once they expire. Shared watchers keep
+    their checkpoint in memory unless given a file of their own.
+    """
+
+    def __init__(self, folder: str = WATCH_FOLDER, scribe=None, debounce: float = 0.05,
+                 polling: bool = False, poll_interval: float = 1.0, out=None,
+                 workers: int = 4, queue_size: int = 64, checkpoint: str = None,
+                 shared: bool = False, lease_ttl: float = 60.0):
+        """
+        Initialize the watcher.
+
+        Args:
+            folder (str): Folder containing .scroll files
+            scribe: ScribeCodex used for execution (created when omitted)
+            debounce (float): Quiet seconds required after the last write before running
+            polling (bool): Use the polling fallback even when inotify is available
+            poll_interval (float): Seconds between scans for the polling fallback
+            out: Stream results are printed to (defaults to stdout)
+            workers (int): Number of worker threads executing scrolls
+            queue_size (int): Maximum files waiting for a worker
+            checkpoint (str): Checkpoint file (defaults to CHECKPOINT_NAME inside folder;
+                              in shared mode no file unless one is given)
+            shared (bool): Coordinate with other watchers on the same folder through leases
+            lease_ttl (float): Seconds without a heartbeat before another watcher's lease is reclaimed
+        """
+        self.folder = folder
+        self.scribe = scribe or ScribeCodex()
+        self.debounce = debounce
+        self.polling = polling
+        self.poll_interval = poll_interval
+        self.out = out or sys.stdout
+        self.workers = max(1, workers)
+        self.queue = queue.Queue(maxsize=max(1, queue_size))
+        if checkpoint is None and not shared:
+            checkpoint = os.path.join(folder, CHECKPOINT_NAME)
+        # Shared watchers may run as several processes on one host, so a per-host
+        # file would be overwritten by its neighbours; their state stays in memory
+        # and the leases' done markers keep a restart from re-running anything
+        self.checkpoint_path = checkpoint
+        self.shared = shared
+        self.lease_ttl = lease_ttl
+        self.leases = None
+        self.source = None
+        self.running = False
+        self.threads = []
+        # path -> (mtime_ns, size, sha256) of the last executed version
+        self.state = {}
+        # path -> monotonic deadline at which the debounced change is checked
+        self.pending = {}
+        # Paths queued or executing, and those that changed again meanwhile
+        self.in_flight = set()
+        self.rerun = set()
+        self.deferred = 0
+        self.lock = threading.Lock()
+        self.out_lock = threading.Lock()
+        self.checkpoint_lock = threading.Lock()
+
+    def start(self) -> None:
+        """Load the checkpoint, start the workers and queue every scroll already in the folder."""
+        os.makedirs(self.folder, exist_ok=True)
+        self.load_checkpoint()
+        if self.shared:
+            from scroll_wrapped_codex.scroll_lease import LeaseManager
+            self.leases = LeaseManager(os.path.join(self.folder, LEASE_DIR_NAME), self.lease_ttl)
+            self.leases.start()
+        self.source = open_event_source(self.folder, ".scroll", self.polling, self.poll_interval)
+        self.running = True
+
+        for _ in range(self.workers):
+            thread = threading.Thread(target=self._worker, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+        now = time.monotonic()
+        with self.lock:
+            for name in sorted(list_names(self.folder, ".scroll")):
+                self.pending[os.path.join(self.folder, name)] = now
+
+    def stop(self) -> None:
+        """Ask run() to return after the current wait."""
+        self.running = False
+
+    def close(self) -> None:
+        """Finish queued work, stop the workers, save the checkpoint and release the event source."""
+        for _ in self.threads:
+            self.queue.put(None)
+        for thread in self.threads:
+            thread.join()
+        self.threads = []
+        self.save_checkpoint()
+        if self.leases is not None:
+            self.leases.close()
+        if self.source is not None:
+            self.source.close()
+            self.source = None
+
+    def run(self) -> None:
+        """Watch the folder until stop() is called or the process is interrupted."""
+        if self.source is None:
+            self.start()
+        mode = ", shared" if self.shared else ""
+        print(f"🔥 Watching {self.folder} ({self.source.name}, {self.workers} workers{mode})",
+              file=self.out, flush=True)
+        try:
+            while self.running:
+                self.step()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+
+    def step(self, max_wait: float = 1.0) -> int:
+        """
+        Wait for events once and queue every change whose debounce expired.
+
+        Args:
+            max_wait (float): Upper bound on the wait when nothing is pending
+
+        Returns:
+            int: Number of files queued for execution
+        """
+        with self.lock:
+            timeout = max_wait
+            if self.pending:
+                timeout = min(min(self.pending.values()) - time.monotonic(), max_wait)
+            if self.in_flight:
+                # Re-runs are scheduled by the workers, so look back soon
+                timeout = min(timeout, self.debounce)
+        timeout = max(0.0, timeout)
+
+        names = self.source.wait(timeout)
+
+        queued = 0
+        with self.lock:
+            now = time.monotonic()
+            for name in names:
+                # Every event re-arms the timer, so a burst of writes runs once
+                self.pending[os.path.join(self.folder, name)] = now + self.debounce
+
+            for path in sorted(path for path, deadline in self.pending.items() if deadline <= now):
+                if path in self.in_flight:
+                    # Never run one file on two workers; run it again once it finishes
+                    self.rerun.add(path)
+                    del self.pending[path]
+                    continue
+                if not self._stat_changed(path):
+                    del self.pending[path]
+                    continue
+                try:
+                    self.queue.put_nowait(path)
+                except queue.Full:
+                    # Backpressure: keep the file pending until a worker frees a slot
+                    self.pending[path] = now + self.debounce
+                    self.deferred += 1
+                    continue
+                del self.pending[path]
+                self.in_flight.add(path)
+                queued += 1
+        return queued
+
+    def _stat_changed(self, path: str) -> bool:
+        # Cheap pre-check on the event thread; hashing happens on a worker
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            self.state.pop(path, None)
+            return False
+        previous = self.state.get(path)
+        return not previous or previous[:2] != (st.st_mtime_ns, st.st_size)
+
+    def _worker(self) -> None:
+        while True:
+            path = self.queue.get()
+            if path is None:
+                break
+            try:
+                self.process(path)
+            except Exception as e:
+                with self.out_lock:
+                    print(f"🔥ERROR: {path}: {e}", file=self.out, flush=True)
+            finally:
+                with self.lock:
+                    self.in_flight.discard(path)
+                    if path in self.rerun:
+                        self.rerun.discard(path)
+                        self.pending[path] = time.monotonic()
+
+    def process(self, path: str) -> bool:
+        """
+        Execute a file if its content changed since it last ran.
+
+        Args:
+            path (str): Scroll file path
+
+        Returns:
+            bool: True if the file was executed
+        """
+        try:
+            st = os.stat(path)
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            with self.lock:
+                self.state.pop(path, None)
+            return False
+
+        digest = hashlib.sha256(data).hexdigest()
+        signature = (st.st_mtime_ns, st.st_size, digest)
+        with self.lock:
+            previous = self.state.get(path)
+            if previous and previous[2] == digest:
+                self.state[path] = signature
+                return False
+
+        name = os.path.basename(path)
+        if self.leases is not None:
+            if self.leases.is_done(name, digest):
+                with self.lock:
+                    self.state[path] = signature
+                return False
+            if not self.leases.acquire(name, digest):
+                # Another watcher holds it; look again once its lease could have expired
+                with self.lock:
+                    self.pending[path] = time.monotonic() + self.leases.remaining(name, digest) + self.debounce
+                return False
+
+        done = False
+        try:
+            results = self.execute(path, data.decode("utf-8", errors="replace"))
+            done = True
+        finally:
+            if self.leases is not None:
+                self.leases.release(name, digest, done=done)
+
+        with self.out_lock:
+            print(f"📜 {path}", file=self.out)
+            for result in results:
+                print(result, file=self.out)
+            self.out.flush()
+
+        with self.lock:
+            self.state[path] = signature
+        self.save_checkpoint()
+        return True
+
+    def execute(self, path: str, scroll_text: str) -> list:
+        """Compile and execute one scroll, returning its results."""
+        return self.scribe.execute_many(compile_lashon_cached(scroll_text))
+
+    def load_checkpoint(self) -> int:
+        """
+        Restore executed-file signatures from the checkpoint file.
+
+        Returns:
+            int: Number of files restored (0 when there is no usable checkpoint)
+        """
+        if self.checkpoint_path is None:
+            return 0
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return 0
+        if data.get("version") != CHECKPOINT_VERSION:
+            return 0
+
+        with self.lock:
+            for name, (mtime_ns, size, digest) in data.get("files", {}).items():
+                self.state[os.path.join(self.folder, name)] = (mtime_ns, size, digest)
+            return len(self.state)
+
+    def save_checkpoint(self) -> None:
+        """Atomically write executed-file signatures to the checkpoint file."""
+        if self.checkpoint_path is None:
+            return
+        with self.lock:
+            files = {os.path.relpath(path, self.folder): list(sig) for path, sig in self.state.items()}
+
+        with self.checkpoint_lock:
+            tmp_path = f"{self.checkpoint_path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({"version": CHECKPOINT_VERSION, "files": files}, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.checkpoint_path)
+            except OSError as e:
+                with self.out_lock:
+                    print(f"🔥ERROR: could not write checkpoint {self.checkpoint_path}: {e}",
+                          file=self.out, flush=True)
+
+    def stats(self) -> dict:
+        """Return queue depth, in-flight count and how often backpressure deferred a file."""
+        with self.lock:
+            return {
+                "tracked": len(self.state),
+                "pending": len(self.pending),
+                "in_flight": len(self.in_flight),
+                "queued": self.queue.qsize(),
+                "deferred": self.deferred,
+                "leases_reclaimed": self.leases.reclaimed if self.leases else 0,
+            }
+
+def main():
+    parser = argparse.ArgumentParser(prog="scroll_watcher", description="Execute .scroll files as they change")
+    parser.add_argument("folder", nargs="?", default=WATCH_FOLDER)
+    parser.add_argument("--debounce", type=float, default=0.05,
+                        help="quiet seconds after the last write before a file runs")
+    parser.add_argument("--polling", action="store_true",
+                        help="scan the folder instead of using inotify")
+    parser.add_argument("--poll-interval", type=float, default=1.0,
+                        help="seconds between scans in polling mode")
+    parser.add_argument("--workers", "-j", type=int, default=4,
+                        help="number of worker threads executing scrolls")
+    parser.add_argument("--queue-size", type=int, default=64,
+                        help="maximum files waiting for a worker before new changes are held back")
+    parser.add_argument("--checkpoint", default=None,
+                        help=f"checkpoint file (default: <folder>/{CHECKPOINT_NAME}, none with --shared)")
+    parser.add_argument("--shared", action="store_true",
+                        help="coordinate with other watchers on the same folder through lease files")
+    parser.add_argument("--lease-ttl", type=float, default=60.0,
+                        help="seconds before a crashed watcher's lease is reclaimed (shared mode)")
+    args = parser.parse_args()
+
+    watcher = ScrollWatcher(args.folder, debounce=args.debounce, polling=args.polling,
+                            poll_interval=args.poll_interval, workers=args.workers,
+                            queue_size=args.queue_size, checkpoint=args.checkpoint,
+                            shared=args.shared, lease_ttl=args.lease_ttl)
+    watcher.run()
+
+if __name__ == "__main__":
+    main()
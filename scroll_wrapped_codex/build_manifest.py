@@ -0,0 +1,169 @@
+# build_manifest.py
+# Content-hash manifest so generated files are only rewritten when they change.
+#
+# Each project keeps ".scroll_manifest.json" mapping every generated file to
+# the SHA-256 of its content plus the size and mtime it had when written. A
+# file whose new content hashes the same and whose stat still matches is
+# skipped with a single stat call, leaving its mtime alone so watchers and
+# reloaders downstream do not fire. A file without a matching entry (first
+# run, lost manifest, edited by hand) is read back and compared instead.
+
+import hashlib
+import json
+import os
+import threading
+
+from .scroll_trace import span
+
+MANIFEST_NAME = ".scroll_manifest.json"
+MANIFEST_VERSION = 1
+
+class BuildManifest:
+    """Tracks the content of generated files under one project root."""
+
+    def __init__(self, root, path: str = None):
+        """
+        Initialize the manifest. Nothing is read until the first write.
+
+        Args:
+            root: Project directory the generated files live under
+            path (str): Manifest file (defaults to <root>/.scroll_manifest.json)
+        """
+        self.root = os.fspath(root)
+        self._prefix = os.path.join(self.root, "")
+        self.path = path or os.path.join(self.root, MANIFEST_NAME)
+        self.written = 0
+        self.skipped = 0
+        self._entries = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                entries = data.get("files", {}) if data.get("version") == MANIFEST_VERSION else {}
+            except (OSError, ValueError, AttributeError):
+                entries = {}
+            self._entries = entries
+        return self._entries
+
+    def _key(self, path) -> str:
+        path = os.fspath(path)
+        # Generated paths are built from the root, so slicing usually suffices
+        relative = path[len(self._prefix):] if path.startswith(self._prefix) else os.path.relpath(path, self.root)
+        return relative.replace(os.sep, "/")
+
+    def is_current(self, path, digest: str) -> bool:
+        """
+        Check whether a file on disk already has the content with this digest.
+
+        Args:
+            path: File path
+            digest (str): SHA-256 hex digest of the wanted content
+
+        Returns:
+            bool: True if the file does not need to be written
+        """
+        return self._is_current(path, self._key(path), digest)
+
+    def _is_current(self, path, key: str, digest: str) -> bool:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+
+        with self._lock:
+            entry = self._load().get(key)
+        if entry and entry[0] == digest and entry[1:] == [stat.st_size, stat.st_mtime_ns]:
+            return True
+
+        # No usable entry: compare the bytes on disk once and remember the result
+        if entry and entry[1] != stat.st_size:
+            return False
+        with open(path, "rb") as f:
+            if hashlib.sha256(f.read()).hexdigest() != digest:
+                return False
+        self._record(key, digest, stat)
+        return True
+
+    def _record(self, key: str, digest: str, stat) -> None:
+        with self._lock:
+            self._load()[key] = [digest, stat.st_size, stat.st_mtime_ns]
+            self._dirty = True
+
+    def write(self, path, content, atomic: bool = False) -> bool:
+        """
+        Write content to path unless the file already holds exactly that content.
+
+        Args:
+            path: File to write
+            content (str | bytes): New content (str is written as UTF-8)
+            atomic (bool): Write a temp file and rename it into place, so
+                readers never see a half-written file
+
+        Returns:
+            bool: True if the file was written, False if it was skipped
+        """
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        digest = hashlib.sha256(data).hexdigest()
+        key = self._key(path)
+        if self._is_current(path, key, digest):
+            with self._lock:
+                self.skipped += 1
+            return False
+
+        with span("write", "io", path=os.fspath(path)):
+            if atomic:
+                _write_atomic(path, data)
+            else:
+                with open(path, "wb") as f:
+                    f.write(data)
+        self._record(key, digest, os.stat(path))
+        with self._lock:
+            self.written += 1
+        return True
+
+    def counts(self) -> dict:
+        """Return {"written": n, "skipped": n} since the last reset."""
+        return {"written": self.written, "skipped": self.skipped}
+
+    def reset_counts(self) -> None:
+        """Start counting written and skipped files from zero."""
+        with self._lock:
+            self.written = 0
+            self.skipped = 0
+
+    def save(self) -> bool:
+        """
+        Write the manifest if any entry changed, atomically.
+
+        Returns:
+            bool: True if the manifest file was written
+        """
+        with self._lock:
+            if not self._dirty:
+                return False
+            payload = {"version": MANIFEST_VERSION, "files": self._entries}
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(payload, f, sort_keys=True)
+            os.replace(tmp, self.path)
+            self._dirty = False
+            return True
+
+def _write_atomic(path, data: bytes) -> None:
+    # Unique per thread so concurrent writers of one path cannot share a temp file
+    tmp = f"{os.fspath(path)}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,93 @@
+# codex_backend.py
+# Pluggable Codex backends used by ScrollCoreController.
+
+import os
+
+class CodexBackendError(Exception):
+    """Raised when a Codex backend cannot produce a result."""
+    pass
+
+class CodexBackend:
+    """
+    Interface for anything that can execute verified Codex prompts.
+
+    Subclasses implement run(); run_many() may be overridden when the
+    backend can serve several prompts in one round-trip.
+    """
+
+    def run(self, prompt: str) -> str:
+        """
+        Execute a single verified prompt.
+
+        Args:
+            prompt (str): The prompt to execute
+
+        Returns:
+            str: Codex execution result
+        """
+        raise NotImplementedError
+
+    def run_many(self, prompts: list[str], concurrency: int = 1) -> list[str]:
+        """
+        Execute several verified prompts.
+
+        Args:
+            prompts (list[str]): Prompts to execute
+            concurrency (int): Maximum prompts in flight
+
+        Returns:
+            list[str]: Results in the same order as prompts
+        """
+        if concurrency <= 1 or len(prompts) <= 1:
+            return [self.run(prompt) for prompt in prompts]
+
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(prompts))) as pool:
+            return list(pool.map(self.run, prompts))
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+        pass
+
+class LocalCodexBackend(CodexBackend):
+    """In-process backend that echoes the prompt, matching the original wrapper output."""
+
+    def run(self, prompt: str) -> str:
+        return f"Codex (Wrapped) Executed → {prompt}"
+
+    def run_many(self, prompts: list[str], concurrency: int = 1) -> list[str]:
+        # Nothing to overlap in-process; threads would only add startup cost
+        return [f"Codex (Wrapped) Executed → {prompt}" for prompt in prompts]
+
+def backend_from_env(environ=None) -> CodexBackend:
+    """
+    Build the default backend from environment variables.
+
+    SCROLL_CODEX_URL selects HTTPCodexBackend; SCROLL_CODEX_TIMEOUT,
+    SCROLL_CODEX_POOL_SIZE and SCROLL_CODEX_BATCH_SIZE tune it. Without a
+    URL the in-process LocalCodexBackend is used.
+
+    Returns:
+        CodexBackend: The configured backend
+    """
+    environ = os.environ if environ is None else environ
+
+    url = environ.get("SCROLL_CODEX_URL")
+    if not url:
+        return LocalCodexBackend()
+
+    from .codex_http_backend import HTTPCodexBackend
+
+    return HTTPCodexBackend(
+        url,
+        timeout=float(environ.get("SCROLL_CODEX_TIMEOUT", 30.0)),
+        pool_size=int(environ.get("SCROLL_CODEX_POOL_SIZE", 8)),
+        batch_size=int(environ.get("SCROLL_CODEX_BATCH_SIZE", 32)),
+    )
+
+def __getattr__(name):
+    # The HTTP client pulls in http.client/ssl, so it is only imported when used
+    if name == "HTTPCodexBackend":
+        from .codex_http_backend import HTTPCodexBackend
+        return HTTPCodexBackend
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,156 @@
+# codex_http_backend.py
+# HTTP/JSON Codex backend with pooled keep-alive connections.
+
+import http.client
+import json
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from .codex_backend import CodexBackend, CodexBackendError
+
+class HTTPCodexBackend(CodexBackend):
+    """
+    HTTP/JSON Codex client with pooled keep-alive connections.
+
+    Requests:
+        POST {base}/v1/execute        {"prompt": str}         → {"result": str}
+        POST {base}/v1/execute_batch  {"prompts": [str, ...]} → {"results": [str, ...]}
+    """
+
+    def __init__(self, base_url: str, timeout: float = 30.0, pool_size: int = 8,
+                 batch_size: int = 32, headers: dict = None):
+        """
+        Initialize the client.
+
+        Args:
+            base_url (str): Server root, e.g. "http://127.0.0.1:8765"
+            timeout (float): Socket timeout in seconds for each request
+            pool_size (int): Maximum idle keep-alive connections kept open
+            batch_size (int): Maximum prompts sent in one batch request
+            headers (dict): Extra headers (e.g. authorization) for every request
+        """
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported Codex backend URL: {base_url}")
+
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.base_path = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.batch_size = max(1, batch_size)
+        self.headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+        self.headers.update(headers or {})
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+        self.requests_sent = 0
+        self.total_latency = 0.0
+        self._stats_lock = threading.Lock()
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        conn_class = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        return conn_class(self.host, self.port, timeout=self.timeout)
+
+    def _acquire(self) -> http.client.HTTPConnection:
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return self._new_connection()
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def _post(self, path: str, payload: dict) -> dict:
+        """POST a JSON payload over a pooled connection, retrying once on a stale socket."""
+        body = json.dumps(payload).encode("utf-8")
+        url = self.base_path + path
+
+        for attempt in range(2):
+            conn = self._acquire()
+            start = time.perf_counter()
+            try:
+                conn.request("POST", url, body=body, headers=self.headers)
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+                # Idle keep-alive connection was closed by the server; retry on a fresh one
+                conn.close()
+                if attempt == 0:
+                    continue
+                raise CodexBackendError(f"Codex backend connection failed: {e}")
+            except (OSError, http.client.HTTPException) as e:
+                # Truncated body, malformed status or header line: the connection is unusable
+                conn.close()
+                raise CodexBackendError(f"Codex backend request failed: {e}")
+
+            # Shared across threads by run_many and the controller
+            with self._stats_lock:
+                self.requests_sent += 1
+                self.total_latency += time.perf_counter() - start
+
+            if response.status != 200:
+                conn.close()
+                raise CodexBackendError(f"Codex backend returned HTTP {response.status}: {data[:200]!r}")
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+
+            try:
+                return json.loads(data)
+            except ValueError:
+                raise CodexBackendError("Codex backend returned invalid JSON")
+
+        raise CodexBackendError("Codex backend request failed")
+
+    def run(self, prompt: str) -> str:
+        data = self._post("/v1/execute", {"prompt": prompt})
+        result = data.get("result") if isinstance(data, dict) else None
+        if not isinstance(result, str):
+            raise CodexBackendError("Codex backend response has no \"result\" string")
+        return result
+
+    def run_many(self, prompts: list[str], concurrency: int = 1) -> list[str]:
+        batches = [prompts[i:i + self.batch_size] for i in range(0, len(prompts), self.batch_size)]
+
+        def send(batch):
+            data = self._post("/v1/execute_batch", {"prompts": batch})
+            results = data.get("results") if isinstance(data, dict) else None
+            if not isinstance(results, list) or not all(isinstance(result, str) for result in results):
+                raise CodexBackendError("Codex backend response has no \"results\" list of strings")
+            if len(results) != len(batch):
+                raise CodexBackendError("Codex backend returned a mismatched batch")
+            return results
+
+        workers = min(max(1, concurrency), self.pool_size, len(batches))
+        if workers <= 1:
+            chunks = [send(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                chunks = list(pool.map(send, batches))
+
+        return [result for chunk in chunks for result in chunk]
+
+    def stats(self) -> dict:
+        """Return request count and mean per-request latency in seconds."""
+        with self._stats_lock:
+            requests_sent, total_latency = self.requests_sent, self.total_latency
+        return {
+            "requests": requests_sent,
+            "mean_latency": total_latency / requests_sent if requests_sent else 0.0,
+            "idle_connections": self._pool.qsize(),
+        }
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
@@ -0,0 +1,98 @@
+# codex_standin_server.py
+# Local stand-in Codex server for exercising HTTPCodexBackend.
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+def make_handler(latency: float = 0.0):
+    """
+    Build a request handler class answering the HTTPCodexBackend protocol.
+
+    Args:
+        latency (float): Simulated seconds of model time per request
+
+    Returns:
+        type: BaseHTTPRequestHandler subclass
+    """
+
+    class StandInCodexHandler(BaseHTTPRequestHandler):
+        # HTTP/1.1 keeps connections alive between requests
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                payload = json.loads(self.rfile.read(length) or b"{}")
+            except ValueError:
+                self._reply(400, {"error": "invalid JSON"})
+                return
+
+            if latency:
+                time.sleep(latency)
+
+            if self.path.endswith("/v1/execute"):
+                self._reply(200, {"result": self._execute(payload.get("prompt", ""))})
+            elif self.path.endswith("/v1/execute_batch"):
+                prompts = payload.get("prompts", [])
+                self._reply(200, {"results": [self._execute(prompt) for prompt in prompts]})
+            else:
+                self._reply(404, {"error": f"unknown path {self.path}"})
+
+        def _execute(self, prompt: str) -> str:
+            return f"Codex (Wrapped) Executed → {prompt}"
+
+        def _reply(self, status: int, body: dict):
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            # Keep benchmark output clean
+            pass
+
+    return StandInCodexHandler
+
+def start_standin_server(host: str = "127.0.0.1", port: int = 0, latency: float = 0.0):
+    """
+    Start the stand-in server on a background thread.
+
+    Args:
+        host (str): Interface to bind
+        port (int): Port to bind (0 picks a free port)
+        latency (float): Simulated seconds of model time per request
+
+    Returns:
+        tuple: (server, base_url); call server.shutdown() to stop it
+    """
+    server = ThreadingHTTPServer((host, port), make_handler(latency))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    bound_host, bound_port = server.server_address[:2]
+    return server, f"http://{bound_host}:{bound_port}"
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in Codex server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="simulated seconds of model time per request")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(args.latency))
+    print(f"🔥 Stand-in Codex server listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
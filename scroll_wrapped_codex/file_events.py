@@ -0,0 +1,253 @@
+# file_events.py
+# Folder change sources for the scroll watcher: inotify on Linux, polling elsewhere.
+#
+# A source only reports *which* file names may have changed; deciding whether
+# a file really changed (mtime + content hash) is left to the caller.
+#
+# If the watched folder itself is deleted or renamed, the kernel drops the
+# inotify watch. The inotify source then polls the folder path until it can
+# watch it again, so the watcher never goes silent.
+
+import logging
+import os
+import select
+import struct
+import time
+
+# inotify event bits (see <sys/inotify.h>)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+
+# The watched folder went away; the watch is (or must be) removed
+WATCH_LOST = IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED
+
+WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+logger = logging.getLogger(__name__)
+
+def list_names(folder: str, suffix: str) -> set:
+    """Return the names in folder ending with suffix (empty if the folder is missing)."""
+    try:
+        with os.scandir(folder) as entries:
+            return {entry.name for entry in entries if entry.name.endswith(suffix) and entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+class InotifyEventSource:
+    """
+    Kernel-driven change notifications for a single folder.
+
+    wait() blocks on the inotify descriptor, so changes are reported as soon
+    as the kernel queues them instead of on the next poll. While the folder
+    is deleted or renamed away, its path is polled until it can be watched
+    again.
+    """
+
+    name = "inotify"
+
+    def __init__(self, folder: str, suffix: str = ".scroll", interval: float = 1.0):
+        """
+        Start watching a folder.
+
+        Args:
+            folder (str): Folder to watch (must exist)
+            suffix (str): Only names ending with this suffix are reported
+            interval (float): Polling interval while the watch is lost
+
+        Raises:
+            OSError: When inotify is unavailable or the watch cannot be added
+        """
+        import ctypes
+        import ctypes.util
+
+        self.folder = folder
+        self.suffix = suffix
+        self.interval = interval
+        self.fallback = None
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available on this platform")
+        self._libc = libc
+        self._get_errno = ctypes.get_errno
+
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        try:
+            self.wd = self._add_watch()
+        except OSError:
+            os.close(self.fd)
+            raise
+
+    def _add_watch(self) -> int:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(self.folder), WATCH_MASK)
+        if wd < 0:
+            raise OSError(self._get_errno(), f"inotify_add_watch failed for {self.folder}")
+        return wd
+
+    def _lose_watch(self) -> None:
+        # A moved folder keeps its watch, which would now report the new location
+        self._libc.inotify_rm_watch(self.fd, self.wd)
+        self.wd = -1
+        logger.warning(f"Watched folder {self.folder} was removed or renamed; polling until it is back")
+        self.fallback = PollingEventSource(self.folder, self.suffix, self.interval)
+
+    def _rewatch(self) -> bool:
+        try:
+            self.wd = self._add_watch()
+        except OSError:
+            return False
+        logger.warning(f"Watching {self.folder} with inotify again")
+        self.fallback = None
+        return True
+
+    def wait(self, timeout: float = None) -> set:
+        """
+        Wait for changes.
+
+        Args:
+            timeout (float): Seconds to wait (None blocks until an event arrives)
+
+        Returns:
+            set: Names that may have changed; empty when the timeout expired
+        """
+        if self.fallback is not None:
+            if os.path.isdir(self.folder) and self._rewatch():
+                # Events between the scan and the new watch were missed
+                return list_names(self.folder, self.suffix)
+            return self.fallback.wait(timeout)
+
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        names = set()
+        lost = False
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+
+                if wd != self.wd and not mask & IN_Q_OVERFLOW:
+                    # Left over from a watch that was already removed
+                    continue
+                if mask & WATCH_LOST:
+                    lost = True
+                elif mask & IN_Q_OVERFLOW:
+                    # The kernel dropped events; fall back to a full listing
+                    names |= list_names(self.folder, self.suffix)
+                elif name:
+                    decoded = os.fsdecode(name)
+                    if decoded.endswith(self.suffix):
+                        names.add(decoded)
+
+        if lost:
+            self._lose_watch()
+        return names
+
+    def close(self) -> None:
+        """Stop watching and release the descriptor."""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+class PollingEventSource:
+    """
+    Portable fallback that rescans the folder every interval seconds.
+
+    Names are reported when their (mtime, size) differ from the previous
+    scan, or when they appear or disappear.
+    """
+
+    name = "polling"
+
+    def __init__(self, folder: str, suffix: str = ".scroll", interval: float = 1.0):
+        """
+        Start polling a folder.
+
+        Args:
+            folder (str): Folder to scan
+            suffix (str): Only names ending with this suffix are reported
+            interval (float): Seconds between scans
+        """
+        self.folder = folder
+        self.suffix = suffix
+        self.interval = interval
+        self.snapshot = self._scan()
+        self.next_scan = time.monotonic() + interval
+
+    def _scan(self) -> dict:
+        snapshot = {}
+        for name in list_names(self.folder, self.suffix):
+            try:
+                st = os.stat(os.path.join(self.folder, name))
+            except FileNotFoundError:
+                continue
+            snapshot[name] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def wait(self, timeout: float = None) -> set:
+        """
+        Wait until the next scan (or the timeout) and report changed names.
+
+        Args:
+            timeout (float): Maximum seconds to wait
+
+        Returns:
+            set: Names that changed since the previous scan
+        """
+        delay = max(0.0, self.next_scan - time.monotonic())
+        if timeout is not None and timeout < delay:
+            time.sleep(timeout)
+            return set()
+        time.sleep(delay)
+        self.next_scan = time.monotonic() + self.interval
+
+        previous, self.snapshot = self.snapshot, self._scan()
+        changed = {name for name, sig in self.snapshot.items() if previous.get(name) != sig}
+        return changed | (previous.keys() - self.snapshot.keys())
+
+    def close(self) -> None:
+        pass
+
+def open_event_source(folder: str, suffix: str = ".scroll", polling: bool = False,
+                      interval: float = 1.0):
+    """
+    Return an inotify source when possible, otherwise a polling source.
+
+    Args:
+        folder (str): Folder to watch
+        suffix (str): Only names ending with this suffix are reported
+        polling (bool): Force the polling source
+        interval (float): Polling interval in seconds
+
+    Returns:
+        InotifyEventSource | PollingEventSource: The event source
+    """
+    if not polling:
+        try:
+            return InotifyEventSource(folder, suffix, interval)
+        except (OSError, AttributeError):
+            pass
+    return PollingEventSource(folder, suffix, interval)
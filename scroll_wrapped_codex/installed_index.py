@@ -0,0 +1,133 @@
+# installed_index.py
+# In-process index of installed distributions, replacing `pip show` / `pip list`.
+#
+# The index is read with importlib.metadata and rebuilt only when the mtime of
+# a site-packages directory changes, which happens whenever pip adds, removes
+# or upgrades a distribution.
+
+import os
+import sys
+import threading
+
+from .package_installer import canonical_name
+
+class InstalledPackageIndex:
+    """
+    Cached view of the distributions installed for this interpreter.
+
+    Version specifiers and markers are checked with the optional `packaging`
+    library; without it only bare requirement names can be confirmed, and
+    anything with a specifier is left for pip to decide.
+    """
+
+    def __init__(self, paths=None):
+        """
+        Initialize the index.
+
+        Args:
+            paths (list[str]): Directories to index (defaults to the existing
+                directories on sys.path at lookup time)
+        """
+        self.paths = paths
+        self.builds = 0
+        self._signature = None
+        self._packages = {}
+        self._lock = threading.Lock()
+
+    def _search_paths(self) -> list:
+        return [p for p in (self.paths or sys.path) if p and os.path.isdir(p)]
+
+    def _current_signature(self, paths: list) -> tuple:
+        signature = []
+        for path in paths:
+            try:
+                signature.append((path, os.stat(path).st_mtime_ns))
+            except OSError:
+                pass
+        return tuple(signature)
+
+    def packages(self) -> dict:
+        """
+        Return installed distributions, rebuilding the index if site-packages changed.
+
+        Returns:
+            dict: Canonical project name -> (display name, version)
+        """
+        import importlib.metadata
+
+        paths = self._search_paths()
+        signature = self._current_signature(paths)
+        with self._lock:
+            if signature != self._signature:
+                packages = {}
+                for dist in importlib.metadata.distributions(path=paths):
+                    name = dist.metadata["Name"]
+                    if name:
+                        # The first match on the path wins, as it does for imports
+                        packages.setdefault(canonical_name(name), (name, dist.version))
+                self._packages = packages
+                self._signature = signature
+                self.builds += 1
+            return self._packages
+
+    def invalidate(self) -> None:
+        """Force a rebuild on the next lookup."""
+        with self._lock:
+            self._signature = None
+
+    def version(self, name: str):
+        """Return the installed version of a project, or None."""
+        entry = self.packages().get(canonical_name(name))
+        return entry[1] if entry else None
+
+    def is_installed(self, name: str) -> bool:
+        """Return True if any version of the project is installed."""
+        return self.version(name) is not None
+
+    def is_satisfied(self, requirement: str) -> bool:
+        """
+        Check whether a requirement is already met without running pip.
+
+        Requirements with extras, or ones that cannot be evaluated, are
+        reported as unsatisfied so pip still handles them.
+
+        Args:
+            requirement (str): Requirement string (e.g. "flask>=2")
+
+        Returns:
+            bool: True if nothing needs to be installed
+        """
+        try:
+            from packaging.requirements import InvalidRequirement, Requirement
+        except ImportError:
+            name = requirement.strip()
+            if not name or any(char in name for char in "<>=!~;[@ "):
+                return False
+            return self.is_installed(name)
+
+        try:
+            parsed = Requirement(requirement)
+        except InvalidRequirement:
+            return False
+        if parsed.marker is not None and not parsed.marker.evaluate():
+            return True
+        if parsed.extras or parsed.url:
+            return False
+
+        installed = self.version(parsed.name)
+        if installed is None:
+            return False
+        try:
+            return parsed.specifier.contains(installed, prereleases=True)
+        except ValueError:
+            # Legacy version strings cannot be compared; let pip decide
+            return False
+
+_default_index = None
+
+def get_installed_index() -> InstalledPackageIndex:
+    """Return the process-wide installed-package index."""
+    global _default_index
+    if _default_index is None:
+        _default_index = InstalledPackageIndex()
+    return _default_index
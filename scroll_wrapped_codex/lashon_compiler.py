@@ -1,6 +1,51 @@
 # lashon_compiler.py
 # Translates .scroll flame-language commands into regular code prompts.
 
+import os
+
+from .scroll_ir import is_ir, iter_scroll
+
+# Bump whenever compiled output changes, so cached compilations are invalidated
+LASHON_COMPILER_VERSION = "1"
+
+# Scroll verb → flame-style prompt template
+LASHON_PROMPTS = {
+    "Anoint": "🔥Initialize sacred service: {}",
+    "Build": "🔥Construct module: {}",
+    "Seal": "🔥Apply flame seal level {}",
+    "Judge": "🔥Evaluate scroll logic: {}",
+}
+
+def compile_lashon_iter(source):
+    """
+    Lazily compile Lashon HaScroll flame-language into Codex prompts.
+    
+    Lines are read, parsed and compiled one at a time, so huge scroll files
+    can be streamed without holding the file or the prompt list in memory.
+    
+    Args:
+        source: An open file, any iterable of lines, scroll text, a path
+            (os.PathLike) to a .scroll file, or a parsed scroll IR
+        
+    Yields:
+        str: Transformed executable prompts, in scroll order
+    """
+    if isinstance(source, os.PathLike):
+        with open(source, "r", encoding="utf-8") as f:
+            yield from compile_lashon_iter(f)
+        return
+    
+    commands = source if is_ir(source) else iter_scroll(source)
+    prompts = LASHON_PROMPTS
+    
+    for command in commands:
+        template = prompts.get(command.verb)
+        if template is not None:
+            yield template.format(command.args)
+        else:
+            # Unknown scroll line - add as comment
+            yield f"// Unknown scroll line: {command.text}"
+
 def compile_lashon(scroll_lines: list[str]) -> list[str]:
     """
     Compile Lashon HaScroll flame-language into executable Codex prompts.
@@ -9,46 +54,13 @@ def compile_lashon(scroll_lines: list[str]) -> list[str]:
     prompts that can be executed by the ScribeCodex agent.
     
     Args:
-        scroll_lines (list[str]): List of lines from a .scroll file
+        scroll_lines (list[str]): List of lines from a .scroll file, or a
+            parsed scroll IR from scroll_ir.parse_scroll
         
     Returns:
         list[str]: List of transformed executable prompts
     """
-    compiled_prompts = []
-    
-    for line in scroll_lines:
-        line = line.strip()  # Remove whitespace
-        
-        # Skip empty lines
-        if not line:
-            continue
-            
-        # Map scroll keywords to flame-style prompts
-        if line.startswith("Anoint:"):
-            # Extract the value after "Anoint:"
-            value = line[8:].strip()
-            compiled_prompts.append(f"🔥Initialize sacred service: {value}")
-            
-        elif line.startswith("Build:"):
-            # Extract the value after "Build:"
-            value = line[7:].strip()
-            compiled_prompts.append(f"🔥Construct module: {value}")
-            
-        elif line.startswith("Seal:"):
-            # Extract the value after "Seal:"
-            value = line[6:].strip()
-            compiled_prompts.append(f"🔥Apply flame seal level {value}")
-            
-        elif line.startswith("Judge:"):
-            # Extract the value after "Judge:"
-            value = line[7:].strip()
-            compiled_prompts.append(f"🔥Evaluate scroll logic: {value}")
-            
-        else:
-            # Unknown scroll line - add as comment
-            compiled_prompts.append(f"// Unknown scroll line: {line}")
-    
-    return compiled_prompts
+    return list(compile_lashon_iter(scroll_lines))
 
 if __name__ == "__main__":
     test_input = [
@@ -57,4 +69,4 @@ if __name__ == "__main__":
         "Seal: With ScrollSeal 3"
     ]
     for line in compile_lashon(test_input):
-        print(line) 
\ No newline at end of file
+        print(line)
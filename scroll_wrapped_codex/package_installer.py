@@ -0,0 +1,177 @@
+# package_installer.py
+# Batched pip installation shared by GatherInstaller and the execution engine.
+#
+# All requirements of a scroll go to one `pip install` so the resolver and the
+# interpreter start once. pip aborts the whole batch on a single bad
+# requirement, so failures are attributed from pip's output and the remaining
+# requirements are retried together; only when pip's output names no culprit
+# do we fall back to one install per requirement.
+
+import logging
+import re
+import subprocess
+import sys
+
+from .scroll_trace import span
+
+_NAME = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+_CULPRITS = (
+    re.compile(r"No matching distribution found for ([^\s]+)"),
+    re.compile(r"Could not find a version that satisfies the requirement ([^\s]+)"),
+    re.compile(r"Invalid requirement: '([^']+)'"),
+)
+
+def canonical_name(name: str) -> str:
+    """Normalize a project name per PEP 503 (e.g. "Flask_CORS" -> "flask-cors")."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+def normalize_requirement(requirement: str) -> str:
+    """
+    Normalize a requirement string for deduplication.
+
+    The project name is canonicalized and whitespace removed, while extras,
+    version specifiers and markers are kept (e.g. "Flask_Cors >= 4" ->
+    "flask-cors>=4").
+
+    Args:
+        requirement (str): Requirement as written in a Gather: line
+
+    Returns:
+        str: Normalized requirement
+    """
+    requirement = requirement.strip()
+    match = _NAME.match(requirement)
+    if not match:
+        return requirement
+    rest = requirement[match.end():]
+    marker = ""
+    if ";" in rest:
+        rest, marker = rest.split(";", 1)
+        marker = ";" + marker.strip()
+    return canonical_name(match.group(1)) + "".join(rest.split()) + marker
+
+def dedupe_requirements(requirements) -> list:
+    """
+    Normalize requirements and drop duplicates, keeping first-seen order.
+
+    Args:
+        requirements: Iterable of requirement strings
+
+    Returns:
+        list[str]: Unique normalized requirements
+    """
+    return list(dict.fromkeys(normalize_requirement(r) for r in requirements if r.strip()))
+
+def _project(requirement: str) -> str:
+    match = _NAME.match(requirement)
+    return canonical_name(match.group(1)) if match else requirement
+
+def _culprits(output: str, requirements: list) -> set:
+    # Map the requirement strings pip complained about back onto ours
+    named = {_project(match) for pattern in _CULPRITS for match in pattern.findall(output)}
+    return {r for r in requirements if _project(r) in named or r in named}
+
+def install_requirements(requirements, upgrade: bool = False, python: str = None,
+                         timeout: float = 600, extra_args=None, logger=None,
+                         skip_satisfied: bool = True, index=None, mode: str = None,
+                         wheelhouse=None) -> dict:
+    """
+    Install requirements with as few pip invocations as possible.
+
+    Requirements the installed-package index already satisfies are reported
+    as installed without running pip at all.
+
+    Args:
+        requirements: Iterable of requirement strings (normalized and deduplicated here)
+        upgrade (bool): Pass --upgrade to pip
+        python (str): Interpreter whose pip is used (defaults to sys.executable)
+        timeout (float): Seconds allowed for each pip invocation
+        extra_args (list[str]): Additional pip arguments
+        logger: Logger for progress messages
+        skip_satisfied (bool): Skip requirements that are already met (ignored
+            with upgrade or another interpreter)
+        index (InstalledPackageIndex): Index to check (defaults to the process-wide one)
+        mode (str): Gather mode, "online", "wheelhouse" or "offline" (defaults to
+            SCROLL_GATHER_MODE)
+        wheelhouse (Wheelhouse | str): Wheel cache for the non-online modes
+
+    Returns:
+        dict: Normalized requirement -> True if installed, False otherwise
+    """
+    logger = logger or logging.getLogger(__name__)
+    pending = dedupe_requirements(requirements)
+    results = {}
+
+    same_interpreter = python is None or python == sys.executable
+    if skip_satisfied and not upgrade and same_interpreter and pending:
+        if index is None:
+            from .installed_index import get_installed_index
+            index = get_installed_index()
+        satisfied = [r for r in pending if index.is_satisfied(r)]
+        if satisfied:
+            logger.info(f"✅ Already satisfied: {' '.join(satisfied)}")
+            results.update((requirement, True) for requirement in satisfied)
+            pending = [r for r in pending if r not in results]
+
+    base_cmd = [python or sys.executable, "-m", "pip", "install"]
+    if upgrade:
+        base_cmd.append("--upgrade")
+    base_cmd.extend(extra_args or [])
+
+    from .wheelhouse import Wheelhouse, gather_mode_from_env
+    mode = mode or gather_mode_from_env()
+    if mode != "online" and pending:
+        if not isinstance(wheelhouse, Wheelhouse):
+            wheelhouse = Wheelhouse(wheelhouse)
+        if mode == "wheelhouse":
+            # Build anything missing once; later installs never hit the index
+            wheelhouse.prefetch(pending, python=python, timeout=timeout, logger=logger)
+        base_cmd.extend(wheelhouse.pip_install_args())
+
+    def run(batch):
+        try:
+            with span("pip install", "subprocess", requirements=batch):
+                proc = subprocess.run(base_cmd + batch, capture_output=True, text=True, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            logger.error(f"⏰ Timeout installing: {' '.join(batch)}")
+            return None
+        return proc
+
+    ran_pip = bool(pending)
+    while pending:
+        logger.info(f"🔥 Installing {len(pending)} package(s) in one pip run: {' '.join(pending)}")
+        proc = run(pending)
+        if proc is not None and proc.returncode == 0:
+            results.update((requirement, True) for requirement in pending)
+            logger.info(f"✅ Successfully installed: {' '.join(pending)}")
+            break
+
+        culprits = _culprits(proc.stdout + proc.stderr, pending) if proc is not None else set()
+        if culprits and len(culprits) < len(pending):
+            # Drop what pip rejected and resolve the rest together again
+            for requirement in culprits:
+                results[requirement] = False
+                logger.error(f"❌ Failed to install {requirement}")
+            pending = [r for r in pending if r not in culprits]
+            continue
+
+        if proc is None or culprits or len(pending) == 1:
+            for requirement in pending:
+                results[requirement] = False
+                logger.error(f"❌ Failed to install {requirement}")
+            break
+
+        # pip named no culprit; attribute failures one requirement at a time
+        for requirement in pending:
+            single = run([requirement])
+            results[requirement] = single is not None and single.returncode == 0
+            if results[requirement]:
+                logger.info(f"✅ Successfully installed: {requirement}")
+            else:
+                logger.error(f"❌ Failed to install {requirement}: {single.stderr if single else 'timed out'}")
+        break
+
+    if index is not None and ran_pip:
+        # pip may have changed site-packages in a way its mtime does not show
+        index.invalidate()
+    return results
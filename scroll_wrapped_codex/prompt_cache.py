@@ -0,0 +1,107 @@
+# prompt_cache.py
+# In-memory memoization of Codex results keyed by the verified prompt.
+
+import os
+import threading
+import time
+from collections import OrderedDict
+
+class PromptResultCache:
+    """
+    Thread-safe LRU cache of Codex results with per-entry TTL.
+
+    Entries expire ttl seconds after they were stored, and the least
+    recently used entry is evicted once max_size entries are held.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_size: int = 1024, clock=time.monotonic):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl (float): Seconds a result stays valid
+            max_size (int): Maximum number of cached prompts
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, prompt: str):
+        """
+        Return the cached result for a prompt.
+
+        Args:
+            prompt (str): The verified prompt
+
+        Returns:
+            str | None: Cached result, or None on a miss or expired entry
+        """
+        with self._lock:
+            entry = self._entries.get(prompt)
+            if entry is not None:
+                expires_at, result = entry
+                if expires_at > self.clock():
+                    self._entries.move_to_end(prompt)
+                    self.hits += 1
+                    return result
+                del self._entries[prompt]
+            self.misses += 1
+            return None
+
+    def put(self, prompt: str, result: str) -> None:
+        """
+        Store a result, evicting the least recently used entry when full.
+
+        Args:
+            prompt (str): The verified prompt
+            result (str): Codex result for the prompt
+        """
+        with self._lock:
+            self._entries[prompt] = (self.clock() + self.ttl, result)
+            self._entries.move_to_end(prompt)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return size and hit/miss/eviction counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+def result_cache_from_env(environ=None):
+    """
+    Build the default result cache from environment variables.
+
+    SCROLL_RESULT_CACHE_TTL (seconds) enables the cache and
+    SCROLL_RESULT_CACHE_SIZE bounds it.
+
+    Returns:
+        PromptResultCache | None: The cache, or None when disabled
+    """
+    environ = os.environ if environ is None else environ
+
+    ttl = float(environ.get("SCROLL_RESULT_CACHE_TTL", 0) or 0)
+    if ttl <= 0:
+        return None
+
+    return PromptResultCache(ttl=ttl, max_size=int(environ.get("SCROLL_RESULT_CACHE_SIZE", 1024)))
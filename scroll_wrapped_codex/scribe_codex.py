@@ -9,9 +9,20 @@ class ScribeCodex:
     Uses ScrollCoreController to verify and execute scroll-sealed requests.
     """
     
-    def __init__(self):
-        """Initialize the scribe with a ScrollCoreController kernel."""
-        self.kernel = ScrollCoreController()
+    def __init__(self, concurrency: int = 8, backend=None, result_cache=None):
+        """
+        Initialize the scribe with a ScrollCoreController kernel.
+        
+        Args:
+            concurrency (int): Maximum number of commands in flight for the
+                batch and async execution methods
+            backend (CodexBackend): Codex backend for the kernel (defaults to
+                the one configured by the environment)
+            result_cache (PromptResultCache): Optional prompt-result cache for
+                the kernel
+        """
+        self.kernel = ScrollCoreController(backend, result_cache)
+        self.concurrency = concurrency
     
     def interpret_scroll(self, scroll_command: str) -> str:
         """
@@ -41,6 +52,98 @@ class ScribeCodex:
         
         # Pass the prompt to the kernel for execution
         return self.kernel.execute_codex(prompt)
+    
+    def execute_many(self, scroll_commands, concurrency: int = None) -> list[str]:
+        """
+        Execute a batch of scroll commands, overlapping Codex round-trips.
+        
+        Args:
+            scroll_commands: Iterable of scroll commands to execute
+            concurrency (int): Maximum commands in flight (defaults to
+                self.concurrency; 1 runs serially)
+            
+        Returns:
+            list[str]: Execution results, in the same order as the input
+        """
+        prompts = [self.interpret_scroll(command) for command in scroll_commands]
+        
+        # The kernel hands sealed prompts to the backend in one batch
+        return self.kernel.execute_codex_many(prompts, concurrency or self.concurrency)
+    
+    def execute_iter(self, scroll_commands, concurrency: int = None):
+        """
+        Execute scroll commands concurrently, yielding each result as it finishes.
+        
+        The input is consumed lazily with at most `concurrency` commands in
+        flight, so it may be a generator such as compile_lashon_iter().
+        
+        Args:
+            scroll_commands: Iterable of scroll commands to execute
+            concurrency (int): Maximum commands in flight (defaults to
+                self.concurrency; 1 runs serially)
+            
+        Yields:
+            tuple: (index, result) in completion order, where index is the
+            command's position in the input
+        """
+        concurrency = max(1, concurrency or self.concurrency)
+        if concurrency == 1:
+            for index, command in enumerate(scroll_commands):
+                yield index, self.execute(command)
+            return
+        
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+        
+        commands = enumerate(scroll_commands)
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            in_flight = {}
+            for index, command in commands:
+                in_flight[pool.submit(self.execute, command)] = index
+                if len(in_flight) >= concurrency:
+                    break
+            
+            while in_flight:
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    yield in_flight.pop(future), future.result()
+                    # Refill the freed slot from the input
+                    for index, command in commands:
+                        in_flight[pool.submit(self.execute, command)] = index
+                        break
+    
+    async def aexecute(self, scroll_command: str) -> str:
+        """
+        Execute a scroll command without blocking the event loop.
+        
+        Args:
+            scroll_command (str): The scroll command to execute
+            
+        Returns:
+            str: The execution result from Codex
+        """
+        import asyncio
+        return await asyncio.to_thread(self.execute, scroll_command)
+    
+    async def aexecute_many(self, scroll_commands, concurrency: int = None) -> list[str]:
+        """
+        Execute scroll commands concurrently from async code.
+        
+        Args:
+            scroll_commands: Iterable of scroll commands to execute
+            concurrency (int): Maximum commands in flight (defaults to
+                self.concurrency)
+            
+        Returns:
+            list[str]: Execution results, in the same order as the input
+        """
+        import asyncio
+        semaphore = asyncio.Semaphore(max(1, concurrency or self.concurrency))
+        
+        async def run(command):
+            async with semaphore:
+                return await self.aexecute(command)
+        
+        return await asyncio.gather(*(run(command) for command in scroll_commands))
 
 if __name__ == "__main__":
     scribe = ScribeCodex()
@@ -0,0 +1,136 @@
+# scroll_archive.py
+# Stream generated projects as zip/tar archives without touching disk.
+#
+# zipfile and tarfile write into a small in-memory sink that is drained after
+# every member, so each file is compressed and handed to the caller as soon
+# as it is rendered. Peak memory stays around one file plus one chunk, and an
+# HTTP response can start sending before the last file has been generated.
+# zipfile copes with an unseekable sink by writing data descriptors, and
+# tarfile's "w|" modes never seek.
+
+import io
+import tarfile
+import time
+import zipfile
+
+ARCHIVE_FORMATS = {
+    "zip": ("application/zip", ".zip"),
+    "tar": ("application/x-tar", ".tar"),
+    "tar.gz": ("application/gzip", ".tar.gz"),
+}
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+class _Sink(io.RawIOBase):
+    """Write-only stream that collects bytes until they are drained."""
+
+    def __init__(self):
+        self._chunks = []
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        self.size = 0
+        return data
+
+def member_name(path: str) -> str:
+    """
+    Turn a generated path into a safe archive member name.
+
+    Absolute paths, "." and ".." components are dropped, so names taken from
+    scroll text can never extract outside the target folder.
+    """
+    parts = [part for part in str(path).replace("\\", "/").split("/") if part not in ("", ".", "..")]
+    return "/".join(parts)
+
+def archive_media_type(fmt: str) -> str:
+    """Return the Content-Type for an archive format."""
+    return ARCHIVE_FORMATS[fmt][0]
+
+def archive_filename(name: str, fmt: str) -> str:
+    """Return a download file name such as "MyApp.zip"."""
+    return f"{name}{ARCHIVE_FORMATS[fmt][1]}"
+
+def stream_archive(files, fmt: str = "zip", chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Build an archive incrementally and yield it as byte chunks.
+
+    Args:
+        files: Iterable of (path, content) pairs; content is str (written as
+            UTF-8) or bytes, or None for an empty directory. Consumed lazily.
+        fmt (str): "zip", "tar" or "tar.gz"
+        chunk_size (int): Minimum size of the chunks yielded (the last may be smaller)
+
+    Yields:
+        bytes: Consecutive pieces of the archive
+
+    Raises:
+        ValueError: If fmt is not one of ARCHIVE_FORMATS
+    """
+    if fmt not in ARCHIVE_FORMATS:
+        raise ValueError(f"Archive format must be one of {', '.join(ARCHIVE_FORMATS)}, not {fmt!r}")
+
+    sink = _Sink()
+    now = time.time()
+    if fmt == "zip":
+        archive = zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED)
+        date_time = time.localtime(now)[:6]
+
+        def add(path, data):
+            if data is None:
+                info = zipfile.ZipInfo(path + "/", date_time)
+                info.external_attr = 0o40755 << 16 | 0x10
+                archive.writestr(info, b"")
+            else:
+                info = zipfile.ZipInfo(path, date_time)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info.external_attr = 0o644 << 16
+                archive.writestr(info, data)
+    else:
+        archive = tarfile.open(fileobj=sink, mode="w|gz" if fmt == "tar.gz" else "w|")
+
+        def add(path, data):
+            info = tarfile.TarInfo(path)
+            info.mtime = now
+            if data is None:
+                info.type = tarfile.DIRTYPE
+                info.mode = 0o755
+                archive.addfile(info)
+            else:
+                info.size = len(data)
+                info.mode = 0o644
+                archive.addfile(info, io.BytesIO(data))
+
+    with archive:
+        for path, content in files:
+            name = member_name(path)
+            if name:
+                add(name, content.encode("utf-8") if isinstance(content, str) else content)
+            if sink.size >= chunk_size:
+                yield sink.drain()
+    # Closing writes the zip central directory / tar end blocks
+    tail = sink.drain()
+    if tail:
+        yield tail
+
+def write_archive(files, fileobj, fmt: str = "zip") -> int:
+    """
+    Stream an archive into a writable file object (e.g. a socket or response).
+
+    Returns:
+        int: Number of bytes written
+    """
+    total = 0
+    for chunk in stream_archive(files, fmt):
+        fileobj.write(chunk)
+        total += len(chunk)
+    return total
@@ -0,0 +1,229 @@
+# scroll_cache.py
+# Content-addressed on-disk cache of compiled scrolls with LRU eviction.
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from .lashon_compiler import LASHON_COMPILER_VERSION, compile_lashon
+
+DEFAULT_CACHE_DIR = Path(os.environ.get("SCROLL_CACHE_DIR", Path.home() / ".cache" / "scrollwrappedcodex"))
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+class ScrollCompileCache:
+    """
+    Size-bounded on-disk cache of compiled scroll output.
+
+    Entries are keyed by a hash of the scroll content, the compiler namespace
+    and the compiler version, so editing a scroll or upgrading a compiler
+    never serves stale output. Access times are tracked via file mtimes and
+    the least recently used entries are evicted once the cache exceeds
+    max_bytes.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created lazily)
+            max_bytes (int): Total size above which LRU entries are evicted
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        # Lookups served by this instance; not shared between processes
+        self.hits = 0
+        self.misses = 0
+        # Bytes in the cache as of the last scan plus this process's writes
+        self._size = None
+
+    def key(self, content: str, namespace: str, version: str) -> str:
+        """
+        Compute the content-addressed key for a scroll.
+
+        Args:
+            content (str): Full scroll text
+            namespace (str): Compiler name (e.g. "lashon")
+            version (str): Compiler version
+
+        Returns:
+            str: Hex digest identifying the compiled output
+        """
+        digest = hashlib.sha256(f"{namespace}\0{version}\0".encode("utf-8"))
+        digest.update(content.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str):
+        """
+        Look up a cached entry, marking it as recently used.
+
+        Args:
+            key (str): Key from ScrollCompileCache.key
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value) -> None:
+        """
+        Store a JSON-serializable value and evict old entries if needed.
+
+        Args:
+            key (str): Key from ScrollCompileCache.key
+            value: Compiled output to store
+        """
+        import tempfile
+        
+        path = self._path(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(value, f, ensure_ascii=False)
+                try:
+                    replaced = os.stat(path).st_size
+                except OSError:
+                    replaced = 0
+                os.replace(tmp_path, path)
+            except BaseException:
+                # Never leave a half-written temp file in the cache directory
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+            written = os.stat(path).st_size
+        except OSError:
+            # The cache is an optimization; a read-only or full disk is not fatal
+            return
+
+        if self._size is None:
+            self._size = self._total_size()
+        else:
+            self._size += written - replaced
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def get_or_compute(self, content: str, namespace: str, version: str, compute):
+        """
+        Return cached output for a scroll, compiling and storing it on a miss.
+
+        Args:
+            content (str): Full scroll text
+            namespace (str): Compiler name
+            version (str): Compiler version
+            compute: Callable taking the content and returning the output
+
+        Returns:
+            The compiled output
+        """
+        key = self.key(content, namespace, version)
+        value = self.get(key)
+        if value is None:
+            value = compute(content)
+            self.put(key, value)
+        return value
+
+    def _entries(self) -> list:
+        """List (mtime, size, path) for every cache entry."""
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".json"):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            pass
+        return entries
+
+    def _total_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until under max_bytes."""
+        # Rescan: other processes sharing the directory add entries too
+        entries = self._entries()
+        total = self._size = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= self.max_bytes:
+                break
+        self._size = total
+
+    def clear(self) -> int:
+        """
+        Remove every cache entry.
+
+        Returns:
+            int: Number of entries removed
+        """
+        removed = 0
+        self._size = None
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+    def usage(self) -> dict:
+        """Return the cache directory, entry count and total size."""
+        entries = self._entries()
+        return {
+            "cache_dir": str(self.cache_dir),
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+        }
+
+    def stats(self) -> dict:
+        """Return usage() plus the hit/miss counters of this instance."""
+        return dict(self.usage(), hits=self.hits, misses=self.misses)
+
+_default_cache = None
+
+def get_default_cache() -> ScrollCompileCache:
+    """Return the process-wide cache rooted at SCROLL_CACHE_DIR."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ScrollCompileCache()
+    return _default_cache
+
+def compile_lashon_cached(scroll_text: str, cache: ScrollCompileCache = None) -> list[str]:
+    """
+    Compile scroll text with compile_lashon, reusing cached output for unchanged scrolls.
+
+    Args:
+        scroll_text (str): Full contents of a .scroll file
+        cache (ScrollCompileCache): Cache to use (defaults to the shared cache)
+
+    Returns:
+        list[str]: List of transformed executable prompts
+    """
+    cache = cache or get_default_cache()
+    return cache.get_or_compute(scroll_text, "lashon", LASHON_COMPILER_VERSION, compile_lashon)
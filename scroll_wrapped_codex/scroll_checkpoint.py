@@ -0,0 +1,110 @@
+# scroll_checkpoint.py
+# Append-only per-execution checkpoints so long scrolls can resume after a crash.
+#
+# The file is JSON lines: a header naming the scroll's content hash, then one
+# record per finished command. Appending keeps each checkpoint write O(1), and
+# a record torn by a crash is simply ignored when the file is read back.
+
+import json
+import os
+
+CHECKPOINT_VERSION = 1
+
+class ExecutionCheckpoint:
+    """
+    Records which commands of one scroll version have completed.
+
+    A checkpoint only applies to the scroll content it was written for;
+    resuming a different version starts from the top.
+    """
+
+    def __init__(self, path: str, source_hash: str):
+        """
+        Initialize the checkpoint.
+
+        Args:
+            path (str): Checkpoint file path
+            source_hash (str): Content hash of the scroll being executed
+        """
+        self.path = path
+        self.source_hash = source_hash
+        self._file = None
+        self.failed = False
+
+    def completed(self) -> list:
+        """
+        Return the records of the commands completed by an earlier run.
+
+        Only the leading run of successful records counts: execution resumes
+        at the first command that failed or never finished.
+
+        Returns:
+            list[dict]: Records with "line" and "result", in execution order
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return []
+
+        try:
+            header = json.loads(lines[0]) if lines else {}
+        except ValueError:
+            return []
+        if header.get("version") != CHECKPOINT_VERSION or header.get("sha256") != self.source_hash:
+            return []
+
+        records = []
+        for raw in lines[1:]:
+            try:
+                record = json.loads(raw)
+            except ValueError:
+                break
+            if not record.get("ok"):
+                break
+            records.append(record)
+        return records
+
+    def start(self, keep: list = None) -> None:
+        """
+        Begin writing, keeping the given records from an earlier run.
+
+        Args:
+            keep (list[dict]): Records returned by completed() that are being reused
+        """
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"version": CHECKPOINT_VERSION, "sha256": self.source_hash}) + "\n")
+            for record in keep or []:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def record(self, line: int, result, ok: bool = True) -> None:
+        """
+        Append the outcome of one command.
+
+        Args:
+            line (int): 1-based scroll line of the command
+            result: JSON-serializable command result
+            ok (bool): False when the command should run again on resume
+        """
+        self.failed = self.failed or not ok
+        self._file.write(json.dumps({"line": line, "ok": ok, "result": result}, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def finish(self) -> None:
+        """Close the checkpoint after a run, deleting it unless a command failed."""
+        self.close()
+        if self.failed:
+            # Keep it so resuming retries from the first failed command
+            return
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
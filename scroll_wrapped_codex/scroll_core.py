@@ -1,15 +1,32 @@
 # scroll_core.py
 # Handles scroll verification and routes execution to Codex.
 
+from .codex_backend import CodexBackendError, backend_from_env
+from .prompt_cache import result_cache_from_env
+from .single_flight import SingleFlight
+
 class ScrollCoreController:
     """
     Core controller for ScrollWrappedCodex™ that verifies scroll-sealed prompts
     and manages Codex execution authorization.
     """
     
-    def __init__(self):
-        """Initialize the controller with no authorization."""
+    def __init__(self, backend=None, result_cache=None, coalesce: bool = True):
+        """
+        Initialize the controller with no authorization.
+        
+        Args:
+            backend (CodexBackend): Backend that executes verified prompts
+                (defaults to backend_from_env())
+            result_cache (PromptResultCache): Optional memoization of results
+                by prompt (defaults to result_cache_from_env(), usually off)
+            coalesce (bool): Collapse concurrent identical prompts into one
+                backend call
+        """
         self.authorized = False
+        self.backend = backend if backend is not None else backend_from_env()
+        self.result_cache = result_cache if result_cache is not None else result_cache_from_env()
+        self.single_flight = SingleFlight() if coalesce else None
     
     def verify_flame(self, prompt: str) -> bool:
         """
@@ -37,11 +54,77 @@ class ScrollCoreController:
             str: Execution result or rejection message
         """
         # Verify the prompt is scroll-sealed
-        if self.verify_flame(prompt):
-            self.authorized = True
-            return f"Codex (Wrapped) Executed → {prompt}"
-        else:
+        if not self.verify_flame(prompt):
             return "Rejected: Unsealed scroll request"
+        
+        self.authorized = True
+        cache = self.result_cache
+        if cache is not None:
+            cached = cache.get(prompt)
+            if cached is not None:
+                return cached
+        
+        try:
+            if self.single_flight is not None:
+                result = self.single_flight.do(prompt, lambda: self.backend.run(prompt))
+            else:
+                result = self.backend.run(prompt)
+        except CodexBackendError as e:
+            # Failures are never memoized
+            return f"🔥ERROR: Codex backend failure: {e}"
+        
+        if cache is not None:
+            cache.put(prompt, result)
+        return result
+    
+    def execute_codex_many(self, prompts: list[str], concurrency: int = 1) -> list[str]:
+        """
+        Execute a batch of prompts, sending all sealed ones to the backend together.
+        
+        Args:
+            prompts (list[str]): The prompts to execute
+            concurrency (int): Maximum backend requests in flight
+            
+        Returns:
+            list[str]: Execution results or rejection messages, in input order
+        """
+        results = ["Rejected: Unsealed scroll request"] * len(prompts)
+        sealed = [i for i, prompt in enumerate(prompts) if self.verify_flame(prompt)]
+        if not sealed:
+            return results
+        
+        self.authorized = True
+        cache = self.result_cache
+        if cache is not None:
+            pending = []
+            for i in sealed:
+                cached = cache.get(prompts[i])
+                if cached is not None:
+                    results[i] = cached
+                else:
+                    pending.append(i)
+            sealed = pending
+            if not sealed:
+                return results
+        
+        # Identical prompts within the batch are sent once
+        unique = list(dict.fromkeys(prompts[i] for i in sealed))
+        
+        try:
+            outputs = dict(zip(unique, self.backend.run_many(unique, concurrency)))
+        except CodexBackendError as e:
+            error = f"🔥ERROR: Codex backend failure: {e}"
+            for i in sealed:
+                results[i] = error
+            return results
+        
+        if cache is not None:
+            for prompt, output in outputs.items():
+                cache.put(prompt, output)
+        
+        for i in sealed:
+            results[i] = outputs[prompts[i]]
+        return results
     
     def call_codex(self, prompt: str) -> str:
         """
@@ -53,4 +136,7 @@ class ScrollCoreController:
         Returns:
             str: Codex execution result
         """
-        return f"Codex (Wrapped) Executed → {prompt}" 
\ No newline at end of file
+        try:
+            return self.backend.run(prompt)
+        except CodexBackendError as e:
+            return f"🔥ERROR: Codex backend failure: {e}"
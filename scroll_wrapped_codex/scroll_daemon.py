@@ -0,0 +1,151 @@
+# scroll_daemon.py
+# Persistent scroll execution daemon and its thin Unix-socket client.
+#
+# The client half of this module only needs json/os/socket, so thin clients
+# start without importing the compiler, caches or Codex backends.
+
+import json
+import os
+import socket
+import tempfile
+
+def default_socket_path() -> str:
+    """Return the daemon socket path (SCROLL_DAEMON_SOCKET or a per-user temp path)."""
+    path = os.environ.get("SCROLL_DAEMON_SOCKET")
+    if path:
+        return path
+    uid = os.getuid() if hasattr(os, "getuid") else "user"
+    return os.path.join(tempfile.gettempdir(), f"scrollcodex-{uid}.sock")
+
+def send_request(request: dict, socket_path: str = None, timeout: float = None):
+    """
+    Send one request to a running daemon.
+
+    Args:
+        request (dict): Request with an "op" key ("execute", "run_file", "ping", "shutdown")
+        socket_path (str): Daemon socket (defaults to default_socket_path())
+        timeout (float): Socket timeout in seconds (None waits indefinitely)
+
+    Returns:
+        dict | None: The daemon's response, or None if no daemon is reachable
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(socket_path or default_socket_path())
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+    except OSError:
+        return None
+
+    if not line:
+        return None
+    return json.loads(line)
+
+class ScrollDaemon:
+    """
+    Long-lived server that keeps ScribeCodex, compiled-scroll caches and all
+    imports warm, answering newline-delimited JSON requests on a Unix socket.
+    """
+
+    def __init__(self, socket_path: str = None):
+        from .scribe_codex import ScribeCodex
+
+        self.socket_path = socket_path or default_socket_path()
+        self.scribe = ScribeCodex()
+        self.server = None
+
+    def handle(self, request: dict) -> dict:
+        """
+        Dispatch a single request.
+
+        Args:
+            request (dict): Decoded client request
+
+        Returns:
+            dict: Response with "ok", "output" (list of lines) and "exit_code"
+        """
+        op = request.get("op")
+
+        if op == "ping":
+            return {"ok": True, "output": [], "exit_code": 0}
+
+        if op == "execute":
+            result = self.scribe.execute(request.get("command", ""))
+            return {"ok": True, "output": [result], "exit_code": 0}
+
+        if op == "run_file":
+            return self.run_file(request.get("path", ""), request.get("no_cache", False))
+
+        if op == "shutdown":
+            if self.server is not None:
+                # shutdown() blocks until serve_forever exits, so call it off-thread
+                import threading
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return {"ok": True, "output": ["Scroll daemon stopping"], "exit_code": 0}
+
+        return {"ok": False, "error": f"Unknown op: {op}", "output": [], "exit_code": 2}
+
+    def run_file(self, path: str, no_cache: bool = False) -> dict:
+        """Compile and execute a scroll file, mirroring run_scroll_file."""
+        from .lashon_compiler import compile_lashon
+        from .scroll_cache import compile_lashon_cached
+
+        try:
+            with open(path, "r") as f:
+                scroll_text = f.read()
+        except FileNotFoundError:
+            return {"ok": True, "output": [f"File not found: {path}"], "exit_code": 1}
+
+        compiled = compile_lashon(scroll_text) if no_cache else compile_lashon_cached(scroll_text)
+        return {"ok": True, "output": self.scribe.execute_many(compiled), "exit_code": 0}
+
+    def serve_forever(self) -> None:
+        """Bind the socket and serve requests until shutdown."""
+        import socketserver
+
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    try:
+                        response = daemon.handle(json.loads(line))
+                    except Exception as e:
+                        response = {"ok": False, "error": str(e), "output": [], "exit_code": 1}
+                    self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+
+        class Server(socketserver.ThreadingUnixStreamServer):
+            daemon_threads = True
+
+        # A stale socket from a crashed daemon would make bind() fail
+        if send_request({"op": "ping"}, self.socket_path, timeout=1.0) is not None:
+            raise RuntimeError(f"A scroll daemon is already listening on {self.socket_path}")
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+        # Create the socket owner-only from the start; a chmod after bind() would
+        # leave a window in which other local users can connect
+        old_umask = os.umask(0o077)
+        try:
+            self.server = Server(self.socket_path, Handler)
+        finally:
+            os.umask(old_umask)
+        os.chmod(self.socket_path, 0o600)
+        print(f"🔥 Scroll daemon listening on {self.socket_path}", flush=True)
+        try:
+            self.server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.server.server_close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+def serve(socket_path: str = None) -> None:
+    """Run a ScrollDaemon in the foreground."""
+    ScrollDaemon(socket_path).serve_forever()
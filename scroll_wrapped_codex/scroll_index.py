@@ -0,0 +1,87 @@
+# scroll_index.py
+# Memory-mapped line-offset index for large scroll files.
+#
+# The index stores the byte offset of every line start, so a resumed run can
+# jump straight to line N without reading or parsing the lines before it.
+
+import hashlib
+import mmap
+from array import array
+
+class LineIndex:
+    """
+    Random access to the lines of a file through mmap.
+
+    Usable as a context manager; close() unmaps the file.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Map a file and index its line starts.
+
+        Args:
+            file_path (str): File to index
+        """
+        self.file_path = file_path
+        self._file = open(file_path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            self._map = b""
+
+        self.offsets = array("Q")
+        size = len(self._map)
+        pos = 0
+        while pos < size:
+            self.offsets.append(pos)
+            newline = self._map.find(b"\n", pos)
+            if newline < 0:
+                break
+            pos = newline + 1
+        self.size = size
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def line(self, line_num: int) -> str:
+        """
+        Return one line without its line ending.
+
+        Args:
+            line_num (int): 1-based line number
+
+        Returns:
+            str: The decoded line
+        """
+        start = self.offsets[line_num - 1]
+        end = self.offsets[line_num] if line_num < len(self.offsets) else self.size
+        return self._map[start:end].decode("utf-8").rstrip("\r\n")
+
+    def iter_lines(self, start: int = 1):
+        """
+        Yield (line_num, text) pairs from a given line to the end of the file.
+
+        Args:
+            start (int): 1-based line number to start from
+
+        Yields:
+            tuple: (line_num, text) for every line from start onwards
+        """
+        for line_num in range(max(1, start), len(self.offsets) + 1):
+            yield line_num, self.line(line_num)
+
+    def sha256(self) -> str:
+        """Hash the mapped file contents without copying them."""
+        return hashlib.sha256(self._map).hexdigest()
+
+    def close(self) -> None:
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
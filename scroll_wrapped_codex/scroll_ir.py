@@ -0,0 +1,117 @@
+# scroll_ir.py
+# Parse-once intermediate representation shared by every scroll executor.
+
+COMMENT = "#"
+
+
+class ScrollCommand:
+    """
+    A single parsed scroll line.
+
+    Attributes:
+        verb (str | None): Keyword before the first colon (e.g. "Build"),
+            COMMENT for "#" lines, or None when the line has no verb
+        args (str): Stripped text after the verb's colon (or the whole line)
+        line (int): 1-based line number in the original scroll
+        text (str): The stripped source line
+    """
+
+    __slots__ = ("verb", "args", "line", "text")
+
+    def __init__(self, verb, args: str, line: int, text: str):
+        self.verb = verb
+        self.args = args
+        self.line = line
+        self.text = text
+
+    def __repr__(self) -> str:
+        return f"ScrollCommand({self.verb!r}, {self.args!r}, line={self.line})"
+
+
+def parse_line(text: str, line: int = 0):
+    """
+    Parse one scroll line into a ScrollCommand.
+
+    Args:
+        text (str): Raw line from a .scroll file
+        line (int): 1-based line number of the line
+
+    Returns:
+        ScrollCommand | None: The parsed command, or None for blank lines
+    """
+    text = text.strip()
+    if not text:
+        return None
+
+    if text[0] == COMMENT:
+        return ScrollCommand(COMMENT, text[1:].strip(), line, text)
+
+    head, sep, rest = text.partition(":")
+    if sep and head.isidentifier():
+        return ScrollCommand(head, rest.strip(), line, text)
+
+    return ScrollCommand(None, text, line, text)
+
+
+def iter_scroll(source):
+    """
+    Lazily parse scroll lines into ScrollCommand nodes.
+
+    Args:
+        source: Scroll text, or any iterable of lines (e.g. an open file)
+
+    Yields:
+        ScrollCommand: One node per non-blank line, in source order
+    """
+    if isinstance(source, str):
+        source = source.splitlines()
+
+    for line_num, text in enumerate(source, 1):
+        command = parse_line(text, line_num)
+        if command is not None:
+            yield command
+
+
+def is_ir(source) -> bool:
+    """
+    Check whether a source is an already-parsed scroll IR list.
+
+    Args:
+        source: Any scroll source accepted by parse_scroll
+
+    Returns:
+        bool: True if the source is a list of ScrollCommand nodes
+    """
+    return isinstance(source, list) and (not source or isinstance(source[0], ScrollCommand))
+
+
+def parse_scroll(source) -> list:
+    """
+    Parse a whole scroll into its intermediate representation.
+
+    Passing an already-parsed list returns it unchanged, so consumers can
+    accept either raw scroll text or a shared IR.
+
+    Args:
+        source: Scroll text, an iterable of lines, or a parsed IR list
+
+    Returns:
+        list[ScrollCommand]: The parsed commands
+    """
+    if is_ir(source):
+        return source
+    return list(iter_scroll(source))
+
+
+def parse_scroll_file(file_path: str) -> list:
+    """
+    Read and parse a .scroll file in a single pass.
+
+    Args:
+        file_path (str): Path to the scroll file
+
+    Returns:
+        list[ScrollCommand]: The parsed commands
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        return list(iter_scroll(f))
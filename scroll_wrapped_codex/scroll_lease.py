@@ -0,0 +1,221 @@
+# scroll_lease.py
+# Lease files that let several watchers share one scroll folder.
+#
+# A scroll version (file name + content hash) is claimed by creating its lease
+# file with O_EXCL, which is atomic on local filesystems and NFSv3+. The holder
+# refreshes the lease's mtime while it works; a lease whose mtime is older than
+# the TTL belongs to a crashed watcher and may be taken over. Finished versions
+# leave a ".done" marker so no other watcher runs them again.
+#
+# reclaim_stale(), touch() and Heartbeat are the building blocks for any
+# mtime-heartbeat lock file; venv_pool uses them for template build locks.
+
+import os
+import json
+import time
+import socket
+import threading
+
+def reclaim_stale(path: str, ttl: float, owner: str) -> bool:
+    """
+    Take over a lock file whose mtime is older than ttl.
+
+    The stale file is moved aside with an atomic rename, so of several
+    processes reclaiming the same lock only one wins.
+
+    Args:
+        path (str): Lock file
+        ttl (float): Seconds without a heartbeat after which the lock is stale
+        owner (str): Identifier of the caller, unique among the contenders
+
+    Returns:
+        bool: True if the lock is gone and may be created again
+    """
+    try:
+        if time.time() - os.stat(path).st_mtime <= ttl:
+            return False
+        tombstone = f"{path}.stale.{owner.replace(os.sep, '_')}"
+        os.rename(path, tombstone)
+    except FileNotFoundError:
+        return True
+
+    try:
+        if time.time() - os.stat(tombstone).st_mtime <= ttl:
+            # We raced a fresh claim; put it back unless someone already replaced it
+            try:
+                os.link(tombstone, path)
+            except FileExistsError:
+                pass
+            return False
+        return True
+    finally:
+        try:
+            os.unlink(tombstone)
+        except FileNotFoundError:
+            pass
+
+def touch(path: str) -> bool:
+    """Refresh a held lock's mtime; returns False if the lock file is gone."""
+    try:
+        os.utime(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+class Heartbeat:
+    """Background thread that calls beat() every interval seconds until stopped."""
+
+    def __init__(self, interval: float, beat):
+        self.interval = interval
+        self.beat = beat
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> "Heartbeat":
+        """Start the thread (a no-op if it is already running)."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.beat()
+
+    def stop(self) -> None:
+        """Stop the thread and wait for it to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "Heartbeat":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+class LeaseManager:
+    """
+    Claims scroll versions in a shared lease directory.
+
+    Clocks of the participating hosts only need to agree to well within ttl.
+    """
+
+    def __init__(self, lease_dir: str, ttl: float = 60.0, owner: str = None):
+        """
+        Initialize the manager.
+
+        Args:
+            lease_dir (str): Directory holding lease and done files (created if missing)
+            ttl (float): Seconds without a heartbeat after which a lease is stale
+            owner (str): Identifier written into leases (defaults to host:pid)
+        """
+        self.lease_dir = lease_dir
+        self.ttl = ttl
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}"
+        self.held = set()
+        self.reclaimed = 0
+        self._lock = threading.Lock()
+        self._heartbeat = Heartbeat(ttl / 3, self.renew)
+        os.makedirs(lease_dir, exist_ok=True)
+
+    def _path(self, name: str, digest: str, kind: str) -> str:
+        return os.path.join(self.lease_dir, f"{name}.{digest}.{kind}")
+
+    def is_done(self, name: str, digest: str) -> bool:
+        """Return True if some watcher already executed this version."""
+        return os.path.exists(self._path(name, digest, "done"))
+
+    def acquire(self, name: str, digest: str) -> bool:
+        """
+        Try to claim a scroll version.
+
+        Args:
+            name (str): Scroll file name
+            digest (str): Content hash of the version to execute
+
+        Returns:
+            bool: True if this process now holds the lease
+        """
+        path = self._path(name, digest, "lease")
+        for _ in range(2):
+            try:
+                fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                if not reclaim_stale(path, self.ttl, self.owner):
+                    return False
+                self.reclaimed += 1
+                continue
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"owner": self.owner, "acquired": time.time()}, f)
+
+            # The previous holder may have finished between is_done() and our claim
+            if self.is_done(name, digest):
+                os.unlink(path)
+                return False
+            with self._lock:
+                self.held.add(path)
+            return True
+        return False
+
+    def remaining(self, name: str, digest: str) -> float:
+        """Return seconds until another holder's lease on this version goes stale."""
+        try:
+            age = time.time() - os.stat(self._path(name, digest, "lease")).st_mtime
+        except FileNotFoundError:
+            return 0.0
+        return max(0.0, self.ttl - age)
+
+    def release(self, name: str, digest: str, done: bool = True) -> None:
+        """
+        Give up a lease, marking the version done when it executed successfully.
+
+        Older done markers for the same scroll are removed.
+        """
+        path = self._path(name, digest, "lease")
+        if done:
+            done_path = self._path(name, digest, "done")
+            with open(done_path, "w", encoding="utf-8") as f:
+                json.dump({"owner": self.owner, "finished": time.time()}, f)
+            prefix, suffix = f"{name}.", ".done"
+            for entry in os.listdir(self.lease_dir):
+                stale_hash = entry[len(prefix):-len(suffix)]
+                if (entry.startswith(prefix) and entry.endswith(suffix)
+                        and len(stale_hash) == len(digest) and stale_hash != digest):
+                    try:
+                        os.unlink(os.path.join(self.lease_dir, entry))
+                    except FileNotFoundError:
+                        pass
+
+        with self._lock:
+            self.held.discard(path)
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+    def renew(self) -> None:
+        """Refresh the mtime of every held lease."""
+        with self._lock:
+            held = list(self.held)
+        for path in held:
+            if not touch(path):
+                with self._lock:
+                    self.held.discard(path)
+
+    def start(self) -> None:
+        """Start the heartbeat thread that renews held leases every ttl/3 seconds."""
+        self._heartbeat.start()
+
+    def close(self) -> None:
+        """Stop the heartbeat and drop any leases still held."""
+        self._heartbeat.stop()
+        with self._lock:
+            held, self.held = self.held, set()
+        for path in held:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,116 @@
+# scroll_trace.py
+# Timing spans for scroll executions, exported as Chrome trace JSON.
+#
+# A Tracer collects complete ("X") events; nesting follows from timestamps on
+# the same thread, which is how chrome://tracing and ui.perfetto.dev draw it.
+# Code deep in the call stack (file writes, pip runs) opens spans with the
+# module-level span(), which records into whatever tracer is active in the
+# current context and costs almost nothing when none is.
+
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+_active = contextvars.ContextVar("scroll_tracer", default=None)
+
+class Tracer:
+    """Collects timing spans for one execution."""
+
+    def __init__(self, name: str = "scroll"):
+        """
+        Initialize the tracer.
+
+        Args:
+            name (str): Process name shown in the trace viewer
+        """
+        self.name = name
+        self.events = []
+        self._origin = time.perf_counter_ns()
+        self._threads = {}
+
+    def _now_us(self) -> float:
+        return (time.perf_counter_ns() - self._origin) / 1000
+
+    @contextmanager
+    def span(self, name: str, cat: str = "scroll", **args):
+        """
+        Time the enclosed block as one span.
+
+        Args:
+            name (str): Span name (e.g. "Build")
+            cat (str): Category, used for filtering in the viewer
+            **args: Extra details shown for the span
+        """
+        thread = threading.current_thread()
+        self._threads.setdefault(thread.ident, thread.name)
+        start = self._now_us()
+        try:
+            yield
+        finally:
+            # list.append is atomic, so worker threads can record concurrently
+            self.events.append({
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": start,
+                "dur": self._now_us() - start,
+                "pid": os.getpid(),
+                "tid": thread.ident,
+                "args": args,
+            })
+
+    @contextmanager
+    def activate(self):
+        """Make this tracer the one span() records into for the enclosed block."""
+        token = _active.set(self)
+        try:
+            yield self
+        finally:
+            _active.reset(token)
+
+    def durations(self, cat: str = None) -> list:
+        """
+        Return (name, seconds, args) for each recorded span, slowest first.
+
+        Args:
+            cat (str): Only include spans of this category
+        """
+        events = [e for e in self.events if cat is None or e["cat"] == cat]
+        return [(e["name"], e["dur"] / 1e6, e["args"])
+                for e in sorted(events, key=lambda e: e["dur"], reverse=True)]
+
+    def to_chrome_trace(self) -> dict:
+        """Return the spans in Chrome trace event format."""
+        pid = os.getpid()
+        metadata = [{"name": "process_name", "ph": "M", "pid": pid, "args": {"name": self.name}}]
+        metadata += [{"name": "thread_name", "ph": "M", "pid": pid, "tid": ident, "args": {"name": name}}
+                     for ident, name in self._threads.items()]
+        return {"traceEvents": metadata + sorted(self.events, key=lambda e: e["ts"]),
+                "displayTimeUnit": "ms"}
+
+    def export(self, path: str) -> str:
+        """
+        Write the trace as JSON for chrome://tracing or ui.perfetto.dev.
+
+        Returns:
+            str: path
+        """
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+        os.replace(tmp, path)
+        return path
+
+def current_tracer():
+    """Return the tracer active in this context, or None."""
+    return _active.get()
+
+def span(name: str, cat: str = "scroll", **args):
+    """Open a span on the active tracer; a no-op when nothing is being traced."""
+    tracer = _active.get()
+    if tracer is None:
+        return nullcontext()
+    return tracer.span(name, cat, **args)
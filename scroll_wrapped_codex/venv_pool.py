@@ -0,0 +1,277 @@
+# venv_pool.py
+# Pool of pre-warmed per-project virtualenvs keyed by a lock hash.
+#
+# A project's requirements are normalized into a lock hash. The first request
+# for a hash builds a template virtualenv and installs the requirements into
+# it once; every environment handed out afterwards is a clone whose
+# site-packages files are hardlinks into the template, so setting up a known
+# project shape costs a few filesystem operations instead of a pip run.
+#
+# Layout under the pool root:
+#   templates/<hash>/        template env (".ready" once every requirement installed)
+#   templates/<hash>.lock    held by the process building the template; its
+#                            mtime is refreshed while the build runs, so a lock
+#                            left by a killed builder goes stale and is reclaimed
+#   envs/<hash>/<id>/        clones (".available" until handed out)
+
+import hashlib
+import json
+import os
+import platform
+import shutil
+import sys
+import threading
+import time
+import uuid
+
+from .package_installer import dedupe_requirements, install_requirements
+from .scroll_lease import Heartbeat, reclaim_stale, touch
+
+DEFAULT_POOL_DIR = os.environ.get(
+    "SCROLL_VENV_POOL",
+    os.path.join(os.path.expanduser("~"), ".cache", "scrollwrappedcodex", "venvs"),
+)
+
+def lock_hash(requirements, python_tag: str = None) -> str:
+    """
+    Hash a dependency set together with the interpreter it is installed for.
+
+    Requirements are normalized and sorted, so order, case and duplicates
+    do not change the hash.
+
+    Args:
+        requirements: Iterable of requirement strings
+        python_tag (str): Interpreter identity (defaults to this interpreter's
+            implementation, version and platform)
+
+    Returns:
+        str: Hex lock hash
+    """
+    if python_tag is None:
+        python_tag = f"{platform.python_implementation()}-{sys.version_info[0]}.{sys.version_info[1]}-{sys.platform}-{platform.machine()}"
+    payload = json.dumps({"python": python_tag, "requirements": sorted(dedupe_requirements(requirements))})
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+def env_python(env_dir: str) -> str:
+    """Return the interpreter path inside a virtualenv."""
+    if sys.platform == "win32":
+        return os.path.join(env_dir, "Scripts", "python.exe")
+    return os.path.join(env_dir, "bin", "python")
+
+def _site_packages(env_dir: str) -> str:
+    if sys.platform == "win32":
+        return os.path.join(env_dir, "Lib", "site-packages")
+    return os.path.join(env_dir, "lib", f"python{sys.version_info[0]}.{sys.version_info[1]}", "site-packages")
+
+class VenvPool:
+    """Hands out ready virtualenvs for a dependency set, cloning them from templates."""
+
+    def __init__(self, root: str = None, logger=None, mode: str = None, wheelhouse=None,
+                 build_timeout: float = 1800, lock_ttl: float = 60.0):
+        """
+        Initialize the pool.
+
+        Args:
+            root (str): Pool directory (defaults to SCROLL_VENV_POOL or
+                ~/.cache/scrollwrappedcodex/venvs)
+            logger: Logger for progress messages
+            mode (str): Gather mode used when building templates (see wheelhouse.py)
+            wheelhouse: Wheelhouse used when building templates
+            build_timeout (float): Seconds to wait for another process building a template
+            lock_ttl (float): Seconds without a heartbeat after which a build lock is stale
+        """
+        self.root = root or DEFAULT_POOL_DIR
+        self.logger = logger
+        self.mode = mode
+        self.wheelhouse = wheelhouse
+        self.build_timeout = build_timeout
+        self.lock_ttl = lock_ttl
+
+    def _log(self, message: str) -> None:
+        if self.logger:
+            self.logger.info(message)
+
+    def template(self, requirements) -> tuple:
+        """
+        Return the template env for a dependency set, building it on first use.
+
+        Only one process builds a given template; others wait for its
+        ".ready" marker, taking over the build if the builder's lock goes
+        stale. A template whose installs did not all succeed is discarded,
+        so the next call builds it again.
+
+        Args:
+            requirements: Iterable of requirement strings
+
+        Returns:
+            tuple: (template_dir, per-requirement install results); template_dir
+            is None if the build failed
+        """
+        requirements = dedupe_requirements(requirements)
+        digest = lock_hash(requirements)
+        template_dir = os.path.join(self.root, "templates", digest)
+        ready = os.path.join(template_dir, ".ready")
+        lock = f"{template_dir}.lock"
+        os.makedirs(os.path.dirname(template_dir), exist_ok=True)
+
+        deadline = time.monotonic() + self.build_timeout
+        while not os.path.exists(ready):
+            try:
+                fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                if reclaim_stale(lock, self.lock_ttl, f"{os.getpid()}.{threading.get_ident()}"):
+                    self._log(f"🧹 Reclaimed stale build lock for template {digest}")
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Timed out waiting for template {digest}")
+                time.sleep(0.2)
+                continue
+            os.close(fd)
+
+            try:
+                # Keep the lock fresh while pip runs so waiters do not take it over
+                with Heartbeat(self.lock_ttl / 3, lambda: touch(lock)):
+                    if not os.path.exists(ready):
+                        results = self._build_template(template_dir, requirements)
+                        if results is not None:
+                            return None, results
+            finally:
+                try:
+                    os.unlink(lock)
+                except FileNotFoundError:
+                    pass
+
+        with open(ready, "r", encoding="utf-8") as f:
+            return template_dir, json.load(f)["results"]
+
+    def _build_template(self, template_dir: str, requirements: list):
+        # Returns None once the template is ready, or the results of a failed build
+        import venv
+
+        self._log(f"🧪 Building template environment {os.path.basename(template_dir)}")
+        if os.path.exists(template_dir):
+            shutil.rmtree(template_dir)
+        venv.EnvBuilder(with_pip=True, symlinks=(os.name != "nt")).create(template_dir)
+
+        results = {}
+        if requirements:
+            results = install_requirements(requirements, python=env_python(template_dir), logger=self.logger,
+                                           mode=self.mode, wheelhouse=self.wheelhouse)
+
+        failed = [requirement for requirement in requirements if not results.get(requirement)]
+        if failed:
+            self._log(f"❌ Discarding template {os.path.basename(template_dir)}: failed to install {' '.join(failed)}")
+            shutil.rmtree(template_dir, ignore_errors=True)
+            return results
+
+        with open(os.path.join(template_dir, ".ready"), "w", encoding="utf-8") as f:
+            json.dump({"requirements": requirements, "results": results}, f)
+        return None
+
+    def clone(self, template_dir: str, dest: str) -> str:
+        """
+        Create a virtualenv at dest whose site-packages hardlink the template's.
+
+        Args:
+            template_dir (str): Ready template environment
+            dest (str): New environment directory
+
+        Returns:
+            str: dest
+        """
+        import venv
+
+        venv.EnvBuilder(with_pip=False, symlinks=(os.name != "nt")).create(dest)
+
+        src_site, dst_site = _site_packages(template_dir), _site_packages(dest)
+        for dirpath, dirnames, filenames in os.walk(src_site):
+            target_dir = os.path.join(dst_site, os.path.relpath(dirpath, src_site))
+            os.makedirs(target_dir, exist_ok=True)
+            for name in filenames:
+                _link_or_copy(os.path.join(dirpath, name), os.path.join(target_dir, name))
+
+        # Console scripts name the template's interpreter in their shebang
+        src_bin, dst_bin = os.path.dirname(env_python(template_dir)), os.path.dirname(env_python(dest))
+        for name in os.listdir(src_bin):
+            target = os.path.join(dst_bin, name)
+            source = os.path.join(src_bin, name)
+            if os.path.exists(target) or os.path.islink(source) or not os.path.isfile(source):
+                continue
+            with open(source, "rb") as f:
+                content = f.read()
+            if content.startswith(b"#!"):
+                content = content.replace(os.fsencode(template_dir), os.fsencode(dest))
+                with open(target, "wb") as f:
+                    f.write(content)
+                shutil.copymode(source, target)
+            else:
+                _link_or_copy(source, target)
+        return dest
+
+    def prewarm(self, requirements, count: int = 1) -> int:
+        """
+        Make sure at least count unclaimed clones exist for a dependency set.
+
+        Returns:
+            int: Number of clones created
+        """
+        template_dir, _ = self.template(requirements)
+        if template_dir is None:
+            return 0
+        env_root = os.path.join(self.root, "envs", os.path.basename(template_dir))
+        os.makedirs(env_root, exist_ok=True)
+        available = sum(1 for name in os.listdir(env_root)
+                        if os.path.exists(os.path.join(env_root, name, ".available")))
+
+        created = 0
+        for _ in range(max(0, count - available)):
+            dest = self.clone(template_dir, os.path.join(env_root, uuid.uuid4().hex[:12]))
+            open(os.path.join(dest, ".available"), "w").close()
+            created += 1
+        return created
+
+    def acquire(self, requirements) -> tuple:
+        """
+        Hand out a ready environment for a dependency set.
+
+        A pre-warmed clone is claimed when one is available (renaming its
+        marker is atomic, so two processes never get the same env); otherwise
+        a new clone is made from the template.
+
+        Args:
+            requirements: Iterable of requirement strings
+
+        Returns:
+            tuple: (env_dir, per-requirement install results); env_dir is None
+            if some requirement could not be installed
+        """
+        template_dir, results = self.template(requirements)
+        if template_dir is None:
+            return None, results
+        env_root = os.path.join(self.root, "envs", os.path.basename(template_dir))
+        os.makedirs(env_root, exist_ok=True)
+
+        for name in os.listdir(env_root):
+            env_dir = os.path.join(env_root, name)
+            try:
+                os.rename(os.path.join(env_dir, ".available"), os.path.join(env_dir, ".claimed"))
+            except OSError:
+                continue
+            self._log(f"♻️ Reusing pre-warmed environment {env_dir}")
+            return env_dir, results
+
+        env_dir = self.clone(template_dir, os.path.join(env_root, uuid.uuid4().hex[:12]))
+        open(os.path.join(env_dir, ".claimed"), "w").close()
+        self._log(f"🧬 Cloned environment {env_dir}")
+        return env_dir, results
+
+    def release(self, env_dir: str) -> None:
+        """Delete a handed-out environment; clones are never returned to the pool dirty."""
+        shutil.rmtree(env_dir, ignore_errors=True)
+
+def _link_or_copy(source: str, target: str) -> None:
+    try:
+        os.link(source, target)
+    except OSError:
+        # Different filesystem or no hardlink support
+        shutil.copy2(source, target)
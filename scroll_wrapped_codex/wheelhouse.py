@@ -0,0 +1,140 @@
+# wheelhouse.py
+# Local wheel cache so Gather can install without touching a package index.
+#
+# Gather modes (SCROLL_GATHER_MODE):
+#   online     - plain pip install from the configured index (default)
+#   wheelhouse - build missing wheels into the wheelhouse once, then install
+#                from it with --no-index
+#   offline    - install from the wheelhouse only; never contact an index
+#
+# Prefetch on a networked host with
+#   python -m scroll_wrapped_codex.wheelhouse prefetch -r requirements.txt
+# and copy the directory to build hosts that have no network.
+
+import os
+import subprocess
+import sys
+
+from .scroll_trace import span
+
+GATHER_MODES = ("online", "wheelhouse", "offline")
+
+DEFAULT_WHEELHOUSE = os.environ.get(
+    "SCROLL_WHEELHOUSE",
+    os.path.join(os.path.expanduser("~"), ".cache", "scrollwrappedcodex", "wheelhouse"),
+)
+
+class Wheelhouse:
+    """A directory of built wheels used as pip's only package source."""
+
+    def __init__(self, path: str = None):
+        """
+        Initialize the wheelhouse.
+
+        Args:
+            path (str): Wheel directory (defaults to SCROLL_WHEELHOUSE or
+                ~/.cache/scrollwrappedcodex/wheelhouse)
+        """
+        self.path = path or DEFAULT_WHEELHOUSE
+
+    def pip_install_args(self) -> list:
+        """Arguments that make pip install from this wheelhouse only."""
+        return ["--no-index", "--find-links", self.path]
+
+    def wheels(self) -> list:
+        """Return the wheel file names currently in the wheelhouse."""
+        try:
+            return sorted(name for name in os.listdir(self.path) if name.endswith(".whl"))
+        except FileNotFoundError:
+            return []
+
+    def prefetch(self, requirements, python: str = None, timeout: float = 1800,
+                 requirements_file: str = None, logger=None) -> bool:
+        """
+        Make sure wheels for requirements and their dependencies are present.
+
+        A first offline `pip wheel` pass succeeds without any download when
+        everything is cached already; only otherwise is the index contacted.
+
+        Args:
+            requirements: Requirement strings to build wheels for
+            python (str): Interpreter whose pip is used (defaults to sys.executable)
+            timeout (float): Seconds allowed for each pip invocation
+            requirements_file (str): Optional requirements.txt to include
+            logger: Logger for progress messages
+
+        Returns:
+            bool: True if every requirement is available in the wheelhouse
+        """
+        requirements = list(requirements)
+        if requirements_file:
+            requirements += ["-r", requirements_file]
+        if not requirements:
+            return True
+
+        os.makedirs(self.path, exist_ok=True)
+        base_cmd = [python or sys.executable, "-m", "pip", "wheel", "--wheel-dir", self.path,
+                    "--find-links", self.path]
+
+        for extra, label in ((["--no-index"], "cached"), ([], "index")):
+            try:
+                with span("pip wheel", "subprocess", source=label, requirements=requirements):
+                    proc = subprocess.run(base_cmd + extra + requirements, capture_output=True,
+                                          text=True, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                if logger:
+                    logger.error(f"⏰ Timeout building wheels from {label}")
+                continue
+            if proc.returncode == 0:
+                if logger:
+                    logger.info(f"🛞 Wheelhouse ready ({label}): {self.path}")
+                return True
+
+        if logger:
+            logger.warning(f"⚠️ Could not prefetch every wheel into {self.path}")
+        return False
+
+def gather_mode_from_env(environ=None) -> str:
+    """
+    Read the Gather mode from SCROLL_GATHER_MODE.
+
+    Returns:
+        str: One of GATHER_MODES ("online" when unset)
+
+    Raises:
+        ValueError: If the variable names an unknown mode
+    """
+    environ = os.environ if environ is None else environ
+    mode = (environ.get("SCROLL_GATHER_MODE") or "online").strip().lower()
+    if mode not in GATHER_MODES:
+        raise ValueError(f"SCROLL_GATHER_MODE must be one of {', '.join(GATHER_MODES)}, not {mode!r}")
+    return mode
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m scroll_wrapped_codex.wheelhouse",
+                                     description="Manage the local Gather wheelhouse")
+    parser.add_argument("--wheelhouse", default=None, help=f"wheel directory (default: {DEFAULT_WHEELHOUSE})")
+    sub = parser.add_subparsers(dest="command", required=True)
+    prefetch = sub.add_parser("prefetch", help="download and build wheels for requirements")
+    prefetch.add_argument("requirements", nargs="*")
+    prefetch.add_argument("-r", "--requirement", dest="requirements_file", default=None)
+    sub.add_parser("list", help="list cached wheels")
+    args = parser.parse_args()
+
+    wheelhouse = Wheelhouse(args.wheelhouse)
+    if args.command == "list":
+        for name in wheelhouse.wheels():
+            print(name)
+        return
+
+    import logging
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    ok = wheelhouse.prefetch(args.requirements, requirements_file=args.requirements_file,
+                             logger=logging.getLogger(__name__))
+    print(f"🛞 {len(wheelhouse.wheels())} wheels in {wheelhouse.path}")
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
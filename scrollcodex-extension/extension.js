@@ -1,10 +1,56 @@
 const vscode = require('vscode');
 const { exec } = require('child_process');
+const net = require('net');
+const os = require('os');
+const path = require('path');
+
+// Must match scroll_wrapped_codex.scroll_daemon.default_socket_path()
+function daemonSocketPath() {
+    if (process.env.SCROLL_DAEMON_SOCKET) {
+        return process.env.SCROLL_DAEMON_SOCKET;
+    }
+    const uid = typeof process.getuid === 'function' ? process.getuid() : 'user';
+    return path.join(os.tmpdir(), `scrollcodex-${uid}.sock`);
+}
+
+// Ask a warm `scrollfile --serve` daemon to run the file; resolves null when none is listening
+function runOnDaemon(filePath) {
+    return new Promise((resolve) => {
+        const socket = net.createConnection(daemonSocketPath());
+        let buffer = '';
+
+        socket.on('connect', () => {
+            socket.write(JSON.stringify({ op: 'run_file', path: filePath }) + '\n');
+        });
+        socket.on('data', (chunk) => {
+            buffer += chunk.toString('utf8');
+            const newline = buffer.indexOf('\n');
+            if (newline !== -1) {
+                socket.end();
+                try {
+                    const response = JSON.parse(buffer.slice(0, newline));
+                    resolve(response.ok ? response.output.join('\n') : response.error);
+                } catch (e) {
+                    resolve(null);
+                }
+            }
+        });
+        socket.on('error', () => resolve(null));
+        socket.on('close', () => resolve(null));
+    });
+}
 
 function activate(context) {
-    let disposable = vscode.commands.registerCommand('scrollcodex.runScroll', function () {
+    let disposable = vscode.commands.registerCommand('scrollcodex.runScroll', async function () {
         const editor = vscode.window.activeTextEditor;
         const filePath = editor.document.fileName;
+
+        const output = await runOnDaemon(filePath);
+        if (output !== null) {
+            vscode.window.showInformationMessage(output);
+            return;
+        }
+
         exec(`python run_scroll_file.py "${filePath}"`, (err, stdout, stderr) => {
             vscode.window.showInformationMessage(stdout || stderr);
         });
@@ -12,4 +58,4 @@ function activate(context) {
 
     context.subscriptions.push(disposable);
 }
-exports.activate = activate; 
\ No newline at end of file
+exports.activate = activate;
@@ -12,6 +12,8 @@ import re
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+from scroll_wrapped_codex.scroll_ir import parse_scroll
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -243,8 +245,8 @@ class ScrollExecutor:
 class ScrollParser:
     """Parse scroll content into structured commands"""
     
-    def parse(self, scroll_content: str) -> Dict[str, Any]:
-        """Parse scroll content into structured format"""
+    def parse(self, scroll_content) -> Dict[str, Any]:
+        """Parse scroll content (text or parsed scroll IR) into structured format"""
         
         parsed = {
             "scroll_id": self._generate_scroll_id(),
@@ -252,26 +254,20 @@ class ScrollParser:
             "commands": []
         }
         
-        lines = scroll_content.strip().split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
+        for command in parse_scroll(scroll_content):
+            verb = command.verb
             
             # Parse Anoint command
-            if line.startswith('Anoint:'):
-                target = line.replace('Anoint:', '').strip()
-                parsed["anoint"] = {"target": target}
+            if verb == 'Anoint':
+                parsed["anoint"] = {"target": command.args}
             
             # Parse Build command
-            elif line.startswith('Build:'):
-                target = line.replace('Build:', '').strip()
-                parsed["build"] = {"target": target, "components": []}
+            elif verb == 'Build':
+                parsed["build"] = {"target": command.args, "components": []}
             
             # Parse Seal command
-            elif line.startswith('Seal:'):
-                seal_text = line.replace('Seal:', '').strip()
+            elif verb == 'Seal':
+                seal_text = command.args
                 seal_level = self._extract_seal_level(seal_text)
                 security_checks = self._extract_security_checks(seal_text)
                 parsed["seal"] = {
@@ -281,9 +277,8 @@ class ScrollParser:
                 parsed["flame_level"] = seal_level
             
             # Parse Judge command
-            elif line.startswith('Judge:'):
-                criteria = line.replace('Judge:', '').strip()
-                parsed["judge"] = {"criteria": criteria, "target": "System"}
+            elif verb == 'Judge':
+                parsed["judge"] = {"criteria": command.args, "target": "System"}
         
         return parsed
     
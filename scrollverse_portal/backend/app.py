@@ -8,7 +8,7 @@ from fastapi import FastAPI, HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 import jwt
 import sqlite3
 import json
@@ -40,6 +40,11 @@ class UserRegister(BaseModel):
 class ScrollExecution(BaseModel):
     scroll_code: str
 
+class ScrollExport(BaseModel):
+    scroll_code: str
+    format: str = "zip"
+    project_name: Optional[str] = None
+
 class AgentChat(BaseModel):
     message: str
 
@@ -352,6 +357,27 @@ async def execute_scroll_code(scroll_code: str) -> str:
     
     return "\n".join(output_lines)
 
+@app.post("/api/export_scroll")
+def export_scroll(export_data: ScrollExport, user_id: int = Depends(verify_token)):
+    """Download the project a scroll would generate as a zip/tar, streamed without touching disk"""
+    from scroll_wrapped_codex.scroll_archive import ARCHIVE_FORMATS, archive_filename, archive_media_type
+    from scroll_executor_patch.scroll_executor_hook import ScrollExecutorHook
+    
+    if export_data.format not in ARCHIVE_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of {', '.join(ARCHIVE_FORMATS)}")
+    
+    project_name, chunks = ScrollExecutorHook().export_scroll_archive(
+        export_data.scroll_code, export_data.format, export_data.project_name
+    )
+    filename = archive_filename(project_name, export_data.format)
+    # A sync endpoint runs on Starlette's thread pool, and so does iterating a plain generator,
+    # so neither parsing nor rendering happens on the event loop
+    return StreamingResponse(
+        chunks,
+        media_type=archive_media_type(export_data.format),
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
 @app.post("/api/agent/chat")
 async def agent_chat(chat_data: AgentChat, user_id: int = Depends(verify_token)):
     """Chat with ScrollAgent"""
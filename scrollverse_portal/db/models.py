@@ -6,6 +6,7 @@ SQLite models for Users, Scrolls, and Flame tokens
 
 import sqlite3
 import json
+import threading
 from typing import Dict, List, Optional
 from datetime import datetime
 from pathlib import Path
@@ -368,5 +369,21 @@ class DatabaseManager:
         finally:
             conn.close()
 
-# Initialize database
-db = DatabaseManager() 
\ No newline at end of file
+# Database is initialized on first access to `db`, so importing this module never touches disk
+_db = None
+_db_lock = threading.Lock()
+
+def get_db() -> DatabaseManager:
+    """Return the shared DatabaseManager, creating the schema on first use"""
+    global _db
+    if _db is None:
+        # Two threads racing on first access must not both build a manager
+        with _db_lock:
+            if _db is None:
+                _db = DatabaseManager()
+    return _db
+
+def __getattr__(name):
+    if name == "db":
+        return get_db()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,84 +4,243 @@ ScrollVerse Execution Engine
 Wraps ScribeCodex and handles package installation and folder creation
 """
 
-import subprocess
 import os
 import sys
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import json
+import hashlib
 import logging
 from datetime import datetime
 
+from scroll_wrapped_codex.scroll_ir import parse_line, parse_scroll
+from scroll_wrapped_codex.scroll_index import LineIndex
+from scroll_wrapped_codex.scroll_checkpoint import ExecutionCheckpoint
+from scroll_wrapped_codex.package_installer import install_requirements, normalize_requirement
+from scroll_wrapped_codex.scroll_trace import Tracer, span
+from scroll_wrapped_codex.build_manifest import BuildManifest
+
+# Verbs whose result depends on earlier commands of the given verbs. When one
+# of those changes, later commands of the dependent verb run again, and the
+# parallel scheduler never starts a command before those earlier ones finish.
+COMMAND_DEPENDENCIES = {
+    "Build": ("Anoint",),
+    "Deploy": ("Anoint", "Build", "Gather"),
+}
+
+# Extra ordering the parallel scheduler keeps without affecting incremental
+# reuse: Gathers share requirements.txt and one batched pip run, and Deploys
+# go out in the order they are written.
+STEP_ORDERING = {
+    "Gather": ("Gather",),
+    "Deploy": ("Deploy",),
+}
+
+def step_dependencies(commands: List) -> List[set]:
+    """
+    Build the dependency graph of a scroll's steps.
+
+    Args:
+        commands: Parsed scroll IR
+
+    Returns:
+        list[set]: For each command, the indices of earlier commands it must wait for
+    """
+    seen = {}
+    graph = []
+    for index, command in enumerate(commands):
+        deps = set()
+        for verb in COMMAND_DEPENDENCIES.get(command.verb, ()) + STEP_ORDERING.get(command.verb, ()):
+            deps.update(seen.get(verb, ()))
+        graph.append(deps)
+        seen.setdefault(command.verb, []).append(index)
+    return graph
+
+def plan_incremental(old_commands: List, new_commands: List, old_outputs: List[Dict]) -> List[Optional[int]]:
+    """
+    Decide which commands of a new scroll version can reuse earlier results.
+
+    Commands are matched by (verb, args) with difflib, so edits, insertions
+    and deletions anywhere keep the untouched commands matched. A matched
+    command still runs again when its previous result was an error, or when
+    an earlier command it depends on was added, changed or removed.
+
+    Args:
+        old_commands: IR of the previously executed version
+        new_commands: IR of the version about to run
+        old_outputs: Handler results of the previous version, one per old command
+
+    Returns:
+        list: For each new command, the index of the old result to reuse, or None to run it
+    """
+    from difflib import SequenceMatcher
+
+    old_keys = [(c.verb, c.args) for c in old_commands]
+    new_keys = [(c.verb, c.args) for c in new_commands]
+    plan = [None] * len(new_commands)
+    changed_verbs = set()
+
+    for tag, i1, i2, j1, j2 in SequenceMatcher(None, old_keys, new_keys, autojunk=False).get_opcodes():
+        if tag != "equal":
+            # Removed commands invalidate their dependents just like changed ones
+            changed_verbs.update(c.verb for c in old_commands[i1:i2])
+            changed_verbs.update(c.verb for c in new_commands[j1:j2])
+            continue
+        for offset in range(i2 - i1):
+            command = new_commands[j1 + offset]
+            stale = changed_verbs.intersection(COMMAND_DEPENDENCIES.get(command.verb, ()))
+            if stale or old_outputs[i1 + offset].get("status") == "error":
+                changed_verbs.add(command.verb)
+            else:
+                plan[j1 + offset] = i1 + offset
+    return plan
+
+def _completed(result: Dict) -> bool:
+    """Whether a command needs no retry on resume (unknown commands would only fail again)"""
+    return result.get("status") != "error" or result.get("type") == "unknown"
+
 class ScrollExecutionEngine:
     """Sacred scroll execution engine"""
     
-    def __init__(self):
+    def __init__(self, gather_mode: str = None, wheelhouse: str = None):
+        """
+        Args:
+            gather_mode: "online", "wheelhouse" or "offline" package installs
+                for Gather (defaults to SCROLL_GATHER_MODE)
+            wheelhouse: Local wheel cache directory (defaults to SCROLL_WHEELHOUSE)
+        """
         self.base_path = Path.cwd()
+        self.gather_mode = gather_mode
+        self.wheelhouse = wheelhouse
         self.log_file = "scroll_execution_log.txt"
+        # scroll_id -> (commands, outputs) of the last execution, for incremental runs
+        self.last_runs = {}
+        # Timing spans of the last execution (scroll_trace.Tracer)
+        self.last_trace = None
+        # Content hashes of generated files per base path, so unchanged ones are not rewritten
+        self._manifests = {}
+        # Gather lines of the scroll being executed, installed together on first use
+        self._gather_packages = {}
+        self._gather_results = None
+        # Every package the scroll gathers, written to requirements.txt as one list
+        self._requirements = []
         self.setup_logging()
     
+    @property
+    def manifest(self) -> BuildManifest:
+        """Build manifest of the current base path, kept in that directory"""
+        key = str(self.base_path)
+        manifest = self._manifests.get(key)
+        if manifest is None:
+            manifest = self._manifests[key] = BuildManifest(self.base_path)
+        return manifest
+    
     def setup_logging(self):
         """Setup logging for execution engine"""
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(levelname)s - %(message)s',
             handlers=[
-                logging.FileHandler(self.log_file),
+                # delay=True defers opening the log until the first record
+                logging.FileHandler(self.log_file, delay=True),
                 logging.StreamHandler(sys.stdout)
             ]
         )
         self.logger = logging.getLogger(__name__)
     
-    def execute_scroll(self, scroll_code: str, user_id: int = None) -> Dict:
-        """Execute a scroll and return results"""
+    def execute_scroll(self, scroll_code, user_id: int = None, incremental: bool = False,
+                       scroll_id: str = "default", checkpoint: str = None,
+                       resume: bool = False, parallel: bool = False, max_workers: int = 4,
+                       trace: str = None) -> Dict:
+        """
+        Execute a scroll (text or parsed scroll IR) and return results.
+
+        With incremental=True the scroll is diffed against the last version
+        executed under the same scroll_id, and only changed commands plus the
+        later commands that depend on them (see COMMAND_DEPENDENCIES) are run;
+        every other command reuses its previous result.
+
+        With a checkpoint path every finished command is recorded there, and
+        resume=True skips the commands an interrupted run of the same scroll
+        already completed. The checkpoint is deleted once the scroll finishes.
+
+        Generated files are only rewritten when their content changes (see
+        BuildManifest); results["files_written"] and results["files_skipped"]
+        report the split.
+
+        With parallel=True independent steps run on a pool of max_workers
+        threads: each step starts as soon as the earlier steps it depends on
+        (step_dependencies) are done, so a slow Gather no longer holds up
+        Builds. Results are still reported in scroll order.
+
+        Every step is timed (with sub-spans for file writes and pip runs);
+        results["step_times"] lists the slowest steps first, and the full
+        trace is kept in self.last_trace and written as Chrome trace JSON
+        to the trace path when one is given.
+        """
         self.logger.info(f"🔥 Starting scroll execution for user {user_id}")
         
-        results = {
-            "success": True,
-            "output": [],
-            "errors": [],
-            "files_created": [],
-            "packages_installed": [],
-            "execution_time": None
-        }
-        
+        results = self._new_results()
         start_time = datetime.now()
+        tracker = None
+        tracer = self.last_trace = Tracer(f"scroll {scroll_id}")
+        self.manifest.reset_counts()
         
         try:
-            lines = scroll_code.strip().split('\n')
-            
-            for line_num, line in enumerate(lines, 1):
-                line = line.strip()
-                if not line:
-                    continue
+            with tracer.activate(), tracer.span("execute_scroll", "scroll", scroll_id=scroll_id):
+                with span("parse", "scroll"):
+                    commands = parse_scroll(scroll_code)
+                previous = self.last_runs.get(scroll_id) if incremental else None
+                plan = plan_incremental(previous[0], commands, previous[1]) if previous else [None] * len(commands)
+                
+                done = []
+                if checkpoint:
+                    source_hash = hashlib.sha256("\n".join(c.text for c in commands).encode("utf-8")).hexdigest()
+                    tracker = ExecutionCheckpoint(checkpoint, source_hash)
+                    done = self._resume_records(tracker, resume)
+                
+                self._plan_gather((command for index, (command, reuse) in enumerate(zip(commands, plan))
+                                   if reuse is None and index >= len(done)), commands)
+                
+                outputs = [None] * len(commands)
+                runnable = []
+                for index, (command, reuse) in enumerate(zip(commands, plan)):
+                    if index < len(done) and done[index]["line"] == command.line:
+                        outputs[index] = done[index]["result"]
+                        results["resumed"] += 1
+                    elif reuse is not None:
+                        outputs[index] = dict(previous[1][reuse], line=command.line)
+                        results["reused"] += 1
+                    else:
+                        runnable.append(index)
+                
+                recorded = results["resumed"]
                 
-                self.logger.info(f"Processing line {line_num}: {line}")
+                def finished(index, result):
+                    nonlocal recorded
+                    if index is not None:
+                        outputs[index] = result
+                        results["executed"] += 1
+                    # Checkpoint in scroll order so a resume can trust the recorded prefix
+                    while tracker and recorded < len(outputs) and outputs[recorded] is not None:
+                        tracker.record(commands[recorded].line, outputs[recorded], _completed(outputs[recorded]))
+                        recorded += 1
                 
-                if line.startswith("Anoint:"):
-                    result = self._handle_anoint(line, line_num)
-                    results["output"].append(result)
-                    
-                elif line.startswith("Build:"):
-                    result = self._handle_build(line, line_num)
-                    results["output"].append(result)
-                    if result.get("file_created"):
-                        results["files_created"].append(result["file_created"])
-                    
-                elif line.startswith("Gather:"):
-                    result = self._handle_gather(line, line_num)
-                    results["output"].append(result)
-                    if result.get("packages_installed"):
-                        results["packages_installed"].extend(result["packages_installed"])
-                    
-                elif line.startswith("Deploy:"):
-                    result = self._handle_deploy(line, line_num)
-                    results["output"].append(result)
-                    
-                else:
-                    result = self._handle_unknown(line, line_num)
-                    results["output"].append(result)
-                    results["errors"].append(f"Unknown command on line {line_num}")
+                try:
+                    finished(None, None)
+                    if parallel:
+                        self._run_parallel(commands, runnable, finished, max_workers)
+                    else:
+                        for index in runnable:
+                            finished(index, self._run_command(commands[index]))
+                finally:
+                    for result in outputs:
+                        if result is not None:
+                            self._collect_result(results, result)
+                
+                self.last_runs[scroll_id] = (commands, results["output"])
+                if tracker:
+                    tracker.finish()
         
         except Exception as e:
             self.logger.error(f"❌ Scroll execution failed: {str(e)}")
@@ -89,16 +248,201 @@ class ScrollExecutionEngine:
             results["errors"].append(str(e))
         
         finally:
+            if tracker:
+                tracker.close()
             end_time = datetime.now()
             results["execution_time"] = (end_time - start_time).total_seconds()
+            self._finish_manifest(results)
+            self._finish_trace(results, tracer, trace)
             self.logger.info(f"🔥 Scroll execution completed in {results['execution_time']:.2f}s")
         
         return results
     
-    def _handle_anoint(self, line: str, line_num: int) -> Dict:
+    def execute_scroll_file(self, file_path: str, user_id: int = None, checkpoint: str = None,
+                            resume: bool = False, trace: str = None) -> Dict:
+        """
+        Execute a scroll file with a checkpoint after every command.
+
+        The file is read through a memory-mapped LineIndex, so resume=True
+        jumps straight past the lines an interrupted run already completed
+        instead of re-reading and re-parsing them.
+
+        Args:
+            file_path (str): Scroll file to execute
+            user_id (int): User the execution is logged for
+            checkpoint (str): Checkpoint file (defaults to "<file_path>.checkpoint")
+            resume (bool): Continue after the last completed command of an earlier run
+            trace (str): Optional path for a Chrome trace JSON of the run
+        """
+        self.logger.info(f"🔥 Starting scroll file execution of {file_path} for user {user_id}")
+        
+        results = self._new_results()
+        start_time = datetime.now()
+        tracker = None
+        tracer = self.last_trace = Tracer(f"scroll {file_path}")
+        self.manifest.reset_counts()
+        
+        try:
+            with tracer.activate(), tracer.span("execute_scroll_file", "scroll", path=file_path), \
+                    LineIndex(file_path) as index:
+                tracker = ExecutionCheckpoint(checkpoint or f"{file_path}.checkpoint", index.sha256())
+                done = self._resume_records(tracker, resume)
+                for record in done:
+                    self._collect_result(results, record["result"])
+                results["resumed"] = len(done)
+                
+                start_line = done[-1]["line"] + 1 if done else 1
+                self._plan_gather((parse_line(text, line_num) for line_num, text in index.iter_lines(start_line)),
+                                  (parse_line(text, line_num) for line_num, text in index.iter_lines(1)))
+                for line_num, text in index.iter_lines(start_line):
+                    command = parse_line(text, line_num)
+                    if command is not None:
+                        result = self._run_command(command)
+                        results["executed"] += 1
+                        tracker.record(command.line, result, _completed(result))
+                        self._collect_result(results, result)
+            
+            tracker.finish()
+        
+        except Exception as e:
+            self.logger.error(f"❌ Scroll execution failed: {str(e)}")
+            results["success"] = False
+            results["errors"].append(str(e))
+        
+        finally:
+            if tracker:
+                tracker.close()
+            end_time = datetime.now()
+            results["execution_time"] = (end_time - start_time).total_seconds()
+            self._finish_manifest(results)
+            self._finish_trace(results, tracer, trace)
+            self.logger.info(f"🔥 Scroll execution completed in {results['execution_time']:.2f}s")
+        
+        return results
+    
+    def _new_results(self) -> Dict:
+        """Empty results for a scroll execution"""
+        return {
+            "success": True,
+            "output": [],
+            "errors": [],
+            "files_created": [],
+            "packages_installed": [],
+            "execution_time": None,
+            "executed": 0,
+            "reused": 0,
+            "resumed": 0,
+            "files_written": 0,
+            "files_skipped": 0,
+            "step_times": []
+        }
+    
+    def _finish_manifest(self, results: Dict):
+        """Save the build manifest and report how many generated files changed"""
+        try:
+            self.manifest.save()
+        except OSError as e:
+            self.logger.error(f"❌ Could not save build manifest: {str(e)}")
+        counts = self.manifest.counts()
+        results["files_written"] = counts["written"]
+        results["files_skipped"] = counts["skipped"]
+    
+    def _finish_trace(self, results: Dict, tracer: Tracer, trace: Optional[str]):
+        """Report step timings and export the trace if asked to"""
+        results["step_times"] = [
+            {"line": args["line"], "step": name, "seconds": round(seconds, 6)}
+            for name, seconds, args in tracer.durations("step")
+        ]
+        if trace:
+            try:
+                tracer.export(trace)
+                self.logger.info(f"⏱️ Trace written to {trace}")
+            except OSError as e:
+                self.logger.error(f"❌ Could not write trace {trace}: {str(e)}")
+    
+    def _resume_records(self, tracker: ExecutionCheckpoint, resume: bool) -> List[Dict]:
+        """Start a checkpoint, returning the completed records to reuse when resuming"""
+        done = tracker.completed() if resume else []
+        if done:
+            self.logger.info(f"⏩ Resuming after line {done[-1]['line']} ({len(done)} commands completed)")
+        tracker.start(done)
+        return done
+    
+    def _run_command(self, command) -> Dict:
+        """Execute one command"""
+        self.logger.info(f"Processing line {command.line}: {command.text}")
+        return self._execute_command(command)
+    
+    def _run_parallel(self, commands: List, runnable: List[int], finished, max_workers: int):
+        """Run steps on a thread pool, starting each once the steps it depends on have finished"""
+        import contextvars
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+        
+        pending = set(runnable)
+        graph = step_dependencies(commands)
+        waiting = {index: graph[index] & pending for index in runnable}
+        dependents = {index: [] for index in runnable}
+        for index, deps in waiting.items():
+            for dep in deps:
+                dependents[dep].append(index)
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="scroll-step") as pool:
+            running = {}
+            
+            def start(indices):
+                for index in indices:
+                    # Each step gets a copy of the context so its spans reach the active tracer
+                    context = contextvars.copy_context()
+                    running[pool.submit(context.run, self._run_command, commands[index])] = index
+            
+            start([index for index in runnable if not waiting[index]])
+            while running:
+                completed, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    index = running.pop(future)
+                    finished(index, future.result())
+                    ready = []
+                    for dependent in dependents[index]:
+                        waiting[dependent].discard(index)
+                        if not waiting[dependent]:
+                            ready.append(dependent)
+                    start(ready)
+    
+    def _execute_command(self, command) -> Dict:
+        """Dispatch a single scroll command to its handler"""
+        with span(command.verb, "step", line=command.line, text=command.text):
+            return self._dispatch_command(command)
+    
+    def _dispatch_command(self, command) -> Dict:
+        """Call the handler for a command's verb"""
+        if command.verb == "Anoint":
+            return self._handle_anoint(command)
+        elif command.verb == "Build":
+            return self._handle_build(command)
+        elif command.verb == "Gather":
+            return self._handle_gather(command)
+        elif command.verb == "Deploy":
+            return self._handle_deploy(command)
+        return self._handle_unknown(command)
+    
+    def _collect_result(self, results: Dict, result: Dict):
+        """Add a command result to the scroll results"""
+        results["output"].append(result)
+        if result.get("file_created"):
+            results["files_created"].append(result["file_created"])
+        if result.get("packages_installed"):
+            results["packages_installed"].extend(result["packages_installed"])
+        if result.get("type") == "unknown":
+            results["errors"].append(f"Unknown command on line {result['line']}")
+    
+    def forget(self, scroll_id: str = "default"):
+        """Drop the remembered run so the next incremental execution runs everything"""
+        self.last_runs.pop(scroll_id, None)
+    
+    def _handle_anoint(self, command) -> Dict:
         """Handle Anoint command - create project structure"""
         try:
-            project_name = line.split(":", 1)[1].strip()
+            project_name = command.args
             project_path = self.base_path / project_name
             
             if project_path.exists():
@@ -106,7 +450,7 @@ class ScrollExecutionEngine:
                     "type": "anoint",
                     "status": "warning",
                     "message": f"Project {project_name} already exists",
-                    "line": line_num
+                    "line": command.line
                 }
             
             # Create project structure
@@ -127,7 +471,7 @@ class ScrollExecutionEngine:
                 "status": "success",
                 "message": f"🔥 Anointed: {project_name}",
                 "project_name": project_name,
-                "line": line_num
+                "line": command.line
             }
         
         except Exception as e:
@@ -136,13 +480,13 @@ class ScrollExecutionEngine:
                 "type": "anoint",
                 "status": "error",
                 "message": f"Anoint failed: {str(e)}",
-                "line": line_num
+                "line": command.line
             }
     
-    def _handle_build(self, line: str, line_num: int) -> Dict:
+    def _handle_build(self, command) -> Dict:
         """Handle Build command - create files"""
         try:
-            file_path = line.split(":", 1)[1].strip()
+            file_path = command.args
             full_path = self.base_path / file_path
             
             # Create directory if needed
@@ -159,7 +503,7 @@ class ScrollExecutionEngine:
                 "status": "success",
                 "message": f"📝 Building: {file_path}",
                 "file_created": file_path,
-                "line": line_num
+                "line": command.line
             }
         
         except Exception as e:
@@ -168,63 +512,72 @@ class ScrollExecutionEngine:
                 "type": "build",
                 "status": "error",
                 "message": f"Build failed: {str(e)}",
-                "line": line_num
+                "line": command.line
             }
     
-    def _handle_gather(self, line: str, line_num: int) -> Dict:
+    def _plan_gather(self, commands, scroll_commands):
+        """
+        Collect the Gather commands about to run so pip resolves them all in one
+        invocation, and every package of the scroll for requirements.txt
+        """
+        self._gather_packages = {c.line: c.args.split() for c in commands if c is not None and c.verb == "Gather"}
+        self._gather_results = None
+        self._requirements = []
+        self._add_requirements(pkg for c in scroll_commands if c is not None and c.verb == "Gather"
+                               for pkg in c.args.split())
+    
+    def _add_requirements(self, packages):
+        """Append packages to the requirements list, skipping ones already listed"""
+        listed = {normalize_requirement(pkg) for pkg in self._requirements}
+        for pkg in packages:
+            if normalize_requirement(pkg) not in listed:
+                listed.add(normalize_requirement(pkg))
+                self._requirements.append(pkg)
+    
+    def _handle_gather(self, command) -> Dict:
         """Handle Gather command - install packages"""
         try:
-            packages = line.split(":", 1)[1].strip()
+            packages = command.args
             package_list = [pkg.strip() for pkg in packages.split()]
             
-            # Update requirements.txt
-            requirements_path = self.base_path / "requirements.txt"
-            if requirements_path.exists():
-                with open(requirements_path, "a") as f:
-                    f.write(f"\n# Added by scroll execution\n")
-                    for pkg in package_list:
-                        f.write(f"{pkg}\n")
-            else:
-                with open(requirements_path, "w") as f:
-                    f.write("# Project dependencies\n")
-                    for pkg in package_list:
-                        f.write(f"{pkg}\n")
+            # requirements.txt lists the whole scroll's packages, so an unchanged set is not rewritten
+            self._add_requirements(package_list)
+            self._create_file(self.base_path / "requirements.txt",
+                              "# Project dependencies\n" + "".join(f"{pkg}\n" for pkg in self._requirements))
             
-            # Install packages
-            try:
-                result = subprocess.run(
-                    [sys.executable, "-m", "pip", "install"] + package_list,
-                    capture_output=True,
-                    text=True,
-                    timeout=300
-                )
-                
-                if result.returncode == 0:
-                    self.logger.info(f"✅ Gathered packages: {packages}")
-                    return {
-                        "type": "gather",
-                        "status": "success",
-                        "message": f"📦 Gathering: {packages}",
-                        "packages_installed": package_list,
-                        "line": line_num
-                    }
-                else:
-                    self.logger.warning(f"⚠️ Package installation had issues: {result.stderr}")
-                    return {
-                        "type": "gather",
-                        "status": "warning",
-                        "message": f"📦 Gathering: {packages} (with warnings)",
-                        "packages_installed": package_list,
-                        "line": line_num
-                    }
+            # The first Gather of a scroll installs every planned Gather line in one pip run
+            if self._gather_packages.get(command.line) != package_list:
+                self._gather_packages = {command.line: package_list}
+                self._gather_results = None
+            if self._gather_results is None:
+                planned = [pkg for pkgs in self._gather_packages.values() for pkg in pkgs]
+                self._gather_results = install_requirements(planned, timeout=300, logger=self.logger,
+                                                            mode=self.gather_mode, wheelhouse=self.wheelhouse)
             
-            except subprocess.TimeoutExpired:
+            package_results = {pkg: self._gather_results.get(normalize_requirement(pkg), False) for pkg in package_list}
+            installed = [pkg for pkg, ok in package_results.items() if ok]
+            
+            if len(installed) == len(package_list):
+                self.logger.info(f"✅ Gathered packages: {packages}")
                 return {
                     "type": "gather",
-                    "status": "error",
-                    "message": f"Package installation timed out",
-                    "line": line_num
+                    "status": "success",
+                    "message": f"📦 Gathering: {packages}",
+                    "packages_installed": package_list,
+                    "package_results": package_results,
+                    "line": command.line
                 }
+            
+            failed = [pkg for pkg, ok in package_results.items() if not ok]
+            self.logger.warning(f"⚠️ Package installation had issues: {' '.join(failed)}")
+            return {
+                "type": "gather",
+                "status": "warning",
+                "message": f"📦 Gathering: {packages} (with warnings)",
+                "packages_installed": installed,
+                "package_results": package_results,
+                "line": command.line
+            }
         
         except Exception as e:
             self.logger.error(f"❌ Gather failed: {str(e)}")
@@ -232,13 +585,13 @@ class ScrollExecutionEngine:
                 "type": "gather",
                 "status": "error",
                 "message": f"Gather failed: {str(e)}",
-                "line": line_num
+                "line": command.line
             }
     
-    def _handle_deploy(self, line: str, line_num: int) -> Dict:
+    def _handle_deploy(self, command) -> Dict:
         """Handle Deploy command - deployment logic"""
         try:
-            deployment_target = line.split(":", 1)[1].strip()
+            deployment_target = command.args
             
             # Simple deployment simulation
             self.logger.info(f"🚀 Deploying to: {deployment_target}")
@@ -248,7 +601,7 @@ class ScrollExecutionEngine:
                 "status": "success",
                 "message": f"🚀 Deploying to: {deployment_target}",
                 "deployment_target": deployment_target,
-                "line": line_num
+                "line": command.line
             }
         
         except Exception as e:
@@ -257,22 +610,21 @@ class ScrollExecutionEngine:
                 "type": "deploy",
                 "status": "error",
                 "message": f"Deploy failed: {str(e)}",
-                "line": line_num
+                "line": command.line
             }
     
-    def _handle_unknown(self, line: str, line_num: int) -> Dict:
+    def _handle_unknown(self, command) -> Dict:
         """Handle unknown commands"""
         return {
             "type": "unknown",
             "status": "error",
-            "message": f"❓ Unknown command: {line}",
-            "line": line_num
+            "message": f"❓ Unknown command: {command.text}",
+            "line": command.line
         }
     
-    def _create_file(self, file_path: Path, content: str):
-        """Create a file with content"""
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+    def _create_file(self, file_path: Path, content: str) -> bool:
+        """Create a file with content, skipping the write if it is unchanged"""
+        return self.manifest.write(file_path, content)
     
     def _get_file_template(self, file_path: str) -> str:
         """Get template content based on file type"""